@@ -0,0 +1,51 @@
+"""
+Import-time benchmark of `wild_devs_api`, as paid by every cold start of a CLI or serverless invocation.
+
+Run with `python benchmarks/import_time.py [runs]`. Every measurement runs in a fresh interpreter.
+`eager transports` imports `requests` and `aiohttp` first, which is what importing the package cost
+before the transports were imported lazily.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "wild_devs_api": "import wild_devs_api",
+    "eager transports": "import requests, aiohttp, wild_devs_api",
+    "WildDevsAPI()": "import wild_devs_api; wild_devs_api.WildDevsAPI()",
+}
+
+HEAVY_MODULES = ("requests", "urllib3", "aiohttp", "sqlite3")
+
+
+def measure(code: str) -> float:
+    """Returns the wall time of `code` in milliseconds, measured inside a fresh interpreter."""
+    script = f"import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output) * 1000
+
+
+def loaded_modules() -> list[str]:
+    script = f"import sys, wild_devs_api; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return output.split()
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    measure(CASES["eager transports"])
+    for name, code in CASES.items():
+        times = [measure(code) for _ in range(runs)]
+        print(f"{name:20}median {statistics.median(times):7.1f} ms   min {min(times):7.1f} ms")
+    print(f"heavy modules loaded by `import wild_devs_api`: {loaded_modules() or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
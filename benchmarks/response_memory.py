@@ -0,0 +1,124 @@
+"""
+Memory benchmark of `APIResponse` against the dataclass based response type it replaced.
+
+Run with `python benchmarks/response_memory.py [count]`. Prints the bytes allocated per response,
+excluding the decoded bodies and raw headers, which both types share. The baseline parses every header eagerly,
+as its `ResponseHeaders` did.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime
+
+from wild_devs_api.models.response import APIResponse
+
+
+class LegacyResponseHeaders:
+    """The baseline response headers: every header is parsed when the response is built."""
+
+    def __init__(self, headers: t.Mapping[str, t.Any]) -> None:
+        self._server = headers["Server"]
+        self._date = datetime.strptime(headers["Date"], "%a, %d %b %Y %H:%M:%S %Z")
+        self._content_type = headers["Content-Type"]
+        self._content_length = int(headers["Content-Length"])
+        self._connection = headers["Connection"]
+        self._x_powered_by = headers["X-Powered-By"]
+        self._access_control_allow_origin = headers["Access-Control-Allow-Origin"]
+        self._access_control_allow_headers = headers["Access-Control-Allow-Headers"]
+        self._x_ratelimit_retry_after = float(headers["x-ratelimit-retry-after"])
+        self._x_ratelimit_limit = int(headers["x-ratelimit-limit"])
+        self._x_ratelimit_remaining = int(headers["x-ratelimit-remaining"])
+        self._x_ratelimit_reset = datetime.strptime(
+            headers["x-ratelimit-reset"], "%a %b %d %Y %H:%M:%S %Z%z"
+        )
+        self._etag = headers["ETag"]
+        self._vary = headers["Vary"]
+        self._strict_transport_security = headers["Strict-Transport-Security"]
+        self._referrer_policy = headers["Referrer-Policy"]
+        self._x_content_type_options = headers["X-Content-Type-Options"]
+        self._x_download_options = headers["X-Download-Options"]
+        self._x_frame_options = headers["X-Frame-Options"]
+        self._x_permitted_cross_domain_policies = headers["X-Permitted-Cross-Domain-Policies"]
+        self._x_robots_tag = headers["X-Robots-Tag"]
+        self._x_xss_protection = headers["X-XSS-Protection"]
+        self._as_dict = headers
+
+
+@dataclass
+class LegacyAPIResponse:
+    """The baseline response type: a dataclass copying every field and building `as_dict` eagerly."""
+
+    _status: str
+    _code: int
+    _message: str
+    _data: t.Any
+    _headers: LegacyResponseHeaders
+    _as_dict: t.Any
+    _xml: t.Any
+
+    def __init__(self, data: dict[str, t.Any], *, headers: t.Any = None, xml: t.Any) -> None:
+        self._status = data["status"]
+        self._code = data["code"]
+        self._message = data["message"]
+        self._data = data["data"]
+        self._xml = xml
+        if headers:
+            self._as_dict = {"Response": data, "Headers": headers}
+            self._headers = LegacyResponseHeaders(headers)
+        else:
+            self._as_dict = data
+
+
+def measure(cls: type, count: int, headers: t.Optional[dict[str, str]]) -> float:
+    bodies = [
+        {"status": "success", "code": 200, "message": "ok", "data": {"value": i}}
+        for i in range(count)
+    ]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    responses = [cls(body, headers=headers, xml="") for body in bodies]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del responses
+    return allocated / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    headers = {
+        "Server": "nginx",
+        "Date": "Mon, 05 Oct 2026 12:00:00 GMT",
+        "Content-Type": "application/json; charset=utf-8",
+        "Content-Length": "64",
+        "Connection": "keep-alive",
+        "X-Powered-By": "Express",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "*",
+        "x-ratelimit-retry-after": "3600",
+        "x-ratelimit-limit": "100",
+        "x-ratelimit-remaining": "99",
+        "x-ratelimit-reset": "Tue Oct 06 2026 00:00:00 GMT+0000",
+        "ETag": 'W/"40-abc"',
+        "Vary": "Accept-Encoding",
+        "Strict-Transport-Security": "max-age=15552000; includeSubDomains",
+        "Referrer-Policy": "no-referrer",
+        "X-Content-Type-Options": "nosniff",
+        "X-Download-Options": "noopen",
+        "X-Frame-Options": "SAMEORIGIN",
+        "X-Permitted-Cross-Domain-Policies": "none",
+        "X-Robots-Tag": "none",
+        "X-XSS-Protection": "0",
+    }
+    print(f"{'':24}{'legacy':>10}{'slotted':>10}  (bytes per response, {count} responses)")
+    for name, value in (("without headers", None), ("with headers", headers)):
+        legacy = measure(LegacyAPIResponse, count, value)
+        slotted = measure(APIResponse, count, value)
+        print(f"{name:24}{legacy:>10.0f}{slotted:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ setup(
     long_description=long_description,
     packages=find_packages(),
     install_requires=['requests', 'aiohttp'],
+    extras_require={'compression': ['brotli', 'zstandard'], 'speedups': ['orjson']},
     classifiers=[
         "Development Status :: 1 - Planning",
         "Intended Audience :: Developers",
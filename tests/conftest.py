@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+
+@pytest.fixture
+def serve():
+    """Starts an aiohttp server for a handler in a background thread and returns its base url."""
+    servers = []
+
+    def start(handler):
+        ready = threading.Event()
+        server = {}
+
+        def run():
+            loop = asyncio.new_event_loop()
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", handler)
+            runner = web.AppRunner(app)
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            loop.run_until_complete(site.start())
+            server["port"] = site._server.sockets[0].getsockname()[1]
+            servers.append((loop, runner))
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait()
+        return f"http://127.0.0.1:{server['port']}/"
+
+    yield start
+    for loop, runner in servers:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
@@ -0,0 +1,39 @@
+import asyncio
+import json
+
+from wild_devs_api import RESTClient
+from wild_devs_api.restclient import _DECODE_SLICE_SIZE
+
+
+def _body_with_number_across_last_slice():
+    head = b'{"status":"success","code":200,"message":"ok","data":['
+    record = b'{"value":12345},'
+    count = (1_100_000 - len(head)) // len(record)
+    prefix = head + record * count
+    boundary = (len(prefix) // _DECODE_SLICE_SIZE + 1) * _DECODE_SLICE_SIZE
+    # Pads the array, so that the last number is cut between "1." and "5" by the last slice.
+    prefix += b"0," * ((boundary - len(prefix) - 2) // 2)
+    if (boundary - len(prefix)) % 2:
+        prefix += b" "
+    body = prefix + b"1.5]}"
+    assert body[boundary - 2 : boundary] == b"1." and len(body) < boundary + _DECODE_SLICE_SIZE
+    return body
+
+
+def test_sliced_decode_of_a_number_across_slices():
+    body = _body_with_number_across_last_slice()
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    decoded = asyncio.run(rest._async_decode(body))
+    assert decoded == json.loads(body)
+    assert decoded["data"][-1] == 1.5
+
+
+def test_sliced_decode_falls_back_when_the_parser_can_not_complete(monkeypatch):
+    body = _body_with_number_across_last_slice()
+
+    def close(self):
+        raise ValueError("The response body ended before the JSON document was complete.")
+
+    monkeypatch.setattr("wild_devs_api.restclient.DataStreamParser.close", close)
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    assert asyncio.run(rest._async_decode(body)) == json.loads(body)
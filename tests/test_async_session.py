@@ -0,0 +1,53 @@
+import asyncio
+import gc
+import time
+import warnings
+
+from aiohttp import web
+
+from wild_devs_api import RESTClient
+
+
+async def handler(request):
+    return web.json_response({"status": "success", "code": 200, "message": "ok", "data": 1})
+
+
+def test_session_is_closed_when_its_event_loop_shuts_down(serve):
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    rest._base_url = serve(handler)
+    sessions = []
+
+    async def main():
+        response = await rest.async_get("domains")
+        sessions.append(rest.async_session)
+        return response.data
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert asyncio.run(main()) == 1
+        assert asyncio.run(main()) == 1
+        gc.collect()
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_async_close_does_not_block_the_event_loop():
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def main():
+        rest.executor.submit(time.sleep, 0.3)
+        task = asyncio.ensure_future(ticker())
+        await rest.async_close()
+        task.cancel()
+
+    asyncio.run(main())
+    assert ticks >= 10
+    assert rest._executor is None
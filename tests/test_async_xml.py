@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from wild_devs_api import RESTClient
+
+XML_DELAY = 0.5
+TICK = 0.01
+
+
+async def handler(request):
+    if "xml" in request.query:
+        await asyncio.sleep(XML_DELAY)
+        return web.Response(
+            text="<response><status>success</status><code>200</code><message>ok</message><data>1</data></response>",
+            content_type="application/xml",
+        )
+    return web.json_response({"status": "success", "code": 200, "message": "ok", "data": 1})
+
+
+@pytest.mark.parametrize("xml_mode", ["concurrent", "single", "lazy"])
+def test_other_tasks_run_during_xml_fetch(xml_mode):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        rest = RESTClient("https://api.wild-devs.net/v1/", 10, {}, xml_mode=xml_mode)
+        rest._base_url = f"http://127.0.0.1:{port}/"
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(TICK)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        try:
+            response = await rest.async_get("domains", xml=True)
+            xml = response.xml if xml_mode != "lazy" else await response.xml
+        finally:
+            task.cancel()
+            await rest.async_close()
+            await runner.cleanup()
+        return xml, ticks
+
+    xml, ticks = asyncio.run(main())
+    assert xml.startswith("<response>")
+    assert ticks >= XML_DELAY / TICK / 2
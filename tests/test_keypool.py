@@ -0,0 +1,13 @@
+from wild_devs_api import APIKeyPool
+
+
+def test_removed_key_can_be_added_again():
+    pool = APIKeyPool([("WD-a", "s"), ("WD-b", "s")])
+    limiter = pool.limiters["WD-a"]
+    pool.remove("WD-a")
+    assert pool.keys == ["WD-b"]
+    pool.add("WD-a", "s")
+    assert pool.keys == ["WD-b", "WD-a"]
+    assert pool.limiters["WD-a"] is limiter
+    pool.add("WD-a", "s")
+    assert len(pool) == 2
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from wild_devs_api.models.lazy_xml import AsyncLazyXML
+
+
+def test_str_of_async_lazy_xml_requires_await():
+    async def fetch():
+        return "<response/>"
+
+    async def main():
+        xml = AsyncLazyXML(fetch)
+        with pytest.raises(RuntimeError):
+            str(xml)
+        assert await xml == "<response/>"
+        return str(xml)
+
+    assert asyncio.run(main()) == "<response/>"
+
+
+def test_str_of_failed_async_lazy_xml_raises_the_error():
+    async def fetch():
+        raise ValueError("unavailable")
+
+    async def main():
+        xml = AsyncLazyXML(fetch)
+        with pytest.raises(ValueError):
+            await xml
+        with pytest.raises(ValueError):
+            str(xml)
+
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+import asyncio
+import fnmatch
+import threading
+import time
+
+from aiohttp import web
+
+from wild_devs_api import RESTClient, RedisCacheBackend, ResponseCache
+from wild_devs_api.cache.entry import CacheEntry
+
+
+class FakeRedis:
+    """In-process stand-in for a `redis.Redis` client, shared by several backends like one server."""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+        self.threads = set()
+
+    def _alive(self, key):
+        if isinstance(key, bytes):
+            key = key.decode("utf-8")
+        value = self.data.get(key)
+        if value is not None and value[1] is not None and value[1] < time.time():
+            del self.data[key]
+            return None
+        return value
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        with self.lock:
+            value = self._alive(key)
+            return None if value is None else value[0]
+
+    def set(self, key, value, px=None, nx=False):
+        self.threads.add(threading.get_ident())
+        with self.lock:
+            if nx and self._alive(key):
+                return None
+            if isinstance(value, str):
+                value = value.encode("utf-8")
+            self.data[key] = (value, time.time() + px / 1000 if px else None)
+            return True
+
+    def delete(self, *keys):
+        with self.lock:
+            return sum(
+                1
+                for key in keys
+                if self.data.pop(key.decode("utf-8") if isinstance(key, bytes) else key, None)
+                is not None
+            )
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+    def eval(self, script, numkeys, *args):
+        # Only the compare-and-delete script of RedisCacheBackend.release_lock is emulated.
+        assert "redis.call(\"del\"" in script and numkeys == 1
+        key, token = args
+        with self.lock:
+            value = self._alive(key)
+            if value is not None and value[0] == token.encode("utf-8"):
+                del self.data[key]
+                return 1
+            return 0
+
+
+def _entry(endpoint="unit", ttl=60.0):
+    return CacheEntry(
+        endpoint=endpoint,
+        body={"status": "success", "code": 200, "message": "ok", "data": 1},
+        headers={"ETag": '"abc"'},
+        xml=None,
+        expires_at=time.time() + ttl,
+        etag='"abc"',
+    )
+
+
+def test_entries_are_shared_between_nodes():
+    client = FakeRedis()
+    first, second = RedisCacheBackend(client), RedisCacheBackend(client)
+    first.set("POST unit {}", _entry())
+    entry = second.get("POST unit {}")
+    assert entry is not None
+    assert (entry.endpoint, entry.body, entry.etag) == ("unit", _entry().body, '"abc"')
+    assert len(second) == 1
+    first.set("POST currency {}", _entry("currency"))
+    assert second.invalidate("unit") == 1
+    assert second.get("POST unit {}") is None
+    assert first.get("POST currency {}") is not None
+    first.delete("POST currency {}")
+    assert len(first) == 0
+
+
+def test_release_lock_keeps_the_lock_of_another_node():
+    client = FakeRedis()
+    first, second = RedisCacheBackend(client), RedisCacheBackend(client)
+    assert first.acquire_lock("key", 0.05)
+    assert not second.acquire_lock("key", 0.05)
+    time.sleep(0.1)
+    assert second.acquire_lock("key", 30)
+    first.release_lock("key")
+    assert not first.acquire_lock("key", 30)
+    second.release_lock("key")
+    assert first.acquire_lock("key", 30)
+
+
+def test_async_requests_call_the_backend_off_the_event_loop():
+    client = FakeRedis()
+    hits = []
+
+    async def handler(request):
+        hits.append(request.path)
+        return web.json_response(
+            {"status": "success", "code": 200, "message": "ok", "data": 1},
+            headers={"ETag": '"abc"'},
+        )
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        rest = RESTClient(
+            "https://api.wild-devs.net/v1/",
+            10,
+            {},
+            cache=ResponseCache(ttls={"domains": 60}, backend=RedisCacheBackend(client)),
+        )
+        rest._base_url = f"http://127.0.0.1:{port}/"
+        try:
+            first = await rest.async_get("domains")
+            second = await rest.async_get("domains")
+        finally:
+            await rest.async_close()
+            await runner.cleanup()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first.data == second.data == 1
+    assert hits == ["/domains"]
+    assert client.threads and threading.get_ident() not in client.threads
@@ -0,0 +1,26 @@
+import pickle
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from wild_devs_api.models.ratelimit_info import RateLimitInfo
+from wild_devs_api.models.response import APIResponse
+
+BODY = {"status": "success", "code": 200, "message": "ok", "data": {"value": 1}}
+
+
+def test_pickle_keeps_aiohttp_headers():
+    headers = CIMultiDictProxy(
+        CIMultiDict({"Content-Type": "application/json", "X-RateLimit-Limit": "100"})
+    )
+    response = APIResponse(BODY, headers=headers, xml="")
+    restored = pickle.loads(pickle.dumps(response))
+    assert restored.as_dict == {"Response": BODY, "Headers": dict(headers)}
+    assert restored.headers.x_ratelimit_limit == 100
+    assert restored.ratelimit == RateLimitInfo(limit=100)
+
+
+def test_pickle_without_headers():
+    response = APIResponse(BODY, xml="<response/>")
+    restored = pickle.loads(pickle.dumps(response))
+    assert restored == response
+    assert restored.headers is None
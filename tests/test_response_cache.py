@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from wild_devs_api import APIResponse, RESTClient, ResponseCache, strip_payload, uppercase_fields
+from wild_devs_api.cache.entry import CacheEntry
+
+VOICES = ["alloy", "echo"]
+
+
+def _client(base_url):
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {}, cache=ResponseCache())
+    rest._base_url = base_url
+    return rest
+
+
+async def voices(request):
+    return web.json_response(
+        {"status": "success", "code": 200, "message": "ok", "data": list(VOICES)},
+        headers={"ETag": '"v1"'},
+    )
+
+
+def test_mutating_a_response_does_not_change_the_cache(serve):
+    rest = _client(serve(voices))
+    first = rest.get("tts/voices", return_headers=True)
+    first.data.clear()
+    first.as_dict["Headers"].clear()
+    hit = rest.get("tts/voices", return_headers=True)
+    assert hit.data == VOICES
+    hit.data.append("fable")
+    assert rest.get("tts/voices").data == VOICES
+    assert rest.get("tts/voices", return_headers=True).as_dict["Headers"]["ETag"] == '"v1"'
+    rest.close()
+
+
+def test_mutating_an_async_response_does_not_change_the_cache(serve):
+    rest = _client(serve(voices))
+
+    async def main():
+        try:
+            (await rest.async_get("tts/voices")).data.clear()
+            return (await rest.async_get("tts/voices")).data
+        finally:
+            await rest.async_close()
+
+    assert asyncio.run(main()) == VOICES
+
+
+def test_revalidate_keeps_the_headers_of_earlier_responses():
+    cache = ResponseCache()
+    headers = {"ETag": '"v1"', "Date": "Mon", "Content-Length": "42"}
+    entry = CacheEntry(
+        endpoint="tts/voices",
+        body={"status": "success", "code": 200, "message": "ok", "data": VOICES},
+        headers=headers,
+        xml=None,
+        expires_at=time.time() - 1,
+        etag='"v1"',
+    )
+    response = APIResponse(entry.body, headers=entry.headers, xml="")
+    revalidated = cache.revalidate("key", entry, {"Date": "Tue", "Content-Length": "0"}, 60)
+    assert entry.headers == {"ETag": '"v1"', "Date": "Mon", "Content-Length": "42"}
+    assert response.as_dict["Headers"]["Date"] == "Mon"
+    assert revalidated.headers == {"ETag": '"v1"', "Date": "Tue", "Content-Length": "42"}
+    assert cache.get_stale("key") is revalidated and cache.is_fresh(revalidated)
+
+
+def test_waiting_callers_fetch_side_by_side_after_the_leader_fails(serve):
+    delay = 0.3
+    requests = []
+
+    async def failing(request):
+        requests.append(request.path)
+        await asyncio.sleep(delay)
+        return web.json_response(
+            {"status": "error", "code": 503, "message": "unavailable", "note": "down"}, status=503
+        )
+
+    rest = _client(serve(failing))
+
+    async def call():
+        try:
+            await rest.async_get("tts/voices")
+        except Exception as e:
+            return e
+
+    async def main():
+        try:
+            return await asyncio.gather(*(call() for _ in range(4)))
+        finally:
+            await rest.async_close()
+
+    started = time.monotonic()
+    errors = asyncio.run(main())
+    assert all(errors) and len(requests) == 4
+    assert time.monotonic() - started < 3 * delay
+
+
+def test_waiting_for_the_lock_is_bounded_by_the_timeout(serve):
+    rest = _client(serve(voices))
+    key = rest._cache_key("GET", "tts/voices", None, False)
+    assert rest.cache.backend.acquire_lock(key, 30)
+    started = time.monotonic()
+    assert rest.get("tts/voices", timeout=0.3).data == VOICES
+    assert time.monotonic() - started < 1
+    rest.close()
+
+
+def test_default_keys_keep_whitespace_and_case_sensitive_identifiers():
+    cache = ResponseCache()
+    assert cache.key("POST", "ip", {"ip": " 1.1.1.1"}, False) != cache.key("POST", "ip", {"ip": "1.1.1.1"}, False)
+    assert cache.key("POST", "isin", {"isin": "us0378331005"}, False) != cache.key(
+        "POST", "isin", {"isin": "US0378331005"}, False
+    )
+    assert cache.key("POST", "iban", {"address": "de89370400440532013000"}, False) == cache.key(
+        "POST", "iban", {"address": "DE89370400440532013000"}, False
+    )
+    assert cache.key("POST", "email", {"email": "a@Example.COM"}, False) == cache.key(
+        "POST", "email", {"email": "a@example.com"}, False
+    )
+
+
+def test_lossy_canonicalizers_are_opt_in():
+    cache = ResponseCache(canonicalizers={"isin": uppercase_fields("isin", strip=True), "ip": strip_payload})
+    assert cache.key("POST", "ip", {"ip": " 1.1.1.1"}, False) == cache.key("POST", "ip", {"ip": "1.1.1.1"}, False)
+    assert cache.key("POST", "isin", {"isin": " us0378331005"}, False) == cache.key(
+        "POST", "isin", {"isin": "US0378331005"}, False
+    )
@@ -0,0 +1,52 @@
+import os
+import time
+
+import pytest
+
+from wild_devs_api import SQLiteCacheBackend
+from wild_devs_api.cache.entry import CacheEntry
+
+
+def _entry(value, ttl=60.0):
+    return CacheEntry(
+        endpoint="unit",
+        body={"status": "success", "code": 200, "message": "ok", "data": value},
+        headers={},
+        xml=None,
+        expires_at=time.time() + ttl,
+        etag=None,
+    )
+
+
+def test_size_is_only_summed_when_it_may_exceed_max_bytes(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), max_bytes=10_000)
+    statements = []
+    backend._connection.set_trace_callback(statements.append)
+    for i in range(20):
+        backend.set(f"key {i}", _entry(i, ttl=i + 1))
+    assert not [s for s in statements if "SUM(size)" in s]
+    for i in range(20, 400):
+        backend.set(f"key {i}", _entry(i, ttl=i + 1))
+    assert backend.evictions > 0
+    assert backend._stored_size(backend._connection) <= backend.max_bytes
+    assert backend.get("key 0") is None
+    assert backend.get("key 399") is not None
+    backend.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_process_opens_its_own_connection(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+    backend.set("parent", _entry(1))
+    parent_connection = backend._connection
+    pid = os.fork()
+    if pid == 0:
+        ok = backend._connection is not parent_connection and backend.get("parent") is not None
+        backend.set("child", _entry(2))
+        backend.close()
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert backend._connection is parent_connection
+    assert backend.get("child").body["data"] == 2
+    backend.close()
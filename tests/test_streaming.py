@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from wild_devs_api import DataStreamParser
+
+BODY = json.dumps(
+    {
+        "status": "success",
+        "code": 200,
+        "message": "ok",
+        "data": [1.5, 2e3, -3, 4.25e-2, True, None, "x", {"a": [1, 2.5]}, 10],
+    }
+).encode("utf-8")
+
+
+def _parse(chunks):
+    parser = DataStreamParser()
+    records = []
+    for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return parser, records
+
+
+@pytest.mark.parametrize("body", [BODY, BODY.replace(b"[", b"[ ").replace(b", ", b" , ")])
+def test_body_split_at_every_offset(body):
+    expected = json.loads(body)
+    for offset in range(len(body) + 1):
+        parser, records = _parse([body[:offset], body[offset:]])
+        assert records == expected["data"], offset
+        assert parser.meta == {"status": "success", "code": 200, "message": "ok"}
+
+
+def test_body_fed_byte_by_byte():
+    parser, records = _parse([BODY[i : i + 1] for i in range(len(BODY))])
+    assert records == json.loads(BODY)["data"]
+    assert parser.done
+
+
+def test_truncated_body_raises():
+    with pytest.raises(ValueError):
+        _parse([BODY[:-5]])
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from wild_devs_api import NotFoundError, RESTClient
+
+XML_DELAY = 0.5
+
+
+async def missing(request):
+    if "xml" in request.query:
+        await asyncio.sleep(XML_DELAY)
+        raise web.HTTPInternalServerError()
+    raise web.HTTPNotFound()
+
+
+def test_not_found_does_not_wait_for_the_xml_representation(serve):
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    rest._base_url = serve(missing)
+    started = time.monotonic()
+    with pytest.raises(NotFoundError):
+        rest.get("missing", xml=True)
+    assert time.monotonic() - started < XML_DELAY
+    rest.close()
+
+
+def test_async_not_found_does_not_wait_for_the_xml_representation(serve):
+    rest = RESTClient("https://api.wild-devs.net/v1/", 10, {})
+    rest._base_url = serve(missing)
+
+    async def main():
+        try:
+            with pytest.raises(NotFoundError):
+                await rest.async_get("missing", xml=True)
+        finally:
+            await rest.async_close()
+
+    started = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - started < XML_DELAY
@@ -1,10 +1,54 @@
 __all__ = [
     "WildDevsAPI",
     "RESTClient",
+    "RetryPolicy",
+    "RateLimiter",
+    "SharedRateLimiter",
+    "APIKeyPool",
+    "encode_api_key",
+    "SingleFlight",
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "default_json_codec",
+    "DataStreamParser",
+    "ResponseCache",
+    "CacheEntry",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "RedisCacheBackend",
 ]
 
 from wild_devs_api.restclient import *
+from wild_devs_api.retry import *
+from wild_devs_api.ratelimit import *
+from wild_devs_api.keypool import *
+from wild_devs_api.singleflight import *
+from wild_devs_api.codec import *
+from wild_devs_api.streaming import *
 from wild_devs_api.api import *
 from wild_devs_api.__version__ import *
 from wild_devs_api.models import *
+from wild_devs_api.cache import (
+    CacheEntry,
+    CacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_CACHE_ERROR_TTLS,
+    DEFAULT_CACHE_CANONICALIZERS,
+    strip_payload,
+    uppercase_fields,
+)
 from wild_devs_api.errors import *
+
+
+def __getattr__(name: str) -> object:
+    """Imports `SQLiteCacheBackend` and `RedisCacheBackend` on first access."""
+    if name in ("SQLiteCacheBackend", "RedisCacheBackend"):
+        from wild_devs_api import cache
+
+        return getattr(cache, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,16 @@ __all__ = [
     "WildDevsAPI",
 ]
 
-import base64
+import concurrent.futures
 import typing as t
 
-import aiohttp
-
+from wild_devs_api.cache.response_cache import ResponseCache
+from wild_devs_api.codec import JSONCodec
+from wild_devs_api.keypool import APIKeyPool, encode_api_key
+from wild_devs_api.ratelimit import RateLimiter
 from wild_devs_api.restclient import RESTClient
+from wild_devs_api.retry import RetryPolicy
+from wild_devs_api.singleflight import SingleFlight
 from wild_devs_api.endpoints.conversion import Conversion
 from wild_devs_api.endpoints.games import Games
 from wild_devs_api.endpoints.mockup import Mockup
@@ -33,45 +37,105 @@ class WildDevsAPI:
     _x_api_key: str
     _headers: dict[str, t.Any]
     _rest: RESTClient
-    _conversion: Conversion
-    _games: Games
-    _mockup: Mockup
-    _random: Random
-    _urlshortener: UrlShortener
-    _utility: Utility
-    _validation: Validation
-    _ai: AI
-    _nettools: NetTools
-    _moviefinder: MovieFinder
-    _opendata: OpenData
+    _conversion: t.Optional[Conversion]
+    _games: t.Optional[Games]
+    _mockup: t.Optional[Mockup]
+    _random: t.Optional[Random]
+    _urlshortener: t.Optional[UrlShortener]
+    _utility: t.Optional[Utility]
+    _validation: t.Optional[Validation]
+    _ai: t.Optional[AI]
+    _nettools: t.Optional[NetTools]
+    _moviefinder: t.Optional[MovieFinder]
+    _opendata: t.Optional[OpenData]
 
     def __init__(
         self,
         *,
         base_url: str = "https://api.wild-devs.net/v1/",
-        timeout: int = 30,
+        timeout: float = 30,
+        connect_timeout: t.Optional[float] = None,
+        read_timeout: t.Optional[float] = None,
+        pool_size: int = 10,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        ttl_dns_cache: t.Optional[int] = 10,
+        xml_mode: str = "concurrent",
+        retry: t.Optional[RetryPolicy] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        key_pool: t.Optional[APIKeyPool] = None,
+        cache: t.Optional[ResponseCache] = None,
+        single_flight: t.Optional[SingleFlight] = None,
+        compression: bool = True,
+        compress_min_size: t.Optional[int] = None,
+        json_codec: t.Optional[JSONCodec] = None,
+        decode_offload_size: t.Optional[int] = 1024 * 1024,
+        decode_executor: t.Optional[concurrent.futures.Executor] = None,
     ) -> None:
         self._headers = {
             "User-Agent": f"Wild Devs API v{__version__} Python SDK",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        self._rest = RESTClient(base_url, timeout, self._headers)
-        self._conversion = Conversion(self._rest)
-        self._games = Games(self._rest)
-        self._mockup = Mockup(self._rest)
-        self._random = Random(self._rest)
-        self._urlshortener = UrlShortener(self._rest)
-        self._utility = Utility(self._rest)
-        self._validation = Validation(self._rest)
-        self._ai = AI(self._rest)
-        self._nettools = NetTools(self._rest)
-        self._moviefinder = MovieFinder(self._rest)
-        self._opendata = OpenData(self._rest)
+        self._rest = RESTClient(
+            base_url,
+            timeout,
+            self._headers,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_size=pool_size,
+            connector_limit=connector_limit,
+            connector_limit_per_host=connector_limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            xml_mode=xml_mode,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            key_pool=key_pool,
+            cache=cache,
+            single_flight=single_flight,
+            compression=compression,
+            compress_min_size=compress_min_size,
+            json_codec=json_codec,
+            decode_offload_size=decode_offload_size,
+            decode_executor=decode_executor,
+        )
+        self._conversion = None
+        self._games = None
+        self._mockup = None
+        self._random = None
+        self._urlshortener = None
+        self._utility = None
+        self._validation = None
+        self._ai = None
+        self._nettools = None
+        self._moviefinder = None
+        self._opendata = None
 
     def __str__(self) -> str:
         return f"X-Api-Key: {self.x_api_key}\nHeaders: {self.headers}\nRESTClient: {self.rest}\nVersion: {__version__}"
 
+    def __enter__(self) -> WildDevsAPI:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> WildDevsAPI:
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.async_close()
+
+    def close(self) -> None:
+        """Closes the pooled connections of the `RESTClient`, which are shared by all endpoint classes."""
+        self._rest.close()
+
+    async def async_close(self) -> None:
+        """Closes the pooled sync connections and the shared `aiohttp.ClientSession` of the `RESTClient`."""
+        await self._rest.async_close()
+
     @property
     def x_api_key(self) -> str:
         """The api-key used for member/subscriber endpoint requests."""
@@ -90,79 +154,91 @@ class WildDevsAPI:
     @property
     def conversion(self) -> Conversion:
         """The class containing conversion related endpoint methods."""
+        if self._conversion is None:
+            self._conversion = Conversion(self._rest)
         return self._conversion
 
     @property
     def games(self) -> Games:
         """The class containing game related endpoint methods."""
+        if self._games is None:
+            self._games = Games(self._rest)
         return self._games
 
     @property
     def mockup(self) -> Mockup:
         """The class containing mockup related endpoint methods."""
+        if self._mockup is None:
+            self._mockup = Mockup(self._rest)
         return self._mockup
 
     @property
     def random(self) -> Random:
         """The class containing random related endpoint methods."""
+        if self._random is None:
+            self._random = Random(self._rest)
         return self._random
 
     @property
     def utility(self) -> Utility:
         """The class containing utility related endpoint methods."""
+        if self._utility is None:
+            self._utility = Utility(self._rest)
         return self._utility
 
     @property
     def urlshortener(self) -> UrlShortener:
         """The class containing urlshortener related endpoint methods."""
+        if self._urlshortener is None:
+            self._urlshortener = UrlShortener(self._rest)
         return self._urlshortener
 
     @property
     def validation(self) -> Validation:
         """The class containing validation related endpoint methods."""
+        if self._validation is None:
+            self._validation = Validation(self._rest)
         return self._validation
 
     @property
     def ai(self) -> AI:
         """The class containing AI related endpoint methods."""
+        if self._ai is None:
+            self._ai = AI(self._rest)
         return self._ai
 
     @property
     def nettools(self) -> NetTools:
         """The class containing net tools related endpoint methods."""
+        if self._nettools is None:
+            self._nettools = NetTools(self._rest)
         return self._nettools
 
     @property
     def moviefinder(self) -> MovieFinder:
         """The class containing moviefinder related endpoint methods."""
+        if self._moviefinder is None:
+            self._moviefinder = MovieFinder(self._rest)
         return self._moviefinder
 
     @property
     def opendata(self) -> OpenData:
         """The class containing open data related endpoint methods."""
+        if self._opendata is None:
+            self._opendata = OpenData(self._rest)
         return self._opendata
 
     def encode_api_key(self, key: str, secret: str) -> None:
         """
         Method to turn the api-key and secret into base64 and add it to the headers. This is required to be able to use the member/subscriber endpoints.
+        If the `RESTClient` has a `key_pool`, the key is also added to the pool.
 
         Args:
             key (`str`): The API key generated on https://wild-devs.net/account/keys. Always starts with `WD-`.
             secret (`str`): The secret generated besides the API key.
         """
-        self._x_api_key = base64.b64encode(f"{key}:{secret}".encode("utf-8")).decode(
-            "utf-8"
-        )
+        self._x_api_key = encode_api_key(key, secret)
         self._headers["x-api-key"] = self.x_api_key
         self._rest.headers = self.headers
-        self._conversion = Conversion(self._rest)
-        self._games = Games(self._rest)
-        self._mockup = Mockup(self._rest)
-        self._random = Random(self._rest)
-        self._urlshortener = UrlShortener(self._rest)
-        self._utility = Utility(self._rest)
-        self._validation = Validation(self._rest)
-        self._ai = AI(self._rest)
-        self._nettools = NetTools(self._rest)
-        self._moviefinder = MovieFinder(self._rest)
-        self._opendata = OpenData(self._rest)
\ No newline at end of file
+        if self._rest.key_pool is not None:
+            self._rest.key_pool.add(key, secret)
@@ -0,0 +1,35 @@
+__all__ = [
+    "CacheEntry",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "RedisCacheBackend",
+    "ResponseCache",
+    "DEFAULT_CACHE_TTLS",
+    "DEFAULT_CACHE_ERROR_TTLS",
+    "DEFAULT_CACHE_CANONICALIZERS",
+]
+
+import importlib
+import typing as t
+
+from wild_devs_api.cache.entry import *
+from wild_devs_api.cache.backend import *
+from wild_devs_api.cache.response_cache import *
+
+if t.TYPE_CHECKING:
+    from wild_devs_api.cache.sqlite import *
+    from wild_devs_api.cache.redis import *
+
+_LAZY_BACKENDS = {
+    "SQLiteCacheBackend": "wild_devs_api.cache.sqlite",
+    "RedisCacheBackend": "wild_devs_api.cache.redis",
+}
+"""The backends imported on first access, so `sqlite3` and `uuid` are only loaded when they are used."""
+
+
+def __getattr__(name: str) -> t.Any:
+    module = _LAZY_BACKENDS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
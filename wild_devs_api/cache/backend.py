@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCacheBackend",
+]
+
+import abc
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from wild_devs_api.cache.entry import CacheEntry
+
+
+class CacheBackend(abc.ABC):
+    """
+    Base class of the storages used by a `ResponseCache`.
+    Backends only store entries, the expiry of an entry is decided by the `ResponseCache`.
+    """
+
+    _locks: dict[str, float]
+    _locks_guard: threading.Lock
+
+    blocking: t.ClassVar[bool] = False
+    """Whether the calls of the backend block on disk or network I/O. Asynchronous requests run them in a thread then."""
+
+    def __init__(self) -> None:
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def evictions(self) -> int:
+        """The amount of entries removed by the size bound of the backend."""
+        return 0
+
+    @abc.abstractmethod
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        """
+        Returns the stored entry for a key, including expired entries.
+
+        Args:
+            key (`str`): The cache key.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores an entry and evicts entries above the size bound of the backend.
+
+        Args:
+            key (`str`): The cache key.
+            entry (`CacheEntry`): The entry to store.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes an entry, if present.
+
+        Args:
+            key (`str`): The cache key.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, endpoint: t.Optional[str] = None) -> int:
+        """
+        Removes stored entries.
+
+        Args:
+            endpoint (Optional`str`): Only removes the entries of this endpoint path and the paths below it. Default removes everything.
+
+        Returns:
+            `int`: The amount of removed entries.
+        """
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        """
+        Tries to take the refresh lock of a key, so only one caller fetches a missing or stale response.
+        The default implementation only protects the current process.
+
+        Args:
+            key (`str`): The cache key.
+            ttl (`float`): The time in seconds after which the lock is released automatically.
+
+        Returns:
+            `bool`: `True` if the lock has been taken.
+        """
+        now = time.monotonic()
+        with self._locks_guard:
+            expires_at = self._locks.get(key)
+            if expires_at is not None and expires_at > now:
+                return False
+            self._locks[key] = now + ttl
+            return True
+
+    def release_lock(self, key: str) -> None:
+        """
+        Releases the refresh lock of a key.
+
+        Args:
+            key (`str`): The cache key.
+        """
+        with self._locks_guard:
+            self._locks.pop(key, None)
+
+    def close(self) -> None:
+        """Releases the resources of the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU storage of a `ResponseCache`, bounded by the amount of entries.
+    """
+
+    _max_entries: int
+    _entries: OrderedDict[str, CacheEntry]
+    _evictions: int
+    _lock: threading.Lock
+
+    def __init__(self, *, max_entries: int = 1024) -> None:
+        super().__init__()
+        self._max_entries = max(1, max_entries)
+        self._entries = OrderedDict()
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum amount of stored entries. The least recently used entry is evicted first."""
+        return self._max_entries
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, endpoint: t.Optional[str] = None) -> int:
+        with self._lock:
+            if endpoint is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [
+                k
+                for k, e in self._entries.items()
+                if e.endpoint == endpoint or e.endpoint.startswith(f"{endpoint}/")
+            ]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
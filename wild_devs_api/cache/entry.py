@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+__all__ = [
+    "CacheEntry",
+]
+
+import typing as t
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response of the API, stored by a `ResponseCache`.
+    """
+
+    endpoint: str
+    body: dict[str, t.Any]
+    headers: dict[str, t.Any]
+    xml: t.Optional[str]
+    expires_at: float
+    etag: t.Optional[str] = None
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+__all__ = [
+    "RedisCacheBackend",
+]
+
+import hashlib
+import json
+import time
+import typing as t
+import uuid
+
+from wild_devs_api.cache.backend import CacheBackend
+from wild_devs_api.cache.entry import CacheEntry
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+"""Deletes a lock only if it still holds the token of this node, in one atomic step on the server."""
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared storage of a `ResponseCache` on a Redis server, so all nodes of a deployment serve each other's responses.
+    Works with any client following the `redis-py` interface (`get`, `set`, `delete`, `scan_iter`, `eval`).
+    Entries are kept `stale_ttl` seconds beyond their expiry, so they can still be served stale or revalidated.
+    Refresh locks are taken with `SET NX`, which protects against stampedes across all nodes.
+    Calls block on the network, so asynchronous requests run them in a thread.
+    """
+
+    blocking = True
+
+    _client: t.Any
+    _prefix: str
+    _stale_ttl: float
+    _tokens: dict[str, str]
+
+    def __init__(
+        self,
+        client: t.Any,
+        *,
+        prefix: str = "wild-devs-api:",
+        stale_ttl: float = 3600,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._prefix = prefix
+        self._stale_ttl = stale_ttl
+        self._tokens = {}
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: t.Any) -> RedisCacheBackend:
+        """
+        Creates a backend with a client of the optional `redis` package.
+
+        Args:
+            url (`str`): The URL of the Redis server, e.g. `redis://localhost:6379/0`.
+            **kwargs (`Any`): The keyword arguments passed to `RedisCacheBackend`.
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisCacheBackend.from_url requires the redis package. Install it with `pip install redis`."
+            ) from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._client.scan_iter(match=f"{self._prefix}entry:*"))
+
+    @property
+    def client(self) -> t.Any:
+        """The Redis client of the backend."""
+        return self._client
+
+    @property
+    def stale_ttl(self) -> float:
+        """The time in seconds an entry is kept on the server after its expiry. Default is 3600."""
+        return self._stale_ttl
+
+    def _entry_key(self, key: str, endpoint: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{self._prefix}entry:{endpoint}|{digest}"
+
+    def _lookup_key(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{self._prefix}key:{digest}"
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        entry_key = self._client.get(self._lookup_key(key))
+        if entry_key is None:
+            return None
+        raw = self._client.get(entry_key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CacheEntry(
+            endpoint=data["endpoint"],
+            body=data["body"],
+            headers=data["headers"],
+            xml=data["xml"],
+            expires_at=data["expires_at"],
+            etag=data["etag"],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raw = json.dumps(
+            {
+                "endpoint": entry.endpoint,
+                "body": entry.body,
+                "headers": entry.headers,
+                "xml": entry.xml,
+                "expires_at": entry.expires_at,
+                "etag": entry.etag,
+            },
+            separators=(",", ":"),
+        )
+        ttl_ms = max(1, int((entry.expires_at - time.time() + self._stale_ttl) * 1000))
+        entry_key = self._entry_key(key, entry.endpoint)
+        self._client.set(entry_key, raw, px=ttl_ms)
+        self._client.set(self._lookup_key(key), entry_key, px=ttl_ms)
+
+    def delete(self, key: str) -> None:
+        lookup_key = self._lookup_key(key)
+        entry_key = self._client.get(lookup_key)
+        if entry_key is not None:
+            self._client.delete(entry_key)
+        self._client.delete(lookup_key)
+
+    def invalidate(self, endpoint: t.Optional[str] = None) -> int:
+        patterns = [f"{self._prefix}entry:*"]
+        if endpoint is not None:
+            patterns = [
+                f"{self._prefix}entry:{endpoint}|*",
+                f"{self._prefix}entry:{endpoint}/*",
+            ]
+        keys = [k for pattern in patterns for k in self._client.scan_iter(match=pattern)]
+        if keys:
+            self._client.delete(*keys)
+        return len(keys)
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        token = uuid.uuid4().hex
+        lock_key = f"{self._prefix}lock:{self._lookup_key(key)}"
+        if not self._client.set(lock_key, token, nx=True, px=max(1, int(ttl * 1000))):
+            return False
+        self._tokens[key] = token
+        return True
+
+    def release_lock(self, key: str) -> None:
+        token = self._tokens.pop(key, None)
+        if token is None:
+            return
+        lock_key = f"{self._prefix}lock:{self._lookup_key(key)}"
+        self._client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+    def close(self) -> None:
+        close = getattr(self._client, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+__all__ = [
+    "ResponseCache",
+    "DEFAULT_CACHE_TTLS",
+    "DEFAULT_CACHE_ERROR_TTLS",
+    "DEFAULT_CACHE_CANONICALIZERS",
+    "strip_payload",
+    "uppercase_fields",
+]
+
+import dataclasses
+import hashlib
+import json
+import threading
+import time
+import typing as t
+
+from wild_devs_api.cache.backend import CacheBackend, MemoryCacheBackend
+from wild_devs_api.cache.entry import CacheEntry
+
+V = t.TypeVar("V")
+
+_VALIDATION_ENDPOINTS = (
+    "bic",
+    "btc",
+    "creditcard",
+    "ean",
+    "eth",
+    "fqdn",
+    "iban",
+    "identitycard",
+    "imei",
+    "ip",
+    "isbn",
+    "isin",
+    "issn",
+    "licenseplate",
+    "mac",
+    "magnet",
+    "mimetype",
+    "postalcode",
+    "semver",
+    "tax",
+    "uuid",
+)
+
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "moviefinder/locales": 86400,
+    "moviefinder/providers": 86400,
+    "tts/voices": 86400,
+    "domains": 3600,
+    "epicgames/free": 3600,
+    **{endpoint: 86400 for endpoint in _VALIDATION_ENDPOINTS},
+    "email": 3600,
+}
+"""The default time to live in seconds of the endpoints, that return near-static data or deterministic verdicts.
+`password` is never cached by default, so passwords are not written to a persistent backend."""
+
+DEFAULT_CACHE_ERROR_TTLS: dict[str, float] = {
+    **{endpoint: 600 for endpoint in _VALIDATION_ENDPOINTS},
+    "email": 600,
+}
+"""The default time to live in seconds of rejected requests (400 responses), so repeated bad inputs raise the
+`BadRequestError` again without a request."""
+
+
+def strip_payload(payload: dict[str, t.Any]) -> dict[str, t.Any]:
+    """
+    Canonicalizer, that strips the surrounding whitespace of all string values of a payload.
+    Not used by default, since the API may reject inputs with surrounding whitespace. Only pass it in `canonicalizers`
+    for endpoints, whose callers never send such inputs or do not rely on their verdict.
+
+    Args:
+        payload (`dict`[`str`, `Any`]): A copy of the payload.
+    """
+    return {k: v.strip() if isinstance(v, str) else v for k, v in payload.items()}
+
+
+def uppercase_fields(
+    *fields: str, strip: bool = False
+) -> t.Callable[[dict[str, t.Any]], dict[str, t.Any]]:
+    """
+    Returns a canonicalizer, that uppercases the values of `fields`. Only pass it in `canonicalizers` for fields,
+    that the API validates case-insensitively.
+
+    Args:
+        *fields (`str`): The names of the payload fields.
+        strip (`bool`): Whether to strip the payload with `strip_payload()` as well. Default is `False`.
+    """
+
+    def canonicalize(payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        if strip:
+            payload = strip_payload(payload)
+        for field in fields:
+            if isinstance(payload.get(field), str):
+                payload[field] = payload[field].upper()
+        return payload
+
+    return canonicalize
+
+
+def _email(payload: dict[str, t.Any]) -> dict[str, t.Any]:
+    email = payload.get("email")
+    if isinstance(email, str) and "@" in email:
+        local, _, domain = email.rpartition("@")
+        payload["email"] = f"{local}@{domain.lower()}"
+    return payload
+
+
+DEFAULT_CACHE_CANONICALIZERS: dict[str, t.Callable[[dict[str, t.Any]], dict[str, t.Any]]] = {
+    "bic": uppercase_fields("bic"),
+    "iban": uppercase_fields("address"),
+    "email": _email,
+}
+"""The default payload canonicalization of the cache keys per endpoint. Only the case of identifiers, that are
+validated case-insensitively (BIC and IBAN), and the domain of emails are canonicalized. Whitespace and the case of
+e.g. ISBNs, ISINs and ISSNs change the verdict, see `strip_payload()` and `uppercase_fields()` to opt in.
+The payload sent to the API is not changed."""
+
+_CONTENT_HEADERS = frozenset(
+    ("content-length", "content-type", "content-encoding", "transfer-encoding")
+)
+
+
+class ResponseCache:
+    """
+    Response cache of a `RESTClient` with a time to live per endpoint.
+    Responses are stored in a `CacheBackend`, which is an in-memory LRU by default.
+    Only endpoints with a configured time to live are cached.
+    The time to live is the soft expiry of a response. For another `stale_ttl` seconds (the hard expiry) the stale response is
+    still served, while a single background request per key refreshes it.
+    Expired responses with an `ETag` are kept until they are evicted, so they can be revalidated with `If-None-Match`.
+    Rejected requests (400 responses) of endpoints with an error time to live are cached as well, so the error is raised
+    again without a request.
+    """
+
+    _ttls: dict[str, float]
+    _error_ttls: dict[str, float]
+    _canonicalizers: dict[str, t.Callable[[dict[str, t.Any]], dict[str, t.Any]]]
+    _stale_ttls: dict[str, float]
+    _stale_ttl: float
+    _lock_timeout: float
+    _backend: CacheBackend
+    _hits: int
+    _stale_hits: int
+    _misses: int
+    _revalidations: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        *,
+        ttls: t.Optional[t.Mapping[str, float]] = None,
+        error_ttls: t.Optional[t.Mapping[str, float]] = None,
+        canonicalizers: t.Optional[
+            t.Mapping[str, t.Callable[[dict[str, t.Any]], dict[str, t.Any]]]
+        ] = None,
+        stale_ttl: float = 0,
+        stale_ttls: t.Optional[t.Mapping[str, float]] = None,
+        lock_timeout: float = 30,
+        max_entries: int = 1024,
+        backend: t.Optional[CacheBackend] = None,
+    ) -> None:
+        self._ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self._error_ttls = dict(DEFAULT_CACHE_ERROR_TTLS if error_ttls is None else error_ttls)
+        self._canonicalizers = dict(
+            DEFAULT_CACHE_CANONICALIZERS if canonicalizers is None else canonicalizers
+        )
+        self._stale_ttl = max(0.0, stale_ttl)
+        self._stale_ttls = dict(stale_ttls or {})
+        self._lock_timeout = lock_timeout
+        if backend is None:
+            backend = MemoryCacheBackend(max_entries=max_entries)
+        self._backend = backend
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"{self.stats}"
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    @property
+    def ttls(self) -> dict[str, float]:
+        """The time to live in seconds per endpoint. An endpoint also matches all paths below it, e.g. `geoip` matches `geoip/1.1.1.1`."""
+        return self._ttls
+
+    @property
+    def error_ttls(self) -> dict[str, float]:
+        """The time to live in seconds of rejected requests (400 responses) per endpoint, matched like `ttls`."""
+        return self._error_ttls
+
+    @property
+    def canonicalizers(self) -> dict[str, t.Callable[[dict[str, t.Any]], dict[str, t.Any]]]:
+        """The functions canonicalizing the payload of an endpoint for its cache key, matched like `ttls`."""
+        return self._canonicalizers
+
+    @property
+    def stale_ttl(self) -> float:
+        """The default time in seconds a response is served stale after its expiry, while it is refreshed. Default is `0`, which disables stale responses."""
+        return self._stale_ttl
+
+    @property
+    def stale_ttls(self) -> dict[str, float]:
+        """The `stale_ttl` overrides per endpoint, matched like `ttls`."""
+        return self._stale_ttls
+
+    @property
+    def lock_timeout(self) -> float:
+        """The time in seconds after which the refresh lock of a key is released, if its holder never finishes. Default is 30."""
+        return self._lock_timeout
+
+    @property
+    def backend(self) -> CacheBackend:
+        """The `CacheBackend` storing the responses. `max_entries` only applies to the default `MemoryCacheBackend`."""
+        return self._backend
+
+    @property
+    def hits(self) -> int:
+        """The amount of requests served from the cache."""
+        return self._hits
+
+    @property
+    def stale_hits(self) -> int:
+        """The amount of requests served with a stale response, while it was refreshed in the background."""
+        return self._stale_hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of cacheable requests that had to be sent to the API."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The amount of responses removed by the size bound of the backend."""
+        return self._backend.evictions
+
+    @property
+    def revalidations(self) -> int:
+        """The amount of expired responses, that the API confirmed as unchanged with a 304 response."""
+        return self._revalidations
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The dictionary representation of the cache statistics."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+            "size": len(self),
+        }
+
+    def ttl_for(self, endpoint: str) -> t.Optional[float]:
+        """
+        Looks up the time to live of an endpoint.
+
+        Args:
+            endpoint (`str`): The endpoint of the request, including the query string.
+
+        Returns:
+            Optional`float`: The time to live in seconds or `None`, if the endpoint is not cached.
+        """
+        return _lookup(self._ttls, endpoint)
+
+    def error_ttl_for(self, endpoint: str) -> t.Optional[float]:
+        """
+        Looks up the time to live of a rejected request to an endpoint.
+
+        Args:
+            endpoint (`str`): The endpoint of the request, including the query string.
+
+        Returns:
+            Optional`float`: The time to live in seconds or `None`, if rejected requests are not cached.
+        """
+        return _lookup(self._error_ttls, endpoint)
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        """
+        Looks up the time in seconds a response of an endpoint is served stale after its expiry.
+
+        Args:
+            endpoint (`str`): The endpoint of the request, including the query string.
+        """
+        stale_ttl = _lookup(self._stale_ttls, endpoint)
+        return self._stale_ttl if stale_ttl is None else stale_ttl
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Checks whether a response has not reached its soft expiry.
+
+        Args:
+            entry (`CacheEntry`): The cached response.
+        """
+        return entry.expires_at > time.time()
+
+    def is_servable(self, entry: CacheEntry) -> bool:
+        """
+        Checks whether a response has not reached its hard expiry and may be served stale.
+        Rejected requests are never served stale.
+
+        Args:
+            entry (`CacheEntry`): The cached response.
+        """
+        if entry.body.get("code", 200) >= 400:
+            return False
+        return entry.expires_at + self.stale_ttl_for(entry.endpoint) > time.time()
+
+    def key(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]] = None,
+        xml: bool = False,
+    ) -> str:
+        """
+        Builds the cache key of a request from its method, endpoint and canonicalized payload.
+        The payload is canonicalized with the function of the endpoint in `canonicalizers` first.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            endpoint (`str`): The endpoint of the request, including the query string.
+            payload (Optional`dict`[`str`, `Any`]): The payload of the request.
+            xml (`bool`): Whether the xml representation is requested.
+        """
+        canonicalize = _lookup(self._canonicalizers, endpoint)
+        if canonicalize is not None and payload:
+            payload = canonicalize(dict(payload))
+        return request_key(method, endpoint, payload, xml)
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        """
+        Returns the cached response for a key, if it has not expired yet.
+        A stale response, that can still be served, is not counted as a miss.
+
+        Args:
+            key (`str`): The key built by `key()`.
+        """
+        entry = self._backend.get(key)
+        if entry is not None and self.is_fresh(entry):
+            with self._lock:
+                self._hits += 1
+            return entry
+        if entry is not None and self.is_servable(entry):
+            return None
+        if entry is not None and entry.etag is None:
+            self._backend.delete(key)
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def get_stale(self, key: str) -> t.Optional[CacheEntry]:
+        """
+        Returns the stored response for a key, including expired responses, without counting a hit or miss.
+        An expired response is either served while it is refreshed, see `is_servable()`, or revalidated with its `ETag`.
+
+        Args:
+            key (`str`): The key built by `key()`.
+        """
+        return self._backend.get(key)
+
+    def record_stale_hit(self) -> None:
+        """Counts a request served with a stale response."""
+        with self._lock:
+            self._stale_hits += 1
+
+    def revalidate(
+        self, key: str, entry: CacheEntry, headers: t.Mapping[str, t.Any], ttl: float
+    ) -> CacheEntry:
+        """
+        Extends the lifetime of a response after the API answered `304 Not Modified`.
+        The stored entry is replaced, so responses built from the expired entry keep their headers.
+
+        Args:
+            key (`str`): The key built by `key()`.
+            entry (`CacheEntry`): The expired response.
+            headers (`Mapping`[`str`, `Any`]): The headers of the 304 response, which replace the stored ones except the content headers.
+            ttl (`float`): The time to live in seconds.
+
+        Returns:
+            `CacheEntry`: The revalidated response.
+        """
+        merged = dict(entry.headers)
+        merged.update((k, v) for k, v in headers.items() if k.lower() not in _CONTENT_HEADERS)
+        revalidated = dataclasses.replace(entry, headers=merged, expires_at=time.time() + ttl)
+        with self._lock:
+            self._revalidations += 1
+        self.set(key, revalidated)
+        return revalidated
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores a response in the backend.
+
+        Args:
+            key (`str`): The key built by `key()`.
+            entry (`CacheEntry`): The response to store.
+        """
+        self._backend.set(key, entry)
+
+    def invalidate(self, endpoint: t.Optional[str] = None) -> int:
+        """
+        Removes cached responses.
+
+        Args:
+            endpoint (Optional`str`): Only removes the responses of this endpoint and the paths below it. Default removes everything.
+
+        Returns:
+            `int`: The amount of removed responses.
+        """
+        if endpoint is not None:
+            endpoint = endpoint.split("?", 1)[0].strip("/")
+        return self._backend.invalidate(endpoint)
+
+    def close(self) -> None:
+        """Releases the resources of the backend."""
+        self._backend.close()
+
+
+def _lookup(values: t.Mapping[str, V], endpoint: str) -> t.Optional[V]:
+    path = endpoint.split("?", 1)[0].strip("/")
+    while path:
+        if path in values:
+            return values[path]
+        path = path.rpartition("/")[0]
+    return None
+
+
+def request_key(
+    method: str,
+    endpoint: str,
+    payload: t.Optional[dict[str, t.Any]] = None,
+    xml: bool = False,
+) -> str:
+    """Builds the SHA-256 digest of a request, so payloads like card or ID numbers never reach a backend in plain text."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    key = f"{method.upper()} {endpoint} {canonical}{' xml' if xml else ''}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
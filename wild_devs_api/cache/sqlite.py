@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+__all__ = [
+    "SQLiteCacheBackend",
+]
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+from wild_devs_api.cache.backend import CacheBackend
+from wild_devs_api.cache.entry import CacheEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    xml TEXT,
+    etag TEXT,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+"""
+
+_SIZE_CHECK_INTERVAL = 256
+"""Number of writes after which the stored size is summed up again, to notice the writes of other processes."""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Persistent storage of a `ResponseCache` in a SQLite database, which survives process restarts.
+    The database runs in WAL mode, so it can be shared by several processes and readers never block each other.
+    Entries are evicted in order of their expiry once the stored responses exceed `max_bytes`. The stored size is
+    tracked while writing and only summed up in the database, when it may exceed `max_bytes` or every 256 writes.
+    Every thread uses its own connection, forked processes open new ones.
+    Calls block on the disk, so asynchronous requests run them in a thread.
+    """
+
+    blocking = True
+
+    _path: str
+    _max_bytes: int
+    _evictions: int
+    _size: int
+    _writes: int
+    _local: threading.local
+    _connections: list[tuple[int, sqlite3.Connection]]
+    _lock: threading.Lock
+
+    def __init__(self, path: str, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__()
+        self._path = path
+        self._max_bytes = max_bytes
+        self._evictions = 0
+        self._writes = 0
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._connection.executescript(_SCHEMA)
+        self._size = self._stored_size(self._connection)
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def path(self) -> str:
+        """The path of the SQLite database file."""
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum size of all stored responses in bytes. Default is 64 MiB."""
+        return self._max_bytes
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not be used across fork(), so the pid it was opened in is kept beside it.
+        pid = os.getpid()
+        connection: t.Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != pid:
+            connection = sqlite3.connect(
+                self._path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = pid
+            with self._lock:
+                self._connections.append((pid, connection))
+        return connection
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        row = self._connection.execute(
+            "SELECT endpoint, body, headers, xml, etag, expires_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        endpoint, body, headers, xml, etag, expires_at = row
+        return CacheEntry(
+            endpoint=endpoint,
+            body=json.loads(body),
+            headers=json.loads(headers),
+            xml=xml,
+            expires_at=expires_at,
+            etag=etag,
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        body = json.dumps(entry.body, separators=(",", ":"))
+        headers = json.dumps(entry.headers, separators=(",", ":"))
+        size = len(body) + len(headers) + len(entry.xml or "")
+        connection = self._connection
+        connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, entry.endpoint, body, headers, entry.xml, entry.etag, entry.expires_at, size),
+        )
+        with self._lock:
+            self._size += size
+            self._writes += 1
+            check = self._size > self._max_bytes or self._writes >= _SIZE_CHECK_INTERVAL
+            if check:
+                self._writes = 0
+        if check:
+            self._evict(connection)
+
+    @staticmethod
+    def _stored_size(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total = self._stored_size(connection)
+        self._size = total
+        if total <= self._max_bytes:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL", (time.time(),)
+            )
+            total = self._stored_size(connection)
+            keys: list[str] = []
+            for key, size in connection.execute(
+                "SELECT key, size FROM responses ORDER BY expires_at"
+            ):
+                if total <= self._max_bytes:
+                    break
+                keys.append(key)
+                total -= size
+            connection.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in keys])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._evictions += len(keys)
+        self._size = total
+
+    def delete(self, key: str) -> None:
+        self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate(self, endpoint: t.Optional[str] = None) -> int:
+        if endpoint is None:
+            return self._connection.execute("DELETE FROM responses").rowcount
+        return self._connection.execute(
+            "DELETE FROM responses WHERE endpoint = ? OR substr(endpoint, 1, ?) = ?",
+            (endpoint, len(endpoint) + 1, f"{endpoint}/"),
+        ).rowcount
+
+    def close(self) -> None:
+        # Connections inherited from the parent process stay open, closing them here could checkpoint its WAL file.
+        pid = os.getpid()
+        with self._lock:
+            for owner, connection in self._connections:
+                if owner == pid:
+                    connection.close()
+            self._connections = [item for item in self._connections if item[0] != pid]
+        self._local = threading.local()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+__all__ = [
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "default_json_codec",
+]
+
+import abc
+import json
+import typing as t
+
+
+class JSONCodec(abc.ABC):
+    """
+    Base class of the JSON encoders/decoders used by a `RESTClient` to serialize payloads and decode responses.
+    Codecs have to be picklable, so responses can be decoded in a process pool.
+    """
+
+    name: t.ClassVar[str]
+
+    def __str__(self) -> str:
+        return self.name
+
+    @abc.abstractmethod
+    def dumps(self, obj: t.Any) -> bytes:
+        """
+        Serializes an object to UTF-8 encoded JSON.
+
+        Args:
+            obj (`Any`): The object to serialize.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        """
+        Deserializes a JSON document.
+
+        Args:
+            data (`bytes` | `str`): The JSON document.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    JSON codec of the standard library. Always available.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec of the optional `orjson` package.
+    """
+
+    name = "orjson"
+
+    _dumps: t.Callable[[t.Any], bytes]
+    _loads: t.Callable[[t.Union[bytes, str]], t.Any]
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "OrjsonCodec requires the orjson package. Install it with `pip install orjson`."
+            ) from e
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec of the optional `msgspec` package.
+    """
+
+    name = "msgspec"
+
+    _dumps: t.Callable[[t.Any], bytes]
+    _loads: t.Callable[[t.Union[bytes, str]], t.Any]
+
+    def __init__(self) -> None:
+        try:
+            import msgspec.json
+        except ImportError as e:
+            raise ImportError(
+                "MsgspecCodec requires the msgspec package. Install it with `pip install msgspec`."
+            ) from e
+        self._dumps = msgspec.json.encode
+        self._loads = msgspec.json.decode
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return self._loads(data)
+
+
+def default_json_codec() -> JSONCodec:
+    """
+    Returns the fastest available JSON codec: `orjson`, then `msgspec`, then the standard library.
+    """
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return StdlibJSONCodec()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+__all__ = [
+    "accept_encoding",
+    "compress_body",
+]
+
+import gzip
+import typing as t
+
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+
+def accept_encoding(transport: str) -> str:
+    """
+    Builds the `Accept-Encoding` header of a transport from the content codings it can decode.
+    `gzip` and `deflate` are always supported, `br` and `zstd` depend on the installed optional packages
+    (`brotli`/`brotlicffi` and `zstandard`).
+
+    Args:
+        transport (`str`): `"requests"` for the sync transport or `"aiohttp"` for the async transport.
+    """
+    if transport == "requests":
+        import urllib3.util.request
+
+        supported = {e.strip() for e in urllib3.util.request.ACCEPT_ENCODING.split(",")}
+    elif transport == "aiohttp":
+        import aiohttp.http_parser
+
+        supported = {"gzip", "deflate"}
+        if getattr(aiohttp.http_parser, "HAS_BROTLI", False):
+            supported.add("br")
+        if getattr(aiohttp.http_parser, "HAS_ZSTD", False):
+            supported.add("zstd")
+    else:
+        raise ValueError(f"Unknown transport {transport!r}.")
+    return ", ".join(e for e in _PREFERENCE if e in supported)
+
+
+def compress_body(body: bytes, min_size: t.Optional[int]) -> t.Optional[bytes]:
+    """
+    Compresses a request body with gzip, if it is large enough and compression makes it smaller.
+
+    Args:
+        body (`bytes`): The serialized request body.
+        min_size (Optional`int`): The smallest body size in bytes to compress. `None` disables compression.
+
+    Returns:
+        Optional`bytes`: The compressed body or `None`, if the body is sent uncompressed.
+    """
+    if min_size is None or len(body) < min_size:
+        return None
+    compressed = gzip.compress(body, compresslevel=5)
+    return compressed if len(compressed) < len(body) else None
@@ -33,6 +33,7 @@ class AI:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -51,7 +52,7 @@ class AI:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            f"dictionary", payload, return_headers=return_headers, xml=xml
+            f"dictionary", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def synonyms(
@@ -60,6 +61,7 @@ class AI:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -78,7 +80,7 @@ class AI:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "synonyms", payload, return_headers=return_headers, xml=xml
+            "synonyms", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     # Asynchronous Methods
@@ -89,6 +91,7 @@ class AI:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -107,7 +110,7 @@ class AI:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "dictionary", payload, return_headers=return_headers, xml=xml
+            "dictionary", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_synonyms(
@@ -116,6 +119,7 @@ class AI:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -134,5 +138,5 @@ class AI:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "synonyms", payload, return_headers=return_headers, xml=xml
+            "synonyms", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
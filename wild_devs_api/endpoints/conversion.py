@@ -33,6 +33,7 @@ class Conversion:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -51,7 +52,7 @@ class Conversion:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "currency", payload, return_headers=return_headers, xml=xml
+            "currency", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def unit(
@@ -60,6 +61,7 @@ class Conversion:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -77,7 +79,7 @@ class Conversion:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("unit", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("unit", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     # Asynchronous Methods
 
@@ -87,6 +89,7 @@ class Conversion:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -105,7 +108,7 @@ class Conversion:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "currency", payload, return_headers=return_headers, xml=xml
+            "currency", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_unit(
@@ -114,6 +117,7 @@ class Conversion:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -132,5 +136,5 @@ class Conversion:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "unit", payload, return_headers=return_headers, xml=xml
+            "unit", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
@@ -4,6 +4,8 @@ __all__ = [
     "Games",
 ]
 
+import typing as t
+
 from wild_devs_api.restclient import RESTClient
 from wild_devs_api.models.response import APIResponse
 
@@ -30,6 +32,7 @@ class Games:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/epicgames/free.
@@ -41,12 +44,12 @@ class Games:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get("epicgames/free", return_headers=return_headers, xml=xml)
+        return self.rest.get("epicgames/free", return_headers=return_headers, xml=xml, timeout=timeout)
 
     # Asynchronous Methods
 
     async def async_free_epicgames(
-        self, *, return_headers: bool = False, xml: bool = False,
+        self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/epicgames/free.
@@ -59,5 +62,5 @@ class Games:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            "epicgames/free", return_headers=return_headers, xml=xml
+            "epicgames/free", return_headers=return_headers, xml=xml, timeout=timeout
         )
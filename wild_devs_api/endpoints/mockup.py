@@ -4,6 +4,8 @@ __all__ = [
     "Mockup",
 ]
 
+import typing as t
+
 from wild_devs_api.restclient import RESTClient
 from wild_devs_api.models.response import APIResponse
 
@@ -32,6 +34,7 @@ class Mockup:
         count: int = 1,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/address.
@@ -46,10 +49,11 @@ class Mockup:
             f"address?locale={locale}&count={count}",
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     def company(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/company.
@@ -61,11 +65,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"company?count={count}", return_headers=return_headers, xml=xml
+            f"company?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def finance(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/finance.
@@ -77,11 +81,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"finance?count={count}", return_headers=return_headers, xml=xml
+            f"finance?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def git(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/git.
@@ -93,11 +97,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"git?count={count}", return_headers=return_headers, xml=xml
+            f"git?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def internet(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/internet.
@@ -109,11 +113,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"internet?count={count}", return_headers=return_headers, xml=xml
+            f"internet?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def product(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/product.
@@ -125,7 +129,7 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"product?count={count}", return_headers=return_headers, xml=xml
+            f"product?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def user(
@@ -138,6 +142,7 @@ class Mockup:
         finance: bool = False,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/user.
@@ -159,10 +164,11 @@ class Mockup:
             f"user?locale={locale}&count={count}{query_string}",
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     def vehicle(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/vehicle.
@@ -174,13 +180,13 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"vehicle?count={count}", return_headers=return_headers, xml=xml
+            f"vehicle?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     # Asynchronous Methods
 
     async def async_address(
-        self, *, locale: str = "en", count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, locale: str = "en", count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/address.
@@ -192,11 +198,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"address?locale={locale}&count={count}", return_headers=return_headers, xml=xml
+            f"address?locale={locale}&count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_company(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/company.
@@ -208,11 +214,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"company?count={count}", return_headers=return_headers, xml=xml
+            f"company?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_finance(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/finance.
@@ -224,11 +230,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"finance?count={count}", return_headers=return_headers, xml=xml
+            f"finance?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_git(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/git.
@@ -240,11 +246,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"git?count={count}", return_headers=return_headers, xml=xml
+            f"git?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_internet(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/internet.
@@ -256,11 +262,11 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"internet?count={count}", return_headers=return_headers, xml=xml
+            f"internet?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_product(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/product.
@@ -272,7 +278,7 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"product?count={count}", return_headers=return_headers, xml=xml
+            f"product?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_user(
@@ -284,7 +290,8 @@ class Mockup:
         address: bool = False,
         finance: bool = False,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/user.
@@ -304,11 +311,11 @@ class Mockup:
             query_string += "&finance"
         return await self.rest.async_get(
             f"user?locale={locale}&count={count}{query_string}",
-            return_headers=return_headers, xml=xml
+            return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_vehicle(
-        self, *, count: int = 1, return_headers: bool = False, xml: bool = False
+        self, *, count: int = 1, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/vehicle.
@@ -320,5 +327,5 @@ class Mockup:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"vehicle?count={count}", return_headers=return_headers, xml=xml
+            f"vehicle?count={count}", return_headers=return_headers, xml=xml, timeout=timeout
         )
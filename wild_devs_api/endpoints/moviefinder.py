@@ -33,6 +33,7 @@ class MovieFinder:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -51,7 +52,7 @@ class MovieFinder:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "moviefinder", payload, return_headers=return_headers, xml=xml
+            "moviefinder", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def moviefinder_locales(
@@ -59,6 +60,7 @@ class MovieFinder:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/moviefinder/locales.
@@ -71,7 +73,7 @@ class MovieFinder:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            "moviefinder/locales", return_headers=return_headers, xml=xml
+            "moviefinder/locales", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def moviefinder_providers(
@@ -80,6 +82,7 @@ class MovieFinder:
         locale: str = "",
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/moviefinder/providers.
@@ -93,7 +96,7 @@ class MovieFinder:
         if locale:
             locale = f"locale={locale}"
         return self.rest.get(
-            f"moviefinder/providers?{locale}", return_headers=return_headers, xml=xml
+            f"moviefinder/providers?{locale}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     # Asynchronous Methods
@@ -104,6 +107,7 @@ class MovieFinder:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -122,14 +126,15 @@ class MovieFinder:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "moviefinder", payload, return_headers=return_headers, xml=xml
+            "moviefinder", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_moviefinder_locales(
         self,
         *,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/moviefinder/locales.
@@ -141,7 +146,7 @@ class MovieFinder:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            "moviefinder/locales", return_headers=return_headers, xml=xml
+            "moviefinder/locales", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_moviefinder_providers(
@@ -149,7 +154,8 @@ class MovieFinder:
         *,
         locale: str = "",
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/moviefinder/providers.
@@ -163,5 +169,5 @@ class MovieFinder:
         if locale:
             locale = f"locale={locale}"
         return await self.rest.async_get(
-            f"moviefinder/providers?{locale}", return_headers=return_headers, xml=xml
+            f"moviefinder/providers?{locale}", return_headers=return_headers, xml=xml, timeout=timeout
         )
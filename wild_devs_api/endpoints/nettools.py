@@ -4,6 +4,8 @@ __all__ = [
     "NetTools",
 ]
 
+import typing as t
+
 from wild_devs_api.restclient import RESTClient
 from wild_devs_api.models.response import APIResponse
 
@@ -26,7 +28,7 @@ class NetTools:
     # Synchronous Methods
 
     def dnslookup(
-        self, source: str, *, return_headers: bool = False, xml: bool = False
+        self, source: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/dnslookup.
@@ -41,11 +43,11 @@ class NetTools:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"dnslookup?source={source}", return_headers=return_headers, xml=xml
+            f"dnslookup?source={source}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def ipinfo(
-        self, ip: str, *, return_headers: bool = False, xml: bool = False
+        self, ip: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/ipinfo.
@@ -60,11 +62,11 @@ class NetTools:
             `APIResponse`: The object created from the response.
         """
         return self.rest.get(
-            f"ipinfo?source={ip}", return_headers=return_headers, xml=xml
+            f"ipinfo?source={ip}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def geoip(
-        self, ip: str, *, return_headers: bool = False, xml: bool = False
+        self, ip: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/geoip/{ip}.
@@ -78,10 +80,10 @@ class NetTools:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get(f"geoip/{ip}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"geoip/{ip}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def whatsmyip(
-        self, *, return_headers: bool = False, xml: bool = False
+        self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/whatsmyip.
@@ -92,12 +94,12 @@ class NetTools:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get("whatsmyip", return_headers=return_headers, xml=xml)
+        return self.rest.get("whatsmyip", return_headers=return_headers, xml=xml, timeout=timeout)
 
     # Asynchronous Methods
 
     async def async_dnslookup(
-        self, source: str, *, return_headers: bool = False, xml: bool = False
+        self, source: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/dnslookup.
@@ -112,11 +114,11 @@ class NetTools:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"dnslookup?source={source}", return_headers=return_headers, xml=xml
+            f"dnslookup?source={source}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_ipinfo(
-        self, ip: str, *, return_headers: bool = False, xml: bool = False
+        self, ip: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/ipinfo.
@@ -131,11 +133,11 @@ class NetTools:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_get(
-            f"ipinfo?source={ip}", return_headers=return_headers, xml=xml
+            f"ipinfo?source={ip}", return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_geoip(
-        self, ip: str, *, return_headers: bool = False, xml: bool = False
+        self, ip: str, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/geoip/{ip}.
@@ -149,9 +151,9 @@ class NetTools:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self.rest.async_get(f"geoip/{ip}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"geoip/{ip}", return_headers=return_headers, xml=xml, timeout=timeout)
 
-    async def async_whatsmyip(self, *, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    async def async_whatsmyip(self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/whatsmyip.
 
@@ -161,4 +163,4 @@ class NetTools:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self.rest.async_get("whatsmyip", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get("whatsmyip", return_headers=return_headers, xml=xml, timeout=timeout)
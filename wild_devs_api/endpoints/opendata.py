@@ -4,6 +4,8 @@ __all__ = [
     "OpenData",
 ]
 
+import typing as t
+
 from wild_devs_api.restclient import RESTClient
 from wild_devs_api.models.response import APIResponse
 
@@ -30,6 +32,7 @@ class OpenData:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/domains.
@@ -40,7 +43,7 @@ class OpenData:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get("domains", return_headers=return_headers, xml=xml)
+        return self.rest.get("domains", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def book(
         self,
@@ -53,6 +56,7 @@ class OpenData:
         random: bool = True,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/book.
@@ -72,7 +76,7 @@ class OpenData:
             query_string += f"&isbn10={isbn10}"
         if random:
             query_string += "&random"
-        return self.rest.get(f"book{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"book{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def exercise(
         self,
@@ -83,6 +87,7 @@ class OpenData:
         random: bool = False,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/exercise.
@@ -98,7 +103,7 @@ class OpenData:
         query_string = f"?limit={limit}&offset={offset}&difficulty={difficulty}"
         if random:
             query_string += "&random"
-        return self.rest.get(f"exercise{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"exercise{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def chess_game(
         self,
@@ -112,6 +117,7 @@ class OpenData:
         random: bool = True,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/chess/game.
@@ -133,14 +139,15 @@ class OpenData:
             query_string += f"&winner={winner}"
         if random:
             query_string += "&random"
-        return self.rest.get(f"chess/game{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"chess/game{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
     # Asynchronous Methods
 
     async def async_domains(
         self,
         *,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/domains.
@@ -151,7 +158,7 @@ class OpenData:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self.rest.async_get("domains", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get("domains", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_book(
         self,
@@ -164,6 +171,7 @@ class OpenData:
         random: bool = True,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/book.
@@ -183,7 +191,7 @@ class OpenData:
             query_string += f"&isbn10={isbn10}"
         if random:
             query_string += "&random"
-        return await self.rest.async_get(f"book{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"book{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_exercise(
         self,
@@ -194,6 +202,7 @@ class OpenData:
         random: bool = False,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/exercise.
@@ -207,7 +216,7 @@ class OpenData:
         query_string = f"?limit={limit}&offset={offset}&difficulty={difficulty}"
         if random:
             query_string += "&random"
-        return await self.rest.async_get(f"exercise{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"exercise{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_chess_game(
         self,
@@ -221,6 +230,7 @@ class OpenData:
         random: bool = True,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/chess/game.
@@ -242,5 +252,5 @@ class OpenData:
             query_string += f"&winner={winner}"
         if random:
             query_string += "&random"
-        return await self.rest.async_get(f"chess/game{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"chess/game{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
     
\ No newline at end of file
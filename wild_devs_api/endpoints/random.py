@@ -35,7 +35,8 @@ class Random:
         offset: int = 1,
         random: bool = True,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
                     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/affirmation.
@@ -51,7 +52,7 @@ class Random:
             query_string += "&random"
         if tag:
             query_string += "&tag"
-        return self.rest.get(f"affirmation{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"affirmation{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def poem(
         self,
@@ -60,7 +61,8 @@ class Random:
         offset: int = 1,
         random: bool = True,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
                     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/poem.
@@ -74,7 +76,7 @@ class Random:
         query_string = f"?limit={limit}&offset={offset}"
         if random:
             query_string += "&random"
-        return self.rest.get(f"poem{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"poem{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def quote(
         self,
@@ -83,7 +85,8 @@ class Random:
         offset: int = 1,
         random: bool = True,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
                     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/quote.
@@ -97,7 +100,7 @@ class Random:
         query_string = f"?limit={limit}&offset={offset}"
         if random:
             query_string += "&random"
-        return self.rest.get(f"quote{query_string}", return_headers=return_headers, xml=xml)
+        return self.rest.get(f"quote{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def string(
         self,
@@ -105,6 +108,7 @@ class Random:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -122,7 +126,7 @@ class Random:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("string", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("string", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def number(
         self,
@@ -130,6 +134,7 @@ class Random:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -148,9 +153,9 @@ class Random:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("number", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("number", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
-    def joke(self, *, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    def joke(self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/joke.
 
@@ -160,7 +165,7 @@ class Random:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get("joke", return_headers=return_headers, xml=xml)
+        return self.rest.get("joke", return_headers=return_headers, xml=xml, timeout=timeout)
 
     # Asynchronous Methods
 
@@ -172,7 +177,8 @@ class Random:
             offset: int = 1,
             random: bool = True,
             return_headers: bool = False,
-            xml: bool = False
+            xml: bool = False,
+            timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/affirmation.
@@ -188,7 +194,7 @@ class Random:
             query_string += "&random"
         if tag:
             query_string += "&tag"
-        return await self.rest.async_get(f"affirmation{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"affirmation{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_poem(
             self,
@@ -197,7 +203,8 @@ class Random:
             offset: int = 1,
             random: bool = True,
             return_headers: bool = False,
-            xml: bool = False
+            xml: bool = False,
+            timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/poem.
@@ -211,7 +218,7 @@ class Random:
         query_string = f"?limit={limit}&offset={offset}"
         if random:
             query_string += "&random"
-        return await self.rest.async_get(f"poem{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"poem{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_quote(
             self,
@@ -220,7 +227,8 @@ class Random:
             offset: int = 1,
             random: bool = True,
             return_headers: bool = False,
-            xml: bool = False
+            xml: bool = False,
+            timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/quote.
@@ -234,7 +242,7 @@ class Random:
         query_string = f"?limit={limit}&offset={offset}"
         if random:
             query_string += "&random"
-        return await self.rest.async_get(f"quote{query_string}", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get(f"quote{query_string}", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_string(
         self,
@@ -242,6 +250,7 @@ class Random:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -261,7 +270,7 @@ class Random:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "string", payload, return_headers=return_headers, xml=xml
+            "string", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_number(
@@ -270,6 +279,7 @@ class Random:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -289,10 +299,10 @@ class Random:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "number", payload, return_headers=return_headers, xml=xml
+            "number", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
-    async def async_joke(self, *, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    async def async_joke(self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/joke.
 
@@ -302,4 +312,4 @@ class Random:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self.rest.async_get("joke", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get("joke", return_headers=return_headers, xml=xml, timeout=timeout)
@@ -33,6 +33,7 @@ class UrlShortener:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -48,11 +49,11 @@ class UrlShortener:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "urlshortener", payload, return_headers=return_headers, xml=xml
+            "urlshortener", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def url_shorteners(
-        self, *, return_headers: bool = False, xml: bool = False
+        self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/urlshorteners.
@@ -63,10 +64,10 @@ class UrlShortener:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.get("urlshorteners", return_headers=return_headers, xml=xml)
+        return self.rest.get("urlshorteners", return_headers=return_headers, xml=xml, timeout=timeout)
 
     def delete_url_shortener(
-        self, url: str, *, return_headers: bool = False
+        self, url: str, *, return_headers: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send a synchronous DELETE request to https://api.wild-devs.net/v1/urlshortener{id}.
@@ -77,7 +78,7 @@ class UrlShortener:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.delete(f"urlshortener/{url}", return_headers=return_headers)
+        return self.rest.delete(f"urlshortener/{url}", return_headers=return_headers, timeout=timeout)
 
     # Asynchronous Methods
 
@@ -87,6 +88,7 @@ class UrlShortener:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -103,11 +105,11 @@ class UrlShortener:
         return await self.rest.async_post(
             "urlshortener",
             payload,
-            return_headers=return_headers, xml=xml
+            return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_url_shorteners(
-        self, *, return_headers: bool = False, xml: bool = False
+        self, *, return_headers: bool = False, xml: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/urlshorteners.
@@ -118,10 +120,10 @@ class UrlShortener:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self.rest.async_get("urlshorteners", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get("urlshorteners", return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_delete_url_shortener(
-        self, url: str, *, return_headers: bool = False
+        self, url: str, *, return_headers: bool = False, timeout: t.Optional[float] = None
     ) -> APIResponse:
         """
         Method to send an asynchronous DELETE request to https://api.wild-devs.net/v1/urlshortener{id}.
@@ -133,5 +135,5 @@ class UrlShortener:
             `APIResponse`: The object created from the response.
         """
         return await self.rest.async_delete(
-            f"urlshortener/{url}", return_headers=return_headers
+            f"urlshortener/{url}", return_headers=return_headers, timeout=timeout
         )
@@ -34,6 +34,7 @@ class Utility:
             *,
             return_headers: bool = False,
             xml: bool = False,
+            timeout: t.Optional[float] = None,
             **kwargs: t.Any
             ) -> APIResponse:
         """
@@ -52,7 +53,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "plagiarism", payload, return_headers=return_headers, xml=xml
+            "plagiarism", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def captcha(
@@ -66,6 +67,7 @@ class Utility:
         file_path: str = "./",
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/captcha.
@@ -83,12 +85,14 @@ class Utility:
                 f"captcha?length={length}&height={height}&width={width}&charset={charset}",
                 return_headers=return_headers,
                 xml=xml,
+                timeout=timeout,
             )
         else:
             data = self.rest.get(
                 f"captcha?length={length}&height={height}&width={width}&charset={charset}",
                 return_headers=return_headers,
                 xml=xml,
+                timeout=timeout,
             )
             code = data.data["image"][22:]
             captcha = base64.b64decode(code)
@@ -102,6 +106,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -120,7 +125,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "compile", payload, return_headers=return_headers, xml=xml
+            "compile", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def decode(
@@ -129,6 +134,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous POST request to https://api.wild-devs.net/v1/decode.
@@ -143,7 +149,7 @@ class Utility:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.post("decode", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("decode", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def encode(
         self,
@@ -151,6 +157,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous POST request to https://api.wild-devs.net/v1/encode.
@@ -165,7 +172,7 @@ class Utility:
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self.rest.post("encode", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("encode", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def hash(
         self,
@@ -173,6 +180,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -190,7 +198,7 @@ class Utility:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("hash", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("hash", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def qrcode(
         self,
@@ -200,6 +208,7 @@ class Utility:
         file_path: str = "./",
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -220,11 +229,11 @@ class Utility:
             payload = self.rest.build_payload(kwargs)
         if not create_img:
             return self.rest.post(
-                "qrcode", payload, return_headers=return_headers, xml=xml
+                "qrcode", payload, return_headers=return_headers, xml=xml, timeout=timeout
             )
         else:
             data = self.rest.post(
-                "qrcode", payload, return_headers=return_headers, xml=xml
+                "qrcode", payload, return_headers=return_headers, xml=xml, timeout=timeout
             )
             code = data.data[21:]
             qr = base64.b64decode(code)
@@ -238,6 +247,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -255,7 +265,7 @@ class Utility:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("nsfw", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("nsfw", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def tts(
         self,
@@ -263,6 +273,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -280,13 +291,14 @@ class Utility:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("tts", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("tts", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def tts_voices(
         self,
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send a synchronous GET request to https://api.wild-devs.net/v1/tts/voices.
@@ -298,7 +310,7 @@ class Utility:
             `APIResponse`: The object created from the response.
         """
 
-        return self.rest.get("tts/voices", return_headers=return_headers, xml=xml)
+        return self.rest.get("tts/voices", return_headers=return_headers, xml=xml, timeout=timeout)
 
     # Asynchronous Methods
 
@@ -308,6 +320,7 @@ class Utility:
             *,
             return_headers: bool = False,
             xml: bool = False,
+            timeout: t.Optional[float] = None,
             **kwargs: t.Any
             ) -> APIResponse:
         """
@@ -326,7 +339,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "plagiarism", payload, return_headers=return_headers, xml=xml
+            "plagiarism", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_captcha(
@@ -339,7 +352,8 @@ class Utility:
         create_img: bool = False,
         file_path: str = "./",
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/captcha.
@@ -355,12 +369,12 @@ class Utility:
         if not create_img:
             return await self.rest.async_get(
                 f"captcha?length={length}&height={height}&width={width}&charset={charset}",
-                return_headers=return_headers, xml=xml
+                return_headers=return_headers, xml=xml, timeout=timeout
             )
         else:
             data = await self.rest.async_get(
                 f"captcha?length={length}&height={height}&width={width}&charset={charset}",
-                return_headers=return_headers, xml=xml
+                return_headers=return_headers, xml=xml, timeout=timeout
             )
             code = data.data["image"][22:]
             captcha = base64.b64decode(code)
@@ -374,6 +388,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -392,7 +407,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "compile", payload, return_headers=return_headers
+            "compile", payload, return_headers=return_headers, timeout=timeout
         )
 
     async def async_decode(
@@ -401,6 +416,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -419,7 +435,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "decode", payload, return_headers=return_headers, xml=xml
+            "decode", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_encode(
@@ -428,6 +444,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -446,7 +463,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "encode", payload, return_headers=return_headers, xml=xml
+            "encode", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_hash(
@@ -455,6 +472,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -473,7 +491,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "hash", payload, return_headers=return_headers
+            "hash", payload, return_headers=return_headers, timeout=timeout
         )
 
     async def async_qrcode(
@@ -484,6 +502,7 @@ class Utility:
         file_path: str = "./",
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -504,11 +523,11 @@ class Utility:
             payload = self.rest.build_payload(kwargs)
         if not create_img:
             return await self.rest.async_post(
-                "qrcode", payload, return_headers=return_headers, xml=xml
+                "qrcode", payload, return_headers=return_headers, xml=xml, timeout=timeout
             )
         else:
             data = await self.rest.async_post(
-                "qrcode", payload, return_headers=return_headers, xml=xml
+                "qrcode", payload, return_headers=return_headers, xml=xml, timeout=timeout
             )
             code = data.data[21:]
             qr = base64.b64decode(code)
@@ -522,6 +541,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -540,7 +560,7 @@ class Utility:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "nsfw", payload, return_headers=return_headers, xml=xml
+            "nsfw", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_tts(
@@ -549,6 +569,7 @@ class Utility:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -566,13 +587,14 @@ class Utility:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("tts", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("tts", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_tts_voices(
         self,
         *,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Method to send an asynchronous GET request to https://api.wild-devs.net/v1/tts/voices.
@@ -584,4 +606,4 @@ class Utility:
             `APIResponse`: The object created from the response.
         """
 
-        return await self.rest.async_get("tts/voices", return_headers=return_headers, xml=xml)
+        return await self.rest.async_get("tts/voices", return_headers=return_headers, xml=xml, timeout=timeout)
@@ -33,6 +33,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -60,7 +61,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("email", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("email", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def btc(
         self,
@@ -68,6 +69,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -86,7 +88,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("btc", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("btc", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def eth(
         self,
@@ -94,6 +96,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -112,7 +115,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("eth", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("eth", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def bic(
         self,
@@ -120,6 +123,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -138,7 +142,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("bic", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("bic", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def creditcard(
         self,
@@ -146,6 +150,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -169,6 +174,7 @@ class Validation:
             payload,
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     def ean(
@@ -177,6 +183,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -195,7 +202,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("ean", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("ean", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def fqdn(
         self,
@@ -203,6 +210,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -221,7 +229,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("fqdn", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("fqdn", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def iban(
         self,
@@ -229,6 +237,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -247,7 +256,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("iban", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("iban", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def imei(
         self,
@@ -255,6 +264,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -274,7 +284,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("imei", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("imei", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def ip(
         self,
@@ -282,6 +292,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -300,7 +311,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("ip", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("ip", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def identitycard(
         self,
@@ -308,6 +319,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -331,6 +343,7 @@ class Validation:
             payload,
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     def isbn(
@@ -339,6 +352,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -357,7 +371,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("isbn", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("isbn", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def isin(
         self,
@@ -365,6 +379,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -383,7 +398,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("isin", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("isin", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def issn(
         self,
@@ -391,6 +406,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -409,7 +425,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("issn", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("issn", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def mac(
         self,
@@ -417,6 +433,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -436,7 +453,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("mac", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("mac", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def magnet(
         self,
@@ -444,6 +461,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -462,7 +480,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("magnet", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("magnet", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def mimetype(
         self,
@@ -470,6 +488,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -489,7 +508,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "mimetype", payload, return_headers=return_headers, xml=xml
+            "mimetype", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def password(
@@ -498,6 +517,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -529,7 +549,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return self.rest.post(
-            "password", payload, return_headers=return_headers, xml=xml
+            "password", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     def uuid(
@@ -538,6 +558,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -556,7 +577,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("uuid", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("uuid", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def tax(
         self,
@@ -564,6 +585,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -583,7 +605,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("tax", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("tax", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def semver(
         self,
@@ -591,6 +613,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -609,7 +632,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return self.rest.post("semver", payload, return_headers=return_headers, xml=xml)
+        return self.rest.post("semver", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     def licenseplate(
         self,
@@ -617,6 +640,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -641,6 +665,7 @@ class Validation:
             payload,
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     def postalcode(
@@ -649,6 +674,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -672,6 +698,7 @@ class Validation:
             payload,
             return_headers=return_headers,
             xml=xml,
+            timeout=timeout,
         )
 
     # Asynchronous Methods
@@ -682,6 +709,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -710,7 +738,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "email", payload, return_headers=return_headers, xml=xml
+            "email", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_btc(
@@ -719,6 +747,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -737,7 +766,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("btc", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("btc", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_eth(
         self,
@@ -745,6 +774,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -763,7 +793,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("eth", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("eth", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_bic(
         self,
@@ -771,6 +801,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -789,7 +820,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("bic", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("bic", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_creditcard(
         self,
@@ -797,6 +828,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -819,7 +851,8 @@ class Validation:
             "creditcard",
             payload,
             return_headers=return_headers,
-            xml=xml
+            xml=xml,
+            timeout=timeout,
         )
 
     async def async_ean(
@@ -828,6 +861,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -846,7 +880,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("ean", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("ean", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_fqdn(
         self,
@@ -854,6 +888,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -873,7 +908,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "fqdn", payload, return_headers=return_headers, xml=xml
+            "fqdn", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_iban(
@@ -882,6 +917,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -901,7 +937,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "iban", payload, return_headers=return_headers, xml=xml
+            "iban", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_imei(
@@ -910,6 +946,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -930,7 +967,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "imei", payload, return_headers=return_headers, xml=xml
+            "imei", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_ip(
@@ -939,6 +976,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -957,7 +995,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("ip", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("ip", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_identitycard(
         self,
@@ -965,6 +1003,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -987,7 +1026,8 @@ class Validation:
             "identitycard",
             payload,
             return_headers=return_headers,
-            xml=xml
+            xml=xml,
+            timeout=timeout,
         )
 
     async def async_isbn(
@@ -996,6 +1036,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1015,7 +1056,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "isbn", payload, return_headers=return_headers, xml=xml
+            "isbn", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_isin(
@@ -1024,6 +1065,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1043,7 +1085,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "isin", payload, return_headers=return_headers, xml=xml
+            "isin", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_issn(
@@ -1052,6 +1094,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1071,7 +1114,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "issn", payload, return_headers=return_headers, xml=xml
+            "issn", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_mac(
@@ -1080,6 +1123,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1099,7 +1143,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("mac", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("mac", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_magnet(
         self,
@@ -1107,6 +1151,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1126,7 +1171,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "magnet", payload, return_headers=return_headers, xml=xml
+            "magnet", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_mimetype(
@@ -1135,6 +1180,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1154,7 +1200,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "mimetype", payload, return_headers=return_headers, xml=xml
+            "mimetype", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_password(
@@ -1163,6 +1209,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1194,7 +1241,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "password", payload, return_headers=return_headers, xml=xml
+            "password", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_uuid(
@@ -1203,6 +1250,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1222,7 +1270,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "uuid", payload, return_headers=return_headers, xml=xml
+            "uuid", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_tax(
@@ -1231,6 +1279,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1250,7 +1299,7 @@ class Validation:
         """
         if not payload:
             payload = self.rest.build_payload(kwargs)
-        return await self.rest.async_post("tax", payload, return_headers=return_headers, xml=xml)
+        return await self.rest.async_post("tax", payload, return_headers=return_headers, xml=xml, timeout=timeout)
 
     async def async_semver(
         self,
@@ -1258,6 +1307,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1277,7 +1327,7 @@ class Validation:
         if not payload:
             payload = self.rest.build_payload(kwargs)
         return await self.rest.async_post(
-            "semver", payload, return_headers=return_headers, xml=xml
+            "semver", payload, return_headers=return_headers, xml=xml, timeout=timeout
         )
 
     async def async_licenseplate(
@@ -1286,6 +1336,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1309,7 +1360,8 @@ class Validation:
             "licenseplate",
             payload,
             return_headers=return_headers,
-            xml=xml
+            xml=xml,
+            timeout=timeout,
         )
 
     async def async_postalcode(
@@ -1318,6 +1370,7 @@ class Validation:
         *,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
         **kwargs: t.Any,
     ) -> APIResponse:
         """
@@ -1340,5 +1393,6 @@ class Validation:
             "postalcode",
             payload,
             return_headers=return_headers,
-            xml=xml
+            xml=xml,
+            timeout=timeout,
         )
@@ -113,14 +113,14 @@ class TooManyRequestsError(WildDevsError):
 
 def send_error_response(data: dict[str, t.Any]) -> WildDevsError:
     code = data["code"]
-    error = data["note"]
+    error = data.get("note") or data.get("message") or f"The API request failed with code {code}."
     if code == 400:
         if not_allowed_fields := data.get("notAllowedFields"):
             return BadRequestError(error, not_allowed_fields=not_allowed_fields)
         if missing_fields := data.get("missingFields"):
             return BadRequestError(error, missing_fields=missing_fields)
         return BadRequestError(error)
-    return _error_dict[code](error)
+    return _error_dict.get(code, WildDevsError)(error)
 
 
 _error_dict: dict[int, type[WildDevsError]] = {
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+__all__ = [
+    "APIKeyPool",
+    "encode_api_key",
+]
+
+import asyncio
+import base64
+import threading
+import time
+import typing as t
+
+from wild_devs_api.errors.errors import TooManyRequestsError
+from wild_devs_api.models.ratelimit_info import RateLimitInfo
+from wild_devs_api.ratelimit import RateLimiter
+
+
+def encode_api_key(key: str, secret: str) -> str:
+    """
+    Turns an api-key and its secret into the base64 value of the `x-api-key` header.
+
+    Args:
+        key (`str`): The API key generated on https://wild-devs.net/account/keys. Always starts with `WD-`.
+        secret (`str`): The secret generated besides the API key.
+    """
+    return base64.b64encode(f"{key}:{secret}".encode("utf-8")).decode("utf-8")
+
+
+class APIKeyPool:
+    """
+    Pool of api-keys, that spreads the requests of a `RESTClient` across several keys.
+    Every key has its own `RateLimiter`, which tracks the remaining quota of the key from the ratelimit headers
+    of its responses. Keys are used in turn, exhausted keys are skipped until their reset.
+    Requests only wait, if all keys are exhausted. Safe to share between threads and coroutines.
+    """
+
+    _keys: dict[str, str]
+    _limiters: dict[str, RateLimiter]
+    _order: list[str]
+    _next: int
+    _max_wait: t.Optional[float]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        keys: t.Iterable[tuple[str, str]] = (),
+        *,
+        max_wait: t.Optional[float] = None,
+    ) -> None:
+        self._keys = {}
+        self._limiters = {}
+        self._order = []
+        self._next = 0
+        self._max_wait = max_wait
+        self._lock = threading.Lock()
+        for key, secret in keys:
+            self.add(key, secret)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{key}: Remaining: {limiter.remaining} ResetIn: {limiter.reset_in}"
+            for key, limiter in self.limiters.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def keys(self) -> list[str]:
+        """The api-keys of the pool, without their secrets."""
+        return [self._keys[value] for value in self._order]
+
+    @property
+    def limiters(self) -> dict[str, RateLimiter]:
+        """The `RateLimiter` of every api-key of the pool."""
+        return {self._keys[value]: self._limiters[value] for value in self._order}
+
+    @property
+    def max_wait(self) -> t.Optional[float]:
+        """The longest time in seconds to wait for a key, if all keys are exhausted. Default is `None`, which waits until the first reset.
+        A `TooManyRequestsError` is raised, if the wait would be longer."""
+        return self._max_wait
+
+    def add(self, key: str, secret: str) -> None:
+        """
+        Adds an api-key to the pool. Adding a key again, also after it has been removed, keeps its tracked quota.
+
+        Args:
+            key (`str`): The API key generated on https://wild-devs.net/account/keys. Always starts with `WD-`.
+            secret (`str`): The secret generated besides the API key.
+        """
+        value = encode_api_key(key, secret)
+        with self._lock:
+            if value in self._order:
+                return
+            if value not in self._keys:
+                self._keys[value] = key
+                self._limiters[value] = RateLimiter()
+            self._order.append(value)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes an api-key from the pool. Requests already sent with it are still reconciled.
+
+        Args:
+            key (`str`): The API key, that has been added to the pool.
+        """
+        with self._lock:
+            self._order = [value for value in self._order if self._keys[value] != key]
+
+    def _try_acquire(self) -> tuple[t.Optional[str], float]:
+        """Takes a token of the next key with quota left and returns its `x-api-key` value,
+        or returns `None` and the time to wait for the first reset."""
+        with self._lock:
+            order = self._order
+            start = self._next
+            wait = None
+            for i in range(len(order)):
+                value = order[(start + i) % len(order)]
+                key_wait = self._limiters[value]._try_acquire()
+                if not key_wait:
+                    self._next = (start + i + 1) % len(order)
+                    return value, 0.0
+                wait = key_wait if wait is None else min(wait, key_wait)
+        if wait is None:
+            raise ValueError("The APIKeyPool does not contain any api-key.")
+        if self.max_wait is not None and wait > self.max_wait:
+            raise TooManyRequestsError(
+                f"Ratelimit of all {len(order)} api-keys exhausted, the next token is available in {wait:.1f} seconds."
+            )
+        return None, wait
+
+    def acquire(self) -> str:
+        """Blocks until a key has quota left, takes a token of it and returns its `x-api-key` value."""
+        while True:
+            value, wait = self._try_acquire()
+            if value is not None:
+                return value
+            time.sleep(wait)
+
+    async def async_acquire(self) -> str:
+        """Waits without blocking the event loop until a key has quota left, takes a token of it and returns its `x-api-key` value."""
+        while True:
+            value, wait = self._try_acquire()
+            if value is not None:
+                return value
+            await asyncio.sleep(wait)
+
+    def release(self, value: str) -> None:
+        """
+        Gives back the slot of a request, that did not receive a response.
+
+        Args:
+            value (`str`): The `x-api-key` value returned by `acquire()`.
+        """
+        self._limiters[value].release()
+
+    def update(self, value: str, headers: t.Mapping[str, t.Any]) -> None:
+        """
+        Corrects the quota of a key with the ratelimit headers of a response.
+
+        Args:
+            value (`str`): The `x-api-key` value returned by `acquire()`.
+            headers (`Mapping`[`str`, `Any`]): The headers of the response.
+        """
+        self._limiters[value].update_info(RateLimitInfo.from_headers(headers))
@@ -1,7 +1,14 @@
 __all__ = [
     "APIResponse",
     "ResponseHeaders",
+    "RateLimitInfo",
+    "ClientMetrics",
+    "LazyXML",
+    "AsyncLazyXML",
 ]
 
 from wild_devs_api.models.response import *
 from wild_devs_api.models.response_headers import *
+from wild_devs_api.models.ratelimit_info import *
+from wild_devs_api.models.metrics import *
+from wild_devs_api.models.lazy_xml import *
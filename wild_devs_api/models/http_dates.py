@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+__all__ = [
+    "parse_http_date",
+    "parse_ratelimit_reset",
+    "parse_ratelimit_reset_timestamp",
+]
+
+import typing as t
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def parse_http_date(value: t.Optional[str]) -> t.Optional[datetime]:
+    """
+    Parses an HTTP date (RFC 7231), e.g. `Sun, 06 Nov 1994 08:49:37 GMT`, into a naive UTC `datetime`.
+    The preferred IMF-fixdate format is parsed by slicing, the obsolete formats fall back to `email.utils`.
+
+    Args:
+        value (Optional`str`): The value of a `Date`, `Expires` or `Last-Modified` header.
+
+    Returns:
+        Optional`datetime`: The parsed date or `None`, if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    if len(value) == 29 and value[3] == "," and value.endswith(" GMT"):
+        try:
+            return datetime(
+                int(value[12:16]),
+                _MONTHS[value[8:11]],
+                int(value[5:7]),
+                int(value[17:19]),
+                int(value[20:22]),
+                int(value[23:25]),
+            )
+        except (KeyError, ValueError):
+            return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_ratelimit_reset(value: t.Optional[str]) -> t.Optional[datetime]:
+    """
+    Parses the `x-ratelimit-reset` header of the API, e.g. `Tue Mar 14 2023 00:00:00 GMT+0000`, into an aware `datetime`.
+    A trailing time zone name in parentheses is ignored.
+
+    Args:
+        value (Optional`str`): The value of the header.
+
+    Returns:
+        Optional`datetime`: The parsed date or `None`, if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    parts = value.split(" ", 6)
+    if len(parts) < 6 or not parts[5].startswith("GMT"):
+        return None
+    offset = parts[5][3:]
+    try:
+        hour, minute, second = parts[4].split(":")
+        tz = timezone.utc
+        if offset:
+            sign = -1 if offset[0] == "-" else 1
+            tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])))
+        return datetime(
+            int(parts[3]),
+            _MONTHS[parts[1]],
+            int(parts[2]),
+            int(hour),
+            int(minute),
+            int(second),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def parse_ratelimit_reset_timestamp(value: t.Optional[str]) -> t.Optional[float]:
+    """
+    Parses the `x-ratelimit-reset` header of the API into a Unix timestamp, with integer arithmetic only.
+
+    Args:
+        value (Optional`str`): The value of the header, e.g. `Tue Mar 14 2023 00:00:00 GMT+0000`.
+
+    Returns:
+        Optional`float`: The Unix timestamp of the reset or `None`, if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    parts = value.split(" ", 6)
+    if len(parts) < 6 or not parts[5].startswith("GMT"):
+        return None
+    offset = parts[5][3:]
+    try:
+        hour, minute, second = parts[4].split(":")
+        month = _MONTHS[parts[1]]
+        offset_seconds = 0
+        if offset:
+            sign = -1 if offset[0] == "-" else 1
+            offset_seconds = sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+        days = _days_from_civil(int(parts[3]), month, int(parts[2]))
+        return float(
+            days * 86400 + int(hour) * 3600 + int(minute) * 60 + int(second) - offset_seconds
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """The days since 1970-01-01 of a proleptic Gregorian date."""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
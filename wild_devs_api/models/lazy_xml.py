@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+__all__ = [
+    "LazyXML",
+    "AsyncLazyXML",
+]
+
+import asyncio
+import threading
+import typing as t
+
+
+class LazyXML:
+    """
+    Deferred xml representation of an `APIResponse`, if `xml_mode="lazy"`.
+    The request for the xml representation is only sent on the first call of `fetch()` or `str()`.
+    """
+
+    _fetcher: t.Callable[[], str]
+    _value: t.Optional[str]
+    _lock: threading.Lock
+
+    def __init__(self, fetcher: t.Callable[[], str]) -> None:
+        self._fetcher = fetcher
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return self.fetch()
+
+    @property
+    def fetched(self) -> bool:
+        """Whether the xml representation has already been requested."""
+        return self._value is not None
+
+    def fetch(self) -> str:
+        """
+        Requests the xml representation on the first call and returns the cached value afterwards.
+
+        Returns:
+            `str`: The xml representation of the response.
+        """
+        with self._lock:
+            if self._value is None:
+                self._value = self._fetcher()
+            return self._value
+
+
+class AsyncLazyXML:
+    """
+    Deferred xml representation of an `APIResponse` returned by an async request, if `xml_mode="lazy"`.
+    The request for the xml representation is only sent when the object is awaited for the first time.
+    `str()` returns the received representation and raises a `RuntimeError`, if it has not been awaited yet.
+    """
+
+    _fetcher: t.Callable[[], t.Awaitable[str]]
+    _task: t.Optional[asyncio.Future[str]]
+
+    def __init__(self, fetcher: t.Callable[[], t.Awaitable[str]]) -> None:
+        self._fetcher = fetcher
+        self._task = None
+
+    def __await__(self) -> t.Generator[t.Any, None, str]:
+        return self.fetch().__await__()
+
+    def __str__(self) -> str:
+        if self._task is None or not self._task.done():
+            raise RuntimeError("The xml representation has not been received yet, await response.xml first.")
+        return self._task.result()
+
+    @property
+    def fetched(self) -> bool:
+        """Whether the xml representation has already been received."""
+        return (
+            self._task is not None
+            and self._task.done()
+            and not self._task.cancelled()
+            and self._task.exception() is None
+        )
+
+    async def fetch(self) -> str:
+        """
+        Requests the xml representation on the first call and returns the cached value afterwards.
+        Concurrent callers share the same request.
+
+        Returns:
+            `str`: The xml representation of the response.
+        """
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._fetcher())
+        return await asyncio.shield(self._task)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+__all__ = [
+    "ClientMetrics",
+]
+
+import threading
+import typing as t
+
+
+class ClientMetrics:
+    """
+    Class representation of the counters collected by a `RESTClient`.
+    All counters are cumulative since the creation of the client.
+    """
+
+    _requests_sent: int
+    _xml_requests_saved: int
+    _xml_round_trips_saved: int
+    _retries: int
+    _revalidation_bytes_saved: int
+    _response_bytes_saved: int
+    _request_bytes_saved: int
+    _loop_time_saved: float
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __str__(self) -> str:
+        return f"{self.as_dict}"
+
+    def increment(self, name: str, amount: t.Union[int, float] = 1) -> None:
+        """
+        Thread-safe helper method to increase a counter.
+
+        Args:
+            name (`str`): The name of the counter, e.g. `requests_sent`.
+            amount (`int` | `float`): The amount to add to the counter. Default is `1`.
+        """
+        with self._lock:
+            setattr(self, f"_{name}", getattr(self, f"_{name}") + amount)
+
+    def reset(self) -> None:
+        """Sets all counters back to zero."""
+        with self._lock:
+            self._requests_sent = 0
+            self._xml_requests_saved = 0
+            self._xml_round_trips_saved = 0
+            self._retries = 0
+            self._revalidation_bytes_saved = 0
+            self._response_bytes_saved = 0
+            self._request_bytes_saved = 0
+            self._loop_time_saved = 0.0
+
+    @property
+    def requests_sent(self) -> int:
+        """The amount of HTTP requests that have been sent."""
+        return self._requests_sent
+
+    @property
+    def xml_requests_saved(self) -> int:
+        """The amount of HTTP requests saved by fetching only the XML representation, if `xml_mode="single"`."""
+        return self._xml_requests_saved
+
+    @property
+    def xml_round_trips_saved(self) -> int:
+        """The amount of sequential round trips saved for requests with `xml=True`."""
+        return self._xml_round_trips_saved
+
+    @property
+    def retries(self) -> int:
+        """The amount of requests that have been retried by the `RetryPolicy`."""
+        return self._retries
+
+    @property
+    def revalidation_bytes_saved(self) -> int:
+        """The amount of response bytes not downloaded again, because a cached response was confirmed with a 304 response."""
+        return self._revalidation_bytes_saved
+
+    @property
+    def response_bytes_saved(self) -> int:
+        """The amount of response bytes not transferred, because the API compressed the response. Measured with the `Content-Length` header."""
+        return self._response_bytes_saved
+
+    @property
+    def request_bytes_saved(self) -> int:
+        """The amount of request bytes not transferred, because the payload was compressed."""
+        return self._request_bytes_saved
+
+    @property
+    def loop_time_saved(self) -> float:
+        """The time in seconds, by which decoding large responses shortened the longest blocking of the event loop.
+        Adds the decode time of responses decoded in the `decode_executor`. Responses decoded in slices add the estimated time
+        of decoding them at once with the `json_codec` minus their longest slice. Responses decoded at once on the event loop add nothing."""
+        return self._loop_time_saved
+
+    @property
+    def as_dict(self) -> dict[str, t.Union[int, float]]:
+        """The dictionary representation of the `ClientMetrics`."""
+        return {
+            "requests_sent": self.requests_sent,
+            "xml_requests_saved": self.xml_requests_saved,
+            "xml_round_trips_saved": self.xml_round_trips_saved,
+            "retries": self.retries,
+            "revalidation_bytes_saved": self.revalidation_bytes_saved,
+            "response_bytes_saved": self.response_bytes_saved,
+            "request_bytes_saved": self.request_bytes_saved,
+            "loop_time_saved": self.loop_time_saved,
+        }
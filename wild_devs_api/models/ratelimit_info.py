@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+__all__ = [
+    "RateLimitInfo",
+]
+
+import typing as t
+
+from wild_devs_api.models.http_dates import parse_ratelimit_reset_timestamp
+
+
+class RateLimitInfo:
+    """
+    Lightweight class representation of the ratelimit headers of a response.
+    Available on every `APIResponse`, without the cost of parsing the `ResponseHeaders`.
+    Missing or invalid headers are `None`.
+    """
+
+    __slots__ = ("_limit", "_remaining", "_reset", "_retry_after")
+
+    _limit: t.Optional[int]
+    _remaining: t.Optional[int]
+    _reset: t.Optional[float]
+    _retry_after: t.Optional[float]
+
+    def __init__(
+        self,
+        *,
+        limit: t.Optional[int] = None,
+        remaining: t.Optional[int] = None,
+        reset: t.Optional[float] = None,
+        retry_after: t.Optional[float] = None,
+    ) -> None:
+        self._limit = limit
+        self._remaining = remaining
+        self._reset = reset
+        self._retry_after = retry_after
+
+    @classmethod
+    def from_headers(cls, headers: t.Mapping[str, t.Any]) -> RateLimitInfo:
+        """
+        Reads the `x-ratelimit-limit`, `x-ratelimit-remaining`, `x-ratelimit-reset` and `x-ratelimit-retry-after` headers.
+        The headers are looked up case-insensitively, also in plain dictionaries, e.g. of cached responses.
+
+        Args:
+            headers (`Mapping`[`str`, `Any`]): The headers of the response.
+        """
+        if "x-ratelimit-limit" not in headers:
+            headers = {k.lower(): v for k, v in headers.items()}
+        return cls(
+            limit=_number(int, headers.get("x-ratelimit-limit")),
+            remaining=_number(int, headers.get("x-ratelimit-remaining")),
+            reset=parse_ratelimit_reset_timestamp(headers.get("x-ratelimit-reset")),
+            retry_after=_number(float, headers.get("x-ratelimit-retry-after")),
+        )
+
+    def __str__(self) -> str:
+        return f"Limit: {self.limit}\nRemaining: {self.remaining}\nReset: {self.reset}\nRetryAfter: {self.retry_after}"
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimitInfo(limit={self.limit!r}, remaining={self.remaining!r}, "
+            f"reset={self.reset!r}, retry_after={self.retry_after!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RateLimitInfo):
+            return NotImplemented
+        return (self.limit, self.remaining, self.reset, self.retry_after) == (
+            other.limit,
+            other.remaining,
+            other.reset,
+            other.retry_after,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.limit, self.remaining, self.reset, self.retry_after))
+
+    @property
+    def limit(self) -> t.Optional[int]:
+        """The ratelimit of the API key."""
+        return self._limit
+
+    @property
+    def remaining(self) -> t.Optional[int]:
+        """The remaining amount of requests before the reset."""
+        return self._remaining
+
+    @property
+    def reset(self) -> t.Optional[float]:
+        """The Unix timestamp, when the ratelimit gets reset."""
+        return self._reset
+
+    @property
+    def retry_after(self) -> t.Optional[float]:
+        """The time in seconds until the next reset, as sent by the API."""
+        return self._retry_after
+
+    def reset_in(self, now: float) -> t.Optional[float]:
+        """
+        The time in seconds until the ratelimit gets reset. `retry_after` is preferred over `reset`.
+
+        Args:
+            now (`float`): The current Unix timestamp, e.g. `time.time()`.
+        """
+        if self.retry_after is not None:
+            return max(0.0, self.retry_after)
+        if self.reset is not None:
+            return max(0.0, self.reset - now)
+        return None
+
+
+def _number(cast: t.Callable[[t.Any], t.Any], value: t.Any) -> t.Any:
+    if value is None:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        return None
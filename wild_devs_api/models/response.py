@@ -5,25 +5,29 @@ __all__ = [
 ]
 
 import typing as t
-from dataclasses import dataclass
 
 from wild_devs_api.errors.errors import send_error_response
+from wild_devs_api.models.lazy_xml import AsyncLazyXML, LazyXML
+from wild_devs_api.models.ratelimit_info import RateLimitInfo
 from wild_devs_api.models.response_headers import ResponseHeaders
 
+_NO_RATELIMIT = RateLimitInfo()
+"""Shared by all responses without ratelimit headers. `RateLimitInfo` is immutable."""
+
 
-@dataclass
 class APIResponse:
     """
     Class representation of the API response.
+    Responses are immutable. The decoded body is kept once, `headers` and `as_dict` are built from it on first access.
     """
 
-    _status: str
-    _code: int
-    _message: str
-    _data: t.Any
-    _headers: ResponseHeaders
-    _as_dict: t.Union[dict[str, str], dict[dict[str, t.Any], dict[str, str]]]
-    _xml: str
+    __slots__ = ("_body", "_raw_headers", "_headers", "_xml", "_ratelimit")
+
+    _body: dict[str, t.Any]
+    _raw_headers: t.Optional[t.Mapping[str, t.Any]]
+    _headers: t.Optional[ResponseHeaders]
+    _xml: t.Union[str, LazyXML, AsyncLazyXML]
+    _ratelimit: RateLimitInfo
 
     def __init__(
         self,
@@ -32,85 +36,97 @@ class APIResponse:
         headers: t.Optional[
             t.Union[t.MutableMapping[str, t.Any], t.Mapping[str, t.Any]]
         ] = None,
-        xml: str,
+        xml: t.Union[str, LazyXML, AsyncLazyXML],
+        ratelimit: t.Optional[RateLimitInfo] = None,
     ) -> None:
         if data["code"] >= 400:
             raise send_error_response(data)
-        self.status = data["status"]
-        self.code = data["code"]
-        self.message = data["message"]
-        self.data = data["data"]
-        self.xml = xml
-        if headers:
-            self.as_dict = {"Response": data, "Headers": headers}
-            self.headers = ResponseHeaders(headers)
-        else:
-            self.as_dict = data
+        if ratelimit is None:
+            ratelimit = RateLimitInfo.from_headers(headers) if headers else _NO_RATELIMIT
+        object.__setattr__(self, "_body", data)
+        object.__setattr__(self, "_raw_headers", headers or None)
+        object.__setattr__(self, "_headers", None)
+        object.__setattr__(self, "_xml", xml)
+        object.__setattr__(self, "_ratelimit", ratelimit)
 
     def __str__(self) -> str:
         return f"{self.as_dict}"
 
+    def __repr__(self) -> str:
+        return f"APIResponse(status={self.status!r}, code={self.code!r}, message={self.message!r}, data={self.data!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, APIResponse):
+            return NotImplemented
+        return (self._body, self._raw_headers, self._xml) == (
+            other._body,
+            other._raw_headers,
+            other._xml,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"APIResponse is immutable, can't set {name!r}.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"APIResponse is immutable, can't delete {name!r}.")
+
+    def __getstate__(self) -> tuple[t.Any, ...]:
+        # The headers of aiohttp responses are a CIMultiDictProxy, which can't be pickled.
+        raw_headers = None if self._raw_headers is None else dict(self._raw_headers)
+        return self._body, raw_headers, self._xml, self._ratelimit
+
+    def __setstate__(self, state: tuple[t.Any, ...]) -> None:
+        body, raw_headers, xml, ratelimit = state
+        object.__setattr__(self, "_body", body)
+        object.__setattr__(self, "_raw_headers", raw_headers)
+        object.__setattr__(self, "_headers", None)
+        object.__setattr__(self, "_xml", xml)
+        object.__setattr__(self, "_ratelimit", ratelimit)
+
     @property
-    def status(self):
+    def status(self) -> str:
         """The status of the response."""
-        return self._status
-
-    @status.setter
-    def status(self, value: str):
-        self._status = value
+        return self._body["status"]
 
     @property
-    def code(self):
+    def code(self) -> int:
         """The status code of the response."""
-        return self._code
-
-    @code.setter
-    def code(self, value: int):
-        self._code = value
+        return self._body["code"]
 
     @property
-    def message(self):
+    def message(self) -> str:
         """The message of the response"""
-        return self._message
-
-    @message.setter
-    def message(self, value: str):
-        self._message = value
+        return self._body["message"]
 
     @property
-    def data(self):
+    def data(self) -> t.Any:
         """The content of the response."""
-        return self._data
-
-    @data.setter
-    def data(self, value: dict[str, t.Any]):
-        self._data = value
+        return self._body["data"]
 
     @property
-    def headers(self):
+    def headers(self) -> t.Optional[ResponseHeaders]:
         """The `ResponseHeaders` of the response. Will only be present if `return_headers=True` in the request method."""
+        if self._headers is None and self._raw_headers is not None:
+            object.__setattr__(self, "_headers", ResponseHeaders(self._raw_headers))
         return self._headers
 
-    @headers.setter
-    def headers(self, value: ResponseHeaders):
-        self._headers = value
+    @property
+    def ratelimit(self) -> RateLimitInfo:
+        """The `RateLimitInfo` of the response. Always present, also without `return_headers=True`.
+        Empty for responses served from the `ResponseCache`, since their ratelimit headers may be outdated."""
+        return self._ratelimit
 
     @property
-    def as_dict(self):
+    def as_dict(self) -> t.Union[dict[str, t.Any], dict[str, t.Mapping[str, t.Any]]]:
         """Dictionary representation of the response data. Will be a dictionary of dictionaries if `return_headers=True` in the request method."""
-        return self._as_dict
-
-    @as_dict.setter
-    def as_dict(
-        self, value: t.Union[dict[str, t.Any], dict[dict[str, t.Any], dict[str, str]]]
-    ):
-        self._as_dict = value
+        if self._raw_headers is None:
+            return self._body
+        return {"Response": self._body, "Headers": self._raw_headers}
 
     @property
-    def xml(self) -> str:
-        """The xml representation, if `xml=True` in the request method."""
+    def xml(self) -> t.Union[str, LazyXML, AsyncLazyXML]:
+        """The xml representation, if `xml=True` in the request method.
+        Will be a `LazyXML` or `AsyncLazyXML` that fetches the representation on first access, if `xml_mode="lazy"`."""
         return self._xml
-
-    @xml.setter
-    def xml(self, value: str) -> None:
-        self._xml = value
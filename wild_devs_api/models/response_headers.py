@@ -7,181 +7,175 @@ __all__ = [
 from datetime import datetime
 import typing as t
 
+from wild_devs_api.models.http_dates import parse_http_date, parse_ratelimit_reset
+
+_UNPARSED: t.Any = object()
+
 
 class ResponseHeaders:
     """
     Class representation of the response headers of a `APIResponse`.
+    Headers are read from the raw mapping on access, the dates are parsed once on first access.
+    Missing or invalid headers are `None`.
     """
 
-    _server: str
-    _date: datetime
-    _content_type: str
-    _content_length: int
-    _connection: str
-    _x_powered_by: str
-    _access_control_allow_origin: str
-    _access_control_allow_headers: str
-    _x_ratelimit_retry_after: float
-    _x_ratelimit_limit: int
-    _x_ratelimit_remaining: int
-    _x_ratelimit_reset: datetime
-    _etag: str
-    _vary: str
-    _strict_transport_security: str
-    _referrer_policy: str
-    _x_content_type_options: str
-    _x_download_options: str
-    _x_frame_options: str
-    _x_permitted_cross_domain_policies: str
-    _x_robots_tag: str
-    _x_xss_protection: str
+    __slots__ = ("_as_dict", "_lower", "_date", "_x_ratelimit_reset")
+
     _as_dict: t.Union[t.MutableMapping[str, t.Any], t.Mapping[str, t.Any]]
+    _lower: t.Optional[dict[str, t.Any]]
+    _date: t.Optional[datetime]
+    _x_ratelimit_reset: t.Optional[datetime]
 
     def __init__(
         self, headers: t.Union[t.MutableMapping[str, t.Any], t.Mapping[str, t.Any]]
     ) -> None:
-        self._server = headers["Server"]
-        self._date = datetime.strptime(headers["Date"], "%a, %d %b %Y %H:%M:%S %Z")
-        self._content_type = headers["Content-Type"]
-        self._content_length = int(headers["Content-Length"])
-        self._connection = headers["Connection"]
-        self._x_powered_by = headers["X-Powered-By"]
-        self._access_control_allow_origin = headers["Access-Control-Allow-Origin"]
-        self._access_control_allow_headers = headers["Access-Control-Allow-Headers"]
-        self._x_ratelimit_retry_after = float(headers["x-ratelimit-retry-after"])
-        self._x_ratelimit_limit = int(headers["x-ratelimit-limit"])
-        self._x_ratelimit_remaining = int(headers["x-ratelimit-remaining"])
-        self._x_ratelimit_reset = datetime.strptime(
-            headers["x-ratelimit-reset"], "%a %b %d %Y %H:%M:%S %Z%z"
-        )
-        self._etag = headers["ETag"]
-        self._vary = headers["Vary"]
-        self._strict_transport_security = headers["Strict-Transport-Security"]
-        self._referrer_policy = headers["Referrer-Policy"]
-        self._x_content_type_options = headers["X-Content-Type-Options"]
-        self._x_download_options = headers["X-Download-Options"]
-        self._x_frame_options = headers["X-Frame-Options"]
-        self._x_permitted_cross_domain_policies = headers[
-            "X-Permitted-Cross-Domain-Policies"
-        ]
-        self._x_robots_tag = headers["X-Robots-Tag"]
-        self._x_xss_protection = headers["X-XSS-Protection"]
         self._as_dict = headers
+        self._lower = None
+        self._date = _UNPARSED
+        self._x_ratelimit_reset = _UNPARSED
 
     def __str__(self) -> str:
         return f"{self.as_dict}"
 
-    @property
-    def server(self):
+    def _get(self, name: str) -> t.Optional[str]:
+        """Looks up a header case-insensitively, also in plain dictionaries, e.g. of cached responses."""
+        try:
+            return self._as_dict[name]
+        except KeyError:
+            pass
+        if self._lower is None:
+            self._lower = {k.lower(): v for k, v in self._as_dict.items()}
+        return self._lower.get(name.lower())
+
+    def _int(self, name: str) -> t.Optional[int]:
+        value = self._get(name)
+        try:
+            return None if value is None else int(value)
+        except ValueError:
+            return None
+
+    def _float(self, name: str) -> t.Optional[float]:
+        value = self._get(name)
+        try:
+            return None if value is None else float(value)
+        except ValueError:
+            return None
+
+    @property
+    def server(self) -> t.Optional[str]:
         """The type of server, that the API uses."""
-        return self._server
+        return self._get("Server")
 
     @property
-    def date(self):
+    def date(self) -> t.Optional[datetime]:
         """The timestamp of the response."""
+        if self._date is _UNPARSED:
+            self._date = parse_http_date(self._get("Date"))
         return self._date
 
     @property
-    def content_type(self):
+    def content_type(self) -> t.Optional[str]:
         """The content type of the response."""
-        return self._content_type
+        return self._get("Content-Type")
 
     @property
-    def content_length(self):
+    def content_length(self) -> t.Optional[int]:
         """The length of the response content."""
-        return self._content_length
+        return self._int("Content-Length")
 
     @property
-    def connection(self):
+    def connection(self) -> t.Optional[str]:
         """The type of connection for requests to the API server."""
-        return self._connection
+        return self._get("Connection")
 
     @property
-    def x_powered_by(self):
+    def x_powered_by(self) -> t.Optional[str]:
         """The name of the API server."""
-        return self._x_powered_by
+        return self._get("X-Powered-By")
 
     @property
-    def access_control_allow_origin(self):
+    def access_control_allow_origin(self) -> t.Optional[str]:
         """The origins allowed to make requests from."""
-        return self._access_control_allow_origin
+        return self._get("Access-Control-Allow-Origin")
 
     @property
-    def access_control_allow_headers(self):
+    def access_control_allow_headers(self) -> t.Optional[str]:
         """The headers that can be sent to the API."""
-        return self._access_control_allow_headers
+        return self._get("Access-Control-Allow-Headers")
 
     @property
-    def x_ratelimit_retry_after(self):
+    def x_ratelimit_retry_after(self) -> t.Optional[float]:
         """The time in seconds until the next reset."""
-        return self._x_ratelimit_retry_after
+        return self._float("x-ratelimit-retry-after")
 
     @property
-    def x_ratelimit_limit(self):
+    def x_ratelimit_limit(self) -> t.Optional[int]:
         """The daily ratelimit."""
-        return self._x_ratelimit_limit
+        return self._int("x-ratelimit-limit")
 
     @property
-    def x_ratelimit_remaining(self):
+    def x_ratelimit_remaining(self) -> t.Optional[int]:
         """The remaining amount of requests before reset."""
-        return self._x_ratelimit_remaining
+        return self._int("x-ratelimit-remaining")
 
     @property
-    def x_ratelimit_reset(self):
+    def x_ratelimit_reset(self) -> t.Optional[datetime]:
         """The date, when the ratelimit gets reset."""
+        if self._x_ratelimit_reset is _UNPARSED:
+            self._x_ratelimit_reset = parse_ratelimit_reset(self._get("x-ratelimit-reset"))
         return self._x_ratelimit_reset
 
     @property
-    def etag(self):
+    def etag(self) -> t.Optional[str]:
         """The resource identifier for the request."""
-        return self._etag
+        return self._get("ETag")
 
     @property
-    def vary(self):
+    def vary(self) -> t.Optional[str]:
         """The parts of the request message aside from the method and URL."""
-        return self._vary
+        return self._get("Vary")
 
     @property
-    def strict_transport_security(self):
+    def strict_transport_security(self) -> t.Optional[str]:
         """The information sent to browsers, that sites should only be accessed using HTTPS."""
-        return self._strict_transport_security
+        return self._get("Strict-Transport-Security")
 
     @property
-    def referrer_policy(self):
+    def referrer_policy(self) -> t.Optional[str]:
         """The amount of referrer information, that should be included with requests."""
-        return self._referrer_policy
+        return self._get("Referrer-Policy")
 
     @property
-    def x_content_type_options(self):
+    def x_content_type_options(self) -> t.Optional[str]:
         """The indication if MIME types in the `content_type` header should be followed."""
-        return self._x_content_type_options
+        return self._get("X-Content-Type-Options")
 
     @property
-    def x_download_options(self):
+    def x_download_options(self) -> t.Optional[str]:
         """The instruction to the browser, that downloads shouldn't directly be started."""
-        return self._x_download_options
+        return self._get("X-Download-Options")
 
     @property
-    def x_frame_options(self):
+    def x_frame_options(self) -> t.Optional[str]:
         """The indication if a browser should be allowed to render a page."""
-        return self._x_frame_options
+        return self._get("X-Frame-Options")
 
     @property
-    def x_permitted_cross_domain_policies(self):
+    def x_permitted_cross_domain_policies(self) -> t.Optional[str]:
         """The allowance of a cross-domain policy file."""
-        return self._x_permitted_cross_domain_policies
+        return self._get("X-Permitted-Cross-Domain-Policies")
 
     @property
-    def x_robots_tag(self):
+    def x_robots_tag(self) -> t.Optional[str]:
         """The indication how a web page is to be indexed within public search engine results."""
-        return self._x_robots_tag
+        return self._get("X-Robots-Tag")
 
     @property
-    def x_xss_protection(self):
+    def x_xss_protection(self) -> t.Optional[str]:
         """The filtering used when cross-site scripting attacks get detected."""
-        return self._x_xss_protection
+        return self._get("X-XSS-Protection")
 
     @property
-    def as_dict(self):
+    def as_dict(self) -> t.Union[t.MutableMapping[str, t.Any], t.Mapping[str, t.Any]]:
         """The dictionary representation of the `ResponseHeaders`."""
         return self._as_dict
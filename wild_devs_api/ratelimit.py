@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+__all__ = [
+    "RateLimiter",
+    "SharedRateLimiter",
+]
+
+import asyncio
+import contextlib
+import mmap
+import os
+import struct
+import threading
+import time
+import typing as t
+
+from wild_devs_api.errors.errors import TooManyRequestsError
+from wild_devs_api.models.ratelimit_info import RateLimitInfo
+
+
+class RateLimiter:
+    """
+    Client-side token bucket of a `RESTClient`.
+    The bucket is seeded and corrected from the `x-ratelimit-limit`, `x-ratelimit-remaining`,
+    `x-ratelimit-retry-after` and `x-ratelimit-reset` headers of every response.
+    Requests wait for a token instead of being sent to the API once the quota is used up.
+    """
+
+    _limit: t.Optional[int]
+    _tokens: t.Optional[float]
+    _reset_at: t.Optional[float]
+    _in_flight: int
+    _max_wait: t.Optional[float]
+    _lock: threading.Lock
+    _clock: t.ClassVar[t.Callable[[], float]] = staticmethod(time.monotonic)
+
+    def __init__(self, *, max_wait: t.Optional[float] = None) -> None:
+        self._limit = None
+        self._tokens = None
+        self._reset_at = None
+        self._in_flight = 0
+        self._max_wait = max_wait
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"Limit: {self.limit}\nRemaining: {self.remaining}\nResetIn: {self.reset_in}"
+
+    @property
+    def limit(self) -> t.Optional[int]:
+        """The last known ratelimit. `None` until the first response has been received."""
+        with self._state():
+            return self._limit
+
+    @property
+    def remaining(self) -> t.Optional[int]:
+        """The amount of tokens left in the bucket. `None` until the first response has been received."""
+        with self._state():
+            return None if self._tokens is None else int(self._tokens)
+
+    @property
+    def reset_in(self) -> t.Optional[float]:
+        """The time in seconds until the bucket gets refilled, if known."""
+        with self._state():
+            if self._reset_at is None:
+                return None
+            return max(0.0, self._reset_at - self._clock())
+
+    @property
+    def max_wait(self) -> t.Optional[float]:
+        """The longest time in seconds to wait for a token. Default is `None`, which waits until the reset.
+        A `TooManyRequestsError` is raised, if the wait would be longer."""
+        return self._max_wait
+
+    @contextlib.contextmanager
+    def _state(self) -> t.Iterator[None]:
+        """Holds the lock of the bucket while its state is read or changed."""
+        with self._lock:
+            yield
+
+    def _try_acquire(self) -> float:
+        """Takes a token and returns `0`, or returns the time to wait for the next refill."""
+        with self._state():
+            now = self._clock()
+            if self._reset_at is not None and now >= self._reset_at:
+                self._tokens = None if self._limit is None else float(self._limit)
+                self._reset_at = None
+            if self._tokens is None or self._tokens >= 1:
+                if self._tokens is not None:
+                    self._tokens -= 1
+                self._in_flight += 1
+                return 0.0
+            if self._reset_at is None:
+                self._tokens = None
+                self._in_flight += 1
+                return 0.0
+            wait = self._reset_at - now
+        if self.max_wait is not None and wait > self.max_wait:
+            raise TooManyRequestsError(
+                f"Ratelimit exhausted, the next token is available in {wait:.1f} seconds."
+            )
+        return wait
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        while wait := self._try_acquire():
+            time.sleep(wait)
+
+    async def async_acquire(self) -> None:
+        """Waits without blocking the event loop until a token is available and takes it."""
+        while wait := self._try_acquire():
+            await asyncio.sleep(wait)
+
+    def release(self) -> None:
+        """Gives back the slot of a request, that did not receive a response."""
+        with self._state():
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def update(self, headers: t.Mapping[str, t.Any]) -> None:
+        """
+        Corrects the bucket with the ratelimit headers of a response.
+
+        Args:
+            headers (`Mapping`[`str`, `Any`]): The headers of the response.
+        """
+        self.update_info(RateLimitInfo.from_headers(headers))
+
+    def update_info(self, info: RateLimitInfo) -> None:
+        """
+        Corrects the bucket with the `RateLimitInfo` of a response.
+
+        Args:
+            info (`RateLimitInfo`): The ratelimit of the response.
+        """
+        reset_in = info.reset_in(time.time())
+        with self._state():
+            self._in_flight = max(0, self._in_flight - 1)
+            if info.limit is None or info.remaining is None:
+                return
+            self._limit = info.limit
+            self._tokens = float(max(0, info.remaining - self._in_flight))
+            if reset_in is not None:
+                self._reset_at = self._clock() + reset_in
+
+
+_SHARED_STATE = struct.Struct("<4sqddq")
+"""The layout of a `SharedRateLimiter` file: magic, limit, tokens, reset timestamp and requests in flight.
+Unknown values are stored as `-1` or `NaN`."""
+
+_SHARED_MAGIC = b"WDRL"
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket shared by all processes on a host, e.g. the workers of a preforking server.
+    The state lives in a memory-mapped file, that is locked with `fcntl.lockf` while it is read or changed.
+    Every process reconciles it with the ratelimit headers of its own responses, so all processes together stay within the quota.
+    Only available on Unix.
+    """
+
+    _path: str
+    _fd: int
+    _map: mmap.mmap
+    _clock = staticmethod(time.time)
+
+    def __init__(
+        self,
+        path: t.Union[str, os.PathLike[str]],
+        *,
+        max_wait: t.Optional[float] = None,
+    ) -> None:
+        try:
+            import fcntl
+        except ImportError as e:
+            raise ImportError("SharedRateLimiter requires fcntl, which is only available on Unix.") from e
+        super().__init__(max_wait=max_wait)
+        self._path = os.fspath(path)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < _SHARED_STATE.size:
+                os.ftruncate(self._fd, _SHARED_STATE.size)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, _SHARED_STATE.size)
+
+    @property
+    def path(self) -> str:
+        """The path of the file holding the shared state. All processes using the same path share one bucket."""
+        return self._path
+
+    def close(self) -> None:
+        """Unmaps and closes the state file. The shared state is kept for the other processes."""
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
+
+    def _try_acquire(self) -> float:
+        """Forgets the requests in flight once the bucket is refilled, before taking a token.
+        Otherwise the slots of processes, that died during a request, would never be given back."""
+        with self._state():
+            if self._reset_at is not None and self._clock() >= self._reset_at:
+                self._in_flight = 0
+        return super()._try_acquire()
+
+    @contextlib.contextmanager
+    def _state(self) -> t.Iterator[None]:
+        """Holds the lock of the bucket in this process and the lock of the state file, and loads the shared state.
+        The state is stored again, once it has been changed."""
+        import fcntl
+
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                self._load()
+                yield
+                self._store()
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        magic, limit, tokens, reset_at, in_flight = _SHARED_STATE.unpack_from(self._map)
+        if magic != _SHARED_MAGIC:
+            self._limit, self._tokens, self._reset_at, self._in_flight = None, None, None, 0
+            return
+        self._limit = None if limit < 0 else limit
+        self._tokens = None if tokens != tokens else tokens
+        self._reset_at = None if reset_at != reset_at else reset_at
+        self._in_flight = in_flight
+
+    def _store(self) -> None:
+        nan = float("nan")
+        _SHARED_STATE.pack_into(
+            self._map,
+            0,
+            _SHARED_MAGIC,
+            -1 if self._limit is None else self._limit,
+            nan if self._tokens is None else self._tokens,
+            nan if self._reset_at is None else self._reset_at,
+            self._in_flight,
+        )
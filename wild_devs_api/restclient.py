@@ -4,13 +4,45 @@ __all__ = [
     "RESTClient",
 ]
 
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import threading
+import time
 import typing as t
+from xml.etree import ElementTree
 
-import requests
-import aiohttp
-
+from wild_devs_api.cache.entry import CacheEntry
+from wild_devs_api.codec import JSONCodec, default_json_codec
+from wild_devs_api.compression import accept_encoding, compress_body
+from wild_devs_api.cache.response_cache import ResponseCache
+from wild_devs_api.models.lazy_xml import AsyncLazyXML, LazyXML
+from wild_devs_api.models.metrics import ClientMetrics
+from wild_devs_api.models.ratelimit_info import RateLimitInfo
 from wild_devs_api.models.response import APIResponse
-from wild_devs_api.errors.errors import send_error_response
+from wild_devs_api.errors.errors import WildDevsError, send_error_response
+from wild_devs_api.keypool import APIKeyPool
+from wild_devs_api.ratelimit import RateLimiter
+from wild_devs_api.retry import RetryPolicy
+from wild_devs_api.singleflight import SingleFlight
+from wild_devs_api.streaming import DataStreamParser
+
+if t.TYPE_CHECKING:
+    import aiohttp
+    import requests
+    import urllib3
+
+T = t.TypeVar("T")
+
+_LOCK_POLL_INTERVAL = 0.05
+"""The time in seconds between the checks of a caller waiting for the refresh of a missing response by another caller."""
+
+_MIN_ATTEMPT_TIMEOUT = 0.001
+"""The timeout in seconds of an attempt, that starts after the deadline of its call has passed, e.g. while waiting for the `RateLimiter`."""
+
+_DECODE_SLICE_SIZE = 64 * 1024
+"""The amount of bytes of a large response decoded at once, before control is given back to the event loop."""
 
 
 class RESTClient:
@@ -20,18 +52,103 @@ class RESTClient:
     """
 
     _base_url: str
-    _timeout: int
+    _timeout: float
+    _connect_timeout: t.Optional[float]
+    _read_timeout: t.Optional[float]
     _headers: dict[str, t.Any]
-    _session: aiohttp.ClientSession
+    _pool_size: int
+    _sync_session: t.Optional[requests.Session]
+    _session: t.Optional[aiohttp.ClientSession]
+    _session_loop: t.Optional[asyncio.AbstractEventLoop]
+    _session_keeper: t.Optional[asyncio.Task[None]]
+    _connector_limit: int
+    _connector_limit_per_host: int
+    _keepalive_timeout: float
+    _ttl_dns_cache: t.Optional[int]
+    _xml_mode: str
+    _executor: t.Optional[concurrent.futures.ThreadPoolExecutor]
+    _metrics: ClientMetrics
+    _retry: t.Optional[RetryPolicy]
+    _rate_limiter: t.Optional[RateLimiter]
+    _key_pool: t.Optional[APIKeyPool]
+    _cache: t.Optional[ResponseCache]
+    _single_flight: t.Optional[SingleFlight]
+    _compression: bool
+    _compress_min_size: t.Optional[int]
+    _json_codec: JSONCodec
+    _decode_offload_size: t.Optional[int]
+    _decode_executor: t.Optional[concurrent.futures.Executor]
+    _refresh_tasks: set[asyncio.Task[t.Any]]
 
-    def __init__(self, base_url: str, timeout: int, headers: dict[str, t.Any]) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        headers: dict[str, t.Any],
+        *,
+        connect_timeout: t.Optional[float] = None,
+        read_timeout: t.Optional[float] = None,
+        pool_size: int = 10,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        ttl_dns_cache: t.Optional[int] = 10,
+        xml_mode: str = "concurrent",
+        retry: t.Optional[RetryPolicy] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        key_pool: t.Optional[APIKeyPool] = None,
+        cache: t.Optional[ResponseCache] = None,
+        single_flight: t.Optional[SingleFlight] = None,
+        compression: bool = True,
+        compress_min_size: t.Optional[int] = None,
+        json_codec: t.Optional[JSONCodec] = None,
+        decode_offload_size: t.Optional[int] = 1024 * 1024,
+        decode_executor: t.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
         self.headers = headers
+        self.pool_size = pool_size
+        self._sync_session = None
+        self._session = None
+        self._session_loop = None
+        self._session_keeper = None
+        self._connector_limit = connector_limit
+        self._connector_limit_per_host = connector_limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self.xml_mode = xml_mode
+        self._executor = None
+        self._metrics = ClientMetrics()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.key_pool = key_pool
+        self.cache = cache
+        self.single_flight = single_flight
+        self._compression = compression
+        self.compress_min_size = compress_min_size
+        self.json_codec = json_codec
+        self.decode_offload_size = decode_offload_size
+        self.decode_executor = decode_executor
+        self._refresh_tasks = set()
 
     def __str__(self) -> str:
         return f"BaseURL: {self.base_url}\nTimeout: {self.timeout}"
 
+    def __enter__(self) -> RESTClient:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> RESTClient:
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.async_close()
+
     @property
     def base_url(self):
         """The baseURL for all requests. Default is https://api.wild-devs.net/v1/."""
@@ -47,19 +164,77 @@ class RESTClient:
 
     @property
     def timeout(self):
-        """The amount of time to wait for a response, when a request has been made.
+        """The total amount of time to wait for a response, when a request has been made.
         Default is 30 seconds.
-        Can be set between 5 seconds and 30 seconds."""
+        Can be set to more than 0 seconds and up to 30 seconds.
+        Can be overridden per request with the `timeout` keyword argument of every request method, which must be greater than 0.
+        Asynchronous requests are cancelled once it has passed. Synchronous requests only apply it to connecting and to
+        receiving the response headers, reading the body is limited by the `read_timeout` between two received chunks."""
         return self._timeout
 
     @timeout.setter
-    def timeout(self, value: int):
-        if value > 30 or value < 5:
-            print("Timeout must be a value between 5 and 30!")
+    def timeout(self, value: float):
+        if value > 30 or value <= 0:
+            print("Timeout must be a value greater than 0 and up to 30!")
             self._timeout = 30
         else:
             self._timeout = value
 
+    @property
+    def connect_timeout(self) -> t.Optional[float]:
+        """The amount of time to wait for a connection to the API server. Default is `None`, which only applies the total `timeout`."""
+        return self._connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, value: t.Optional[float]):
+        if value is not None and value <= 0:
+            print("Connect timeout must be a value greater than 0!")
+            self._connect_timeout = None
+        else:
+            self._connect_timeout = value
+
+    @property
+    def read_timeout(self) -> t.Optional[float]:
+        """The amount of time to wait between two reads of the response. Default is `None`, which only applies the total `timeout`."""
+        return self._read_timeout
+
+    @read_timeout.setter
+    def read_timeout(self, value: t.Optional[float]):
+        if value is not None and value <= 0:
+            print("Read timeout must be a value greater than 0!")
+            self._read_timeout = None
+        else:
+            self._read_timeout = value
+
+    def _total_timeout(self, timeout: t.Optional[float]) -> float:
+        """The total timeout of a request: the `timeout` keyword argument or the `timeout` of the client."""
+        if timeout is None:
+            return self.timeout
+        if timeout <= 0:
+            print("Timeout must be a value greater than 0! The timeout of the client is used.")
+            return self.timeout
+        return timeout
+
+    def _sync_timeout(self, total: float) -> urllib3.Timeout:
+        """urllib3 only applies `total` to connecting and to waiting for the response headers.
+        Reading the body is limited by the `read` timeout between two received chunks, not by `total`."""
+        import urllib3
+
+        return urllib3.Timeout(
+            connect=min(self.connect_timeout or total, total),
+            read=min(self.read_timeout or total, total),
+            total=total,
+        )
+
+    def _async_timeout(self, total: float) -> aiohttp.ClientTimeout:
+        import aiohttp
+
+        return aiohttp.ClientTimeout(
+            total=total,
+            connect=min(self.connect_timeout or total, total),
+            sock_read=min(self.read_timeout or total, total),
+        )
+
     @property
     def headers(self):
         """The request headers of the API. More headers can be added manually."""
@@ -69,6 +244,248 @@ class RESTClient:
     def headers(self, value: dict[str, t.Any]):
         self._headers = value
 
+    @property
+    def pool_size(self) -> int:
+        """The maximum amount of kept-alive connections per host for synchronous requests.
+        Default is 10. Only takes effect for sessions created after it has been changed."""
+        return self._pool_size
+
+    @pool_size.setter
+    def pool_size(self, value: int):
+        if value < 1:
+            print("Pool size must be at least 1!")
+            self._pool_size = 10
+        else:
+            self._pool_size = value
+
+    @property
+    def xml_mode(self) -> str:
+        """
+        Decides how requests with `xml=True` are sent. Default is `"concurrent"`.
+        `"concurrent"` fetches the JSON and XML representations at the same time, which costs a single round trip.
+        `"single"` only fetches the XML representation and derives the `APIResponse` from it, which costs a single request.
+        Its `data` is not type-equivalent to the JSON response: all values are strings, and a list with a single element can't be told apart from a field.
+        `"lazy"` sets `APIResponse.xml` to a `LazyXML` (or awaitable `AsyncLazyXML`), which only fetches the XML representation on first access.
+        """
+        return self._xml_mode
+
+    @xml_mode.setter
+    def xml_mode(self, value: str):
+        if value not in ("concurrent", "single", "lazy"):
+            print('XML mode must be "concurrent", "single" or "lazy"!')
+            self._xml_mode = "concurrent"
+        else:
+            self._xml_mode = value
+
+    @property
+    def retry(self) -> t.Optional[RetryPolicy]:
+        """The `RetryPolicy` for transient errors. Default is `None`, which disables retries."""
+        return self._retry
+
+    @retry.setter
+    def retry(self, value: t.Optional[RetryPolicy]):
+        self._retry = value
+
+    @property
+    def rate_limiter(self) -> t.Optional[RateLimiter]:
+        """The `RateLimiter` that paces requests by the ratelimit headers of the API. Default is `None`.
+        A `SharedRateLimiter` shares the quota with the clients of other processes on the same host."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: t.Optional[RateLimiter]):
+        self._rate_limiter = value
+
+    @property
+    def key_pool(self) -> t.Optional[APIKeyPool]:
+        """The `APIKeyPool` that spreads requests across several api-keys. Default is `None`, which sends the `x-api-key` of the `headers`.
+        Every key is paced by its own `RateLimiter`, so it should not be combined with the `rate_limiter` of the client."""
+        return self._key_pool
+
+    @key_pool.setter
+    def key_pool(self, value: t.Optional[APIKeyPool]):
+        self._key_pool = value
+
+    @property
+    def cache(self) -> t.Optional[ResponseCache]:
+        """The `ResponseCache` for endpoints with near-static data. Default is `None`, which disables caching."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: t.Optional[ResponseCache]):
+        self._cache = value
+
+    @property
+    def single_flight(self) -> t.Optional[SingleFlight]:
+        """The `SingleFlight` coalescing identical in-flight requests. Default is `None`, which sends every request."""
+        return self._single_flight
+
+    @single_flight.setter
+    def single_flight(self, value: t.Optional[SingleFlight]):
+        self._single_flight = value
+
+    @property
+    def compression(self) -> bool:
+        """Whether compressed responses are accepted. The `Accept-Encoding` header lists every content coding the
+        transport can decode: `gzip` and `deflate`, plus `br` and `zstd` if `brotli` and `zstandard` are installed. Default is `True`."""
+        return self._compression
+
+    @property
+    def compress_min_size(self) -> t.Optional[int]:
+        """The smallest payload size in bytes, that is sent gzip compressed. Default is `None`, which never compresses payloads."""
+        return self._compress_min_size
+
+    @compress_min_size.setter
+    def compress_min_size(self, value: t.Optional[int]):
+        if value is not None and value < 0:
+            print("compress_min_size can't be negative. Payloads will not be compressed.")
+            value = None
+        self._compress_min_size = value
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The `JSONCodec` serializing payloads and decoding responses. Default is the fastest installed codec, see `default_json_codec()`."""
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value: t.Optional[JSONCodec]):
+        self._json_codec = default_json_codec() if value is None else value
+
+    @property
+    def decode_offload_size(self) -> t.Optional[int]:
+        """The smallest asynchronous response size in bytes, that is not decoded in one piece on the event loop.
+        Default is 1 MiB. `None` decodes every response in one piece."""
+        return self._decode_offload_size
+
+    @decode_offload_size.setter
+    def decode_offload_size(self, value: t.Optional[int]):
+        if value is not None and value < 0:
+            print("decode_offload_size can't be negative. Responses will be decoded on the event loop.")
+            value = None
+        self._decode_offload_size = value
+
+    @property
+    def decode_executor(self) -> t.Optional[concurrent.futures.Executor]:
+        """The executor decoding large asynchronous responses, e.g. a `ProcessPoolExecutor`. Default is `None`, which decodes
+        them on the event loop in slices of 64 KiB with the standard library parser, giving control back to the loop in between.
+        The executor is not shut down by `close()`."""
+        return self._decode_executor
+
+    @decode_executor.setter
+    def decode_executor(self, value: t.Optional[concurrent.futures.Executor]):
+        self._decode_executor = value
+
+    @property
+    def metrics(self) -> ClientMetrics:
+        """The `ClientMetrics` collected by this client."""
+        return self._metrics
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """The thread pool used to run synchronous requests concurrently. Created on first use."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="wild-devs-api"
+            )
+        return self._executor
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled `requests.Session` used for all synchronous requests. Created on first use."""
+        if self._sync_session is None:
+            import requests
+            import requests.adapters
+
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size
+            )
+            session.mount("https://", adapter)
+            session.headers["Accept-Encoding"] = (
+                accept_encoding("requests") if self.compression else "identity"
+            )
+            self._sync_session = session
+        return self._sync_session
+
+    def close(self) -> None:
+        """
+        Closes the pooled session and all of its kept-alive connections.
+        The client can still be used afterwards, a new session will be created on the next request.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._sync_session is not None:
+            self._sync_session.close()
+            self._sync_session = None
+
+    @property
+    def async_session(self) -> aiohttp.ClientSession:
+        """
+        The shared `aiohttp.ClientSession` used for all asynchronous requests.
+        Created on first use inside the running event loop. The `TCPConnector` is configured with
+        the `connector_limit`, `connector_limit_per_host`, `keepalive_timeout` and `ttl_dns_cache`
+        passed to the `RESTClient`. The session is closed, when its event loop cancels its remaining tasks
+        at shutdown, as `asyncio.run()` does, or when it is replaced by the session of another event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            import aiohttp
+
+            self._release_session()
+            connector = aiohttp.TCPConnector(
+                limit=self._connector_limit,
+                limit_per_host=self._connector_limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._ttl_dns_cache,
+                use_dns_cache=self._ttl_dns_cache is not None,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Accept-Encoding": accept_encoding("aiohttp") if self.compression else "identity"
+                },
+            )
+            self._session_loop = loop
+            self._session_keeper = loop.create_task(_keep_session(self._session))
+        return self._session
+
+    def _release_session(self) -> None:
+        """Lets the keeper task of the current session close it inside its own event loop, if that loop is still open."""
+        keeper, loop = self._session_keeper, self._session_loop
+        self._session = None
+        self._session_loop = None
+        self._session_keeper = None
+        if keeper is not None and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(keeper.cancel)
+
+    async def async_close(self) -> None:
+        """
+        Closes the shared `aiohttp.ClientSession` and its connector.
+        The thread pool of `executor` is shut down without blocking the event loop.
+        A new session will be created on the next asynchronous request.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+        self.close()
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        session, keeper = self._session, self._session_keeper
+        if session is not None and self._session_loop is asyncio.get_running_loop():
+            self._session = None
+            self._session_loop = None
+            self._session_keeper = None
+            if keeper is not None:
+                keeper.cancel()
+                await asyncio.gather(keeper, return_exceptions=True)
+            if not session.closed:
+                await session.close()
+        else:
+            self._release_session()
+
     def build_payload(self, kwargs: dict[str, t.Any]) -> dict[str, t.Any]:
         """
         Helper method to create a payload from passed `**kwargs` if no payload has been supplied.
@@ -81,6 +498,155 @@ class RESTClient:
             payload[k] = kwargs[k]
         return payload
 
+    def _xml_url(self, endpoint: str) -> str:
+        if "?" in endpoint:
+            return f"{self.base_url}{endpoint}&xml"
+        return f"{self.base_url}{endpoint}?xml"
+
+    def _retry_wait(
+        self,
+        method: str,
+        attempt: int,
+        headers: t.Optional[t.Mapping[str, t.Any]] = None,
+        *,
+        started: float,
+        deadline: float,
+    ) -> t.Optional[float]:
+        """The time to wait before the next attempt, or `None` if the request is not retried.
+        A request is not retried, if waiting and an attempt as long as the last one would pass the `deadline` of the call."""
+        if self.retry is None or not self.retry.can_retry(method, attempt):
+            return None
+        wait = self.retry.wait_time(attempt, headers)
+        if wait is None:
+            return None
+        now = time.monotonic()
+        if now + wait + (now - started) > deadline or not self.retry.withdraw():
+            return None
+        self.metrics.increment("retries")
+        return wait
+
+    def _encode_body(
+        self, payload: t.Optional[dict[str, t.Any]], headers: dict[str, t.Any]
+    ) -> tuple[t.Optional[bytes], dict[str, t.Any]]:
+        """Serializes the payload once for all attempts and compresses it, if it is at least `compress_min_size` bytes."""
+        if payload is None:
+            return None, headers
+        body = self.json_codec.dumps(payload)
+        headers = {"Content-Type": "application/json", **headers}
+        compressed = compress_body(body, self.compress_min_size)
+        if compressed is not None:
+            self.metrics.increment("request_bytes_saved", len(body) - len(compressed))
+            body = compressed
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, t.Any],
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+        stream: bool = False,
+    ) -> requests.Response:
+        body, headers = self._encode_body(payload, headers)
+        total = self._total_timeout(timeout)
+        deadline = time.monotonic() + total
+        if self.retry is not None:
+            self.retry.record_request()
+        attempt = 1
+        key_pool = self.key_pool
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            key = None if key_pool is None else key_pool.acquire()
+            self.metrics.increment("requests_sent")
+            started = time.monotonic()
+            try:
+                r = self.session.request(
+                    method,
+                    url,
+                    headers=headers if key is None else {**headers, "x-api-key": key},
+                    data=body,
+                    timeout=self._sync_timeout(max(deadline - started, _MIN_ATTEMPT_TIMEOUT)),
+                    stream=stream,
+                )
+            except BaseException as e:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release()
+                if key_pool is not None and key is not None:
+                    key_pool.release(key)
+                import requests
+
+                if not isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                    raise
+                wait = self._retry_wait(method, attempt, started=started, deadline=deadline)
+                if wait is None:
+                    raise
+            else:
+                if not stream:
+                    self.metrics.increment(
+                        "response_bytes_saved", _bytes_saved(r.headers, len(r.content))
+                    )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(r.headers)
+                if key_pool is not None and key is not None:
+                    key_pool.update(key, r.headers)
+                if self.retry is None or r.status_code not in self.retry.statuses:
+                    return r
+                wait = self._retry_wait(method, attempt, r.headers, started=started, deadline=deadline)
+                if wait is None:
+                    return r
+                r.close()
+            time.sleep(wait)
+            attempt += 1
+
+    def _cache_key(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+    ) -> t.Optional[str]:
+        if self.cache is None or (
+            self.cache.ttl_for(endpoint) is None and self.cache.error_ttl_for(endpoint) is None
+        ):
+            return None
+        return self.cache.key(method, endpoint, payload, xml)
+
+    def _store(
+        self,
+        key: str,
+        endpoint: str,
+        body: dict[str, t.Any],
+        headers: t.Mapping[str, t.Any],
+        xml_string: t.Union[str, LazyXML, AsyncLazyXML],
+    ) -> None:
+        if self.cache is None:
+            return
+        code = body.get("code", 500)
+        if code == 400:
+            ttl = self.cache.error_ttl_for(endpoint)
+            etag = None
+        elif code < 400:
+            ttl = self.cache.ttl_for(endpoint)
+            etag = headers.get("ETag")
+        else:
+            return
+        if ttl is None:
+            return
+        self.cache.set(
+            key,
+            CacheEntry(
+                endpoint=endpoint.split("?", 1)[0].strip("/"),
+                body=copy.deepcopy(body),
+                headers=dict(headers),
+                xml=xml_string if isinstance(xml_string, str) else None,
+                expires_at=time.time() + ttl,
+                etag=etag,
+            ),
+        )
+
     def _request(
         self,
         method: str,
@@ -88,42 +654,234 @@ class RESTClient:
         payload: t.Optional[dict[str, t.Any]] = None,
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
-        xml_string = ""
-        r = requests.request(
-            method, f"{self.base_url}{endpoint}", headers=self.headers, json=payload
+        key = self._cache_key(method, endpoint, payload, xml)
+        if self.cache is None or key is None:
+            body, headers, xml_string = self._fetch(method, endpoint, payload, xml, timeout)
+            return _build_response(body, headers, xml_string, return_headers)
+        cache = self.cache
+        entry = cache.get(key)
+        if entry is not None:
+            return self._cached(entry, method, endpoint, payload, return_headers, xml, timeout)
+        stale = cache.get_stale(key)
+        if stale is not None and cache.is_servable(stale):
+            cache.record_stale_hit()
+            if cache.backend.acquire_lock(key, cache.lock_timeout):
+                threading.Thread(
+                    target=self._background_refresh,
+                    args=(key, method, endpoint, payload, xml, timeout, stale),
+                    name="wild-devs-api-refresh",
+                    daemon=True,
+                ).start()
+            return self._cached(stale, method, endpoint, payload, return_headers, xml, timeout)
+        deadline = time.monotonic() + self._total_timeout(timeout)
+        waited = False
+        while not cache.backend.acquire_lock(key, cache.lock_timeout):
+            waited = True
+            if time.monotonic() >= deadline:
+                return self._refresh(
+                    key, method, endpoint, payload, return_headers, xml, timeout, stale, locked=False
+                )
+            time.sleep(_LOCK_POLL_INTERVAL)
+            entry = cache.get_stale(key)
+            if entry is not None and cache.is_fresh(entry):
+                return self._cached(entry, method, endpoint, payload, return_headers, xml, timeout)
+        if waited:
+            # The caller holding the lock did not store a response, e.g. after an error. The waiting callers fetch
+            # side by side instead of taking the lock one after another.
+            cache.backend.release_lock(key)
+        return self._refresh(
+            key, method, endpoint, payload, return_headers, xml, timeout, stale, locked=not waited
+        )
+
+    def _cached(
+        self,
+        entry: CacheEntry,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        return_headers: bool,
+        xml: bool,
+        timeout: t.Optional[float],
+    ) -> APIResponse:
+        xml_string: t.Union[str, LazyXML] = entry.xml or ""
+        if xml and entry.xml is None:
+            xml_string = self._lazy_xml(method, endpoint, payload, timeout)
+        return _entry_response(entry, xml_string, return_headers, RateLimitInfo())
+
+    def _background_refresh(
+        self,
+        key: str,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+        timeout: t.Optional[float],
+        stale: CacheEntry,
+    ) -> None:
+        """Refreshes a stale response. On failure the stale response is served until its hard expiry."""
+        try:
+            self._refresh(key, method, endpoint, payload, False, xml, timeout, stale)
+        except Exception:
+            pass
+
+    def _refresh(
+        self,
+        key: str,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        return_headers: bool,
+        xml: bool,
+        timeout: t.Optional[float],
+        stale: t.Optional[CacheEntry],
+        locked: bool = True,
+    ) -> APIResponse:
+        """Fetches a missing or stale response. Releases the refresh lock of its key afterwards, if it is `locked`."""
+        cache = t.cast(ResponseCache, self.cache)
+        try:
+            entry = cache.get_stale(key)
+            if entry is not None and cache.is_fresh(entry):
+                return self._cached(entry, method, endpoint, payload, return_headers, xml, timeout)
+            body, headers, xml_string = self._fetch(
+                method, endpoint, payload, xml, timeout, etag=stale.etag if stale else None
+            )
+            if body is None and stale is not None:
+                return self._revalidated(key, endpoint, stale, headers, return_headers)
+            if body is not None:
+                self._store(key, endpoint, body, headers, xml_string)
+            return _build_response(body, headers, xml_string, return_headers)
+        finally:
+            if locked:
+                cache.backend.release_lock(key)
+
+    def _revalidated(
+        self,
+        key: str,
+        endpoint: str,
+        entry: CacheEntry,
+        headers: t.Mapping[str, t.Any],
+        return_headers: bool,
+    ) -> APIResponse:
+        self.metrics.increment("revalidation_bytes_saved", _content_length(entry.headers))
+        if self.cache is not None:
+            entry = self.cache.revalidate(key, entry, headers, self.cache.ttl_for(endpoint) or 0)
+        return _entry_response(entry, "", return_headers, RateLimitInfo.from_headers(headers))
+
+    def _lazy_xml(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+    ) -> LazyXML:
+        return LazyXML(
+            functools.partial(
+                self._fetch_xml, method, endpoint, payload, dict(self.headers), timeout
+            )
+        )
+
+    def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+        timeout: t.Optional[float],
+        etag: t.Optional[str] = None,
+    ) -> tuple[t.Optional[dict[str, t.Any]], t.Mapping[str, t.Any], t.Union[str, LazyXML]]:
+        flight = self.single_flight
+        if flight is None or not flight.applies(method, endpoint):
+            return self._fetch_once(method, endpoint, payload, xml, timeout, etag)
+        return flight.do(
+            flight.key(method, endpoint, payload, xml, etag),
+            functools.partial(self._fetch_once, method, endpoint, payload, xml, timeout, etag),
         )
-        if r.status_code == 404:
-            resp = {"code": r.status_code, "note": f"{r.url} {r.reason}"}
-            raise send_error_response(resp)
-        if xml:
-            if "?" in endpoint:
-                xml_query_string = "&xml"
-            else:
-                xml_query_string = "?xml"
-            xml_string = requests.request(
-                method,
-                f"{self.base_url + endpoint + xml_query_string}",
-                headers=self.headers,
-                json=payload,
-            ).text
-        if not return_headers:
-            return APIResponse(r.json(), xml=xml_string)
-        else:
-            return APIResponse(r.json(), headers=r.headers, xml=xml_string)
 
-    def get(self, endpoint: str, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    def _fetch_once(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+        timeout: t.Optional[float],
+        etag: t.Optional[str] = None,
+    ) -> tuple[t.Optional[dict[str, t.Any]], t.Mapping[str, t.Any], t.Union[str, LazyXML]]:
+        if xml and self.xml_mode == "single":
+            return self._single_xml_fetch(method, endpoint, payload, timeout)
+        headers = self.headers
+        if etag is not None and not xml:
+            headers = {**self.headers, "If-None-Match": etag}
+        xml_string: t.Union[str, LazyXML] = ""
+        xml_future: t.Optional[concurrent.futures.Future[str]] = None
+        if xml and self.xml_mode == "lazy":
+            xml_string = self._lazy_xml(method, endpoint, payload, timeout)
+        elif xml:
+            xml_future = self.executor.submit(
+                self._fetch_xml, method, endpoint, payload, self.headers, timeout
+            )
+        try:
+            r = self._send(method, f"{self.base_url}{endpoint}", headers, payload, timeout)
+            if r.status_code == 304 and etag is not None and not xml:
+                return None, r.headers, xml_string
+            if r.status_code == 404:
+                resp = {"code": r.status_code, "note": f"{r.url} {r.reason}"}
+                raise send_error_response(resp)
+            if xml_future is not None:
+                xml_string = xml_future.result()
+                self.metrics.increment("xml_round_trips_saved")
+            return self.json_codec.loads(r.content), r.headers, xml_string
+        finally:
+            if xml_future is not None and not xml_future.cancel():
+                xml_future.add_done_callback(_drain_future)
+
+    def _fetch_xml(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        headers: dict[str, t.Any],
+        timeout: t.Optional[float],
+    ) -> str:
+        return self._send(
+            method, self._xml_url(endpoint), headers, payload, timeout
+        ).text
+
+    def _single_xml_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+    ) -> tuple[dict[str, t.Any], t.Mapping[str, t.Any], str]:
+        r = self._send(method, self._xml_url(endpoint), self.headers, payload, timeout)
+        self.metrics.increment("xml_requests_saved")
+        self.metrics.increment("xml_round_trips_saved")
+        data = _parse_xml_response(r.text, r.status_code, f"{r.url} {r.reason}")
+        return data, r.headers, r.text
+
+    def get(
+        self,
+        endpoint: str,
+        return_headers: bool = False,
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
+    ) -> APIResponse:
         """
         Synchronous GET request.
 
         Args:
             endpoint (`str`): The endpoint to send the request to.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self._request("GET", endpoint, return_headers=return_headers, xml=xml)
+        return self._request(
+            "GET", endpoint, return_headers=return_headers, xml=xml, timeout=timeout
+        )
 
     def post(
         self,
@@ -131,6 +889,7 @@ class RESTClient:
         payload: dict[str, t.Any],
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Synchronous POST request.
@@ -139,12 +898,18 @@ class RESTClient:
             endpoint (`str`): The endpoint to send the request to.
             payload (`dict`[`str`, `Any`]): The payload to send to the endpoint.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
         return self._request(
-            "POST", endpoint, payload, return_headers=return_headers, xml=xml
+            "POST",
+            endpoint,
+            payload,
+            return_headers=return_headers,
+            xml=xml,
+            timeout=timeout,
         )
 
     def put(
@@ -153,6 +918,7 @@ class RESTClient:
         payload: dict[str, t.Any],
         return_headers: bool = False,
         xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Synchronous PUT request.
@@ -161,26 +927,183 @@ class RESTClient:
             endpoint (`str`): The endpoint to send the request to.
             payload (`dict`[`str`, `Any`]): The payload to send to the endpoint.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
         return self._request(
-            "PUT", endpoint, payload, return_headers=return_headers, xml=xml
+            "PUT",
+            endpoint,
+            payload,
+            return_headers=return_headers,
+            xml=xml,
+            timeout=timeout,
         )
 
-    def delete(self, endpoint: str, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    def delete(
+        self,
+        endpoint: str,
+        return_headers: bool = False,
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
+    ) -> APIResponse:
         """
         Synchronous DELETE request.
 
         Args:
             endpoint (`str`): The endpoint to send the request to.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return self._request("DELETE", endpoint, return_headers=return_headers, xml=xml)
+        return self._request(
+            "DELETE", endpoint, return_headers=return_headers, xml=xml, timeout=timeout
+        )
+
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]] = None,
+        *,
+        timeout: t.Optional[float] = None,
+        chunk_size: int = 65536,
+    ) -> t.Iterator[t.Any]:
+        """
+        Synchronous request, that yields the records of the `data` array while the response is received.
+        The memory stays constant regardless of the amount of records, e.g. for `user?count=1000`.
+        The request is sent on the first iteration. Responses are neither cached nor coalesced.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            endpoint (`str`): The endpoint to send the request to.
+            payload (Optional`dict`[`str`, `Any`]): The payload to send to the endpoint.
+            timeout (Optional`float`): The timeout for connecting and for every received chunk in seconds. Default is the `timeout` of the client.
+            chunk_size (`int`): The size of the read chunks in bytes. Default is 65536.
+
+        Yields:
+            `Any`: The records of the `data` array.
+        """
+        r = self._send(
+            method.upper(), f"{self.base_url}{endpoint}", self.headers, payload, timeout, stream=True
+        )
+        with r:
+            if r.status_code == 404:
+                raise send_error_response({"code": r.status_code, "note": f"{r.url} {r.reason}"})
+            parser = DataStreamParser()
+            for chunk in r.iter_content(chunk_size):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+
+    async def _async_send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, t.Any],
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+        stream: bool = False,
+    ) -> aiohttp.ClientResponse:
+        body, headers = self._encode_body(payload, headers)
+        total = self._total_timeout(timeout)
+        deadline = time.monotonic() + total
+        if self.retry is not None:
+            self.retry.record_request()
+        attempt = 1
+        key_pool = self.key_pool
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.async_acquire()
+            key = None if key_pool is None else await key_pool.async_acquire()
+            self.metrics.increment("requests_sent")
+            started = time.monotonic()
+            try:
+                r = await self.async_session.request(
+                    method,
+                    url,
+                    data=body,
+                    headers=headers if key is None else {**headers, "x-api-key": key},
+                    timeout=self._async_timeout(max(deadline - started, _MIN_ATTEMPT_TIMEOUT)),
+                )
+                try:
+                    content = b"" if stream else await r.read()
+                except BaseException:
+                    r.release()
+                    raise
+            except BaseException as e:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release()
+                if key_pool is not None and key is not None:
+                    key_pool.release(key)
+                import aiohttp
+
+                if not isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    raise
+                wait = self._retry_wait(method, attempt, started=started, deadline=deadline)
+                if wait is None:
+                    raise
+            else:
+                self.metrics.increment(
+                    "response_bytes_saved", _bytes_saved(r.headers, len(content))
+                )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(r.headers)
+                if key_pool is not None and key is not None:
+                    key_pool.update(key, r.headers)
+                if self.retry is None or r.status not in self.retry.statuses:
+                    return r
+                wait = self._retry_wait(method, attempt, r.headers, started=started, deadline=deadline)
+                if wait is None:
+                    return r
+                r.release()
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    async def _async_decode(self, content: bytes) -> t.Any:
+        """
+        Decodes a response body. Bodies of at least `decode_offload_size` bytes are decoded in the `decode_executor`,
+        or without an executor in slices, that give control back to the event loop in between.
+        Slicing only pays off for a `data` array of small records. Once a single value spans more than a slice,
+        e.g. if `data` is an object, the body is decoded at once, since every further slice would parse it again.
+        The body is also decoded at once, if the sliced parse can not complete it.
+        """
+        if self.decode_offload_size is None or len(content) < self.decode_offload_size:
+            return self.json_codec.loads(content)
+        if self.decode_executor is not None:
+            body, elapsed = await asyncio.get_running_loop().run_in_executor(
+                self.decode_executor, _timed_loads, self.json_codec, content
+            )
+            self.metrics.increment("loop_time_saved", elapsed)
+            return body
+        parser = DataStreamParser()
+        records: list[t.Any] = []
+        view = memoryview(content)
+        longest = 0.0
+        stall: t.Optional[float] = None
+        for offset in range(0, len(content), _DECODE_SLICE_SIZE):
+            start = time.perf_counter()
+            records.extend(parser.feed(view[offset : offset + _DECODE_SLICE_SIZE]))
+            longest = max(longest, time.perf_counter() - start)
+            if parser.buffered > _DECODE_SLICE_SIZE:
+                return self.json_codec.loads(content)
+            if stall is None and records:
+                stall = _estimate_loads(self.json_codec, records, len(content))
+            await asyncio.sleep(0)
+        try:
+            records.extend(parser.close())
+        except ValueError:
+            return self.json_codec.loads(content)
+        if stall is not None:
+            self.metrics.increment("loop_time_saved", max(0.0, stall - longest))
+        body = dict(parser.meta)
+        if parser.array:
+            body["data"] = records
+        elif records:
+            body["data"] = records[0]
+        return body
 
     async def _async_request(
         self,
@@ -188,50 +1111,243 @@ class RESTClient:
         endpoint: str,
         payload: t.Optional[dict[str, t.Any]] = None,
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
-        xml_string = ""
-        async with aiohttp.request(
-            method, f"{self.base_url}{endpoint}", json=payload, headers=self.headers
-        ) as r:
+        key = self._cache_key(method, endpoint, payload, xml)
+        if self.cache is None or key is None:
+            body, headers, xml_string = await self._async_fetch(
+                method, endpoint, payload, xml, timeout
+            )
+            return _build_response(body, headers, xml_string, return_headers)
+        cache = self.cache
+        entry = await self._cache_call(cache.get, key)
+        if entry is not None:
+            return self._async_cached(entry, method, endpoint, payload, return_headers, xml, timeout)
+        stale = await self._cache_call(cache.get_stale, key)
+        if stale is not None and cache.is_servable(stale):
+            cache.record_stale_hit()
+            if await self._cache_call(cache.backend.acquire_lock, key, cache.lock_timeout):
+                task = asyncio.ensure_future(
+                    self._async_refresh(key, method, endpoint, payload, False, xml, timeout, stale)
+                )
+                self._refresh_tasks.add(task)
+                task.add_done_callback(_discard_refresh_task(self._refresh_tasks))
+            return self._async_cached(stale, method, endpoint, payload, return_headers, xml, timeout)
+        deadline = time.monotonic() + self._total_timeout(timeout)
+        waited = False
+        while not await self._cache_call(cache.backend.acquire_lock, key, cache.lock_timeout):
+            waited = True
+            if time.monotonic() >= deadline:
+                return await self._async_refresh(
+                    key, method, endpoint, payload, return_headers, xml, timeout, stale, locked=False
+                )
+            await asyncio.sleep(_LOCK_POLL_INTERVAL)
+            entry = await self._cache_call(cache.get_stale, key)
+            if entry is not None and cache.is_fresh(entry):
+                return self._async_cached(
+                    entry, method, endpoint, payload, return_headers, xml, timeout
+                )
+        if waited:
+            # The caller holding the lock did not store a response, e.g. after an error. The waiting callers fetch
+            # side by side instead of taking the lock one after another.
+            await self._cache_call(cache.backend.release_lock, key)
+        return await self._async_refresh(
+            key, method, endpoint, payload, return_headers, xml, timeout, stale, locked=not waited
+        )
+
+    def _async_cached(
+        self,
+        entry: CacheEntry,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        return_headers: bool,
+        xml: bool,
+        timeout: t.Optional[float],
+    ) -> APIResponse:
+        xml_string: t.Union[str, AsyncLazyXML] = entry.xml or ""
+        if xml and entry.xml is None:
+            xml_string = self._async_lazy_xml(method, endpoint, payload, timeout)
+        return _entry_response(entry, xml_string, return_headers, RateLimitInfo())
+
+    async def _async_refresh(
+        self,
+        key: str,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        return_headers: bool,
+        xml: bool,
+        timeout: t.Optional[float],
+        stale: t.Optional[CacheEntry],
+        locked: bool = True,
+    ) -> APIResponse:
+        """Fetches a missing or stale response. Releases the refresh lock of its key afterwards, if it is `locked`."""
+        cache = t.cast(ResponseCache, self.cache)
+        try:
+            entry = await self._cache_call(cache.get_stale, key)
+            if entry is not None and cache.is_fresh(entry):
+                return self._async_cached(
+                    entry, method, endpoint, payload, return_headers, xml, timeout
+                )
+            body, headers, xml_string = await self._async_fetch(
+                method, endpoint, payload, xml, timeout, etag=stale.etag if stale else None
+            )
+            if body is None and stale is not None:
+                return await self._cache_call(
+                    self._revalidated, key, endpoint, stale, headers, return_headers
+                )
+            if body is not None:
+                await self._cache_call(self._store, key, endpoint, body, headers, xml_string)
+            return _build_response(body, headers, xml_string, return_headers)
+        finally:
+            if locked:
+                await self._cache_call(cache.backend.release_lock, key)
+
+    async def _cache_call(self, func: t.Callable[..., T], *args: t.Any) -> T:
+        """Calls `func` of the cache, in a thread of the default executor if the backend blocks on I/O."""
+        if self.cache is not None and self.cache.backend.blocking:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(func, *args)
+            )
+        return func(*args)
+
+    def _async_lazy_xml(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+    ) -> AsyncLazyXML:
+        return AsyncLazyXML(
+            functools.partial(
+                self._async_fetch_xml,
+                method,
+                endpoint,
+                payload,
+                dict(self.headers),
+                timeout,
+            )
+        )
+
+    async def _async_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+        timeout: t.Optional[float],
+        etag: t.Optional[str] = None,
+    ) -> tuple[t.Optional[dict[str, t.Any]], t.Mapping[str, t.Any], t.Union[str, AsyncLazyXML]]:
+        flight = self.single_flight
+        if flight is None or not flight.applies(method, endpoint):
+            return await self._async_fetch_once(method, endpoint, payload, xml, timeout, etag)
+        return await flight.async_do(
+            flight.key(method, endpoint, payload, xml, etag),
+            functools.partial(
+                self._async_fetch_once, method, endpoint, payload, xml, timeout, etag
+            ),
+        )
+
+    async def _async_fetch_once(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        xml: bool,
+        timeout: t.Optional[float],
+        etag: t.Optional[str] = None,
+    ) -> tuple[t.Optional[dict[str, t.Any]], t.Mapping[str, t.Any], t.Union[str, AsyncLazyXML]]:
+        if xml and self.xml_mode == "single":
+            return await self._async_single_xml_fetch(method, endpoint, payload, timeout)
+        headers = self.headers
+        if etag is not None and not xml:
+            headers = {**self.headers, "If-None-Match": etag}
+        xml_string: t.Union[str, AsyncLazyXML] = ""
+        xml_task: t.Optional[asyncio.Task[str]] = None
+        if xml and self.xml_mode == "lazy":
+            xml_string = self._async_lazy_xml(method, endpoint, payload, timeout)
+        elif xml:
+            xml_task = asyncio.ensure_future(
+                self._async_fetch_xml(method, endpoint, payload, self.headers, timeout)
+            )
+        try:
+            r = await self._async_send(
+                method, f"{self.base_url}{endpoint}", headers, payload, timeout
+            )
+            if r.status == 304 and etag is not None and not xml:
+                return None, r.headers, xml_string
             if r.status == 404:
                 resp = {"code": r.status, "note": f"{r.url} {r.reason}"}
                 raise send_error_response(resp)
-            if xml:
-                if "?" in endpoint:
-                    xml_query_string = "&xml"
-                else:
-                    xml_query_string = "?xml"
-                xml_string = requests.request(
-                    method,
-                    f"{self.base_url + endpoint + xml_query_string}",
-                    headers=self.headers,
-                    json=payload,
-                ).text
-            if not return_headers:
-                return APIResponse(await r.json(), xml=xml_string)
-            else:
-                return APIResponse(await r.json(), headers=r.headers, xml=xml_string)
+            if xml_task is not None:
+                xml_string = await xml_task
+                self.metrics.increment("xml_round_trips_saved")
+            return await self._async_decode(await r.read()), r.headers, xml_string
+        finally:
+            if xml_task is not None and not xml_task.cancel():
+                _drain_future(xml_task)
+
+    async def _async_fetch_xml(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        headers: dict[str, t.Any],
+        timeout: t.Optional[float],
+    ) -> str:
+        r = await self._async_send(
+            method, self._xml_url(endpoint), headers, payload, timeout
+        )
+        return await r.text()
+
+    async def _async_single_xml_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]],
+        timeout: t.Optional[float],
+    ) -> tuple[dict[str, t.Any], t.Mapping[str, t.Any], str]:
+        r = await self._async_send(
+            method, self._xml_url(endpoint), self.headers, payload, timeout
+        )
+        self.metrics.increment("xml_requests_saved")
+        self.metrics.increment("xml_round_trips_saved")
+        xml_string = await r.text()
+        data = _parse_xml_response(xml_string, r.status, f"{r.url} {r.reason}")
+        return data, r.headers, xml_string
 
-    async def async_get(self, endpoint: str, *, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    async def async_get(
+        self,
+        endpoint: str,
+        *,
+        return_headers: bool = False,
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
+    ) -> APIResponse:
         """
         Asynchronous GET request.
 
         Args:
             endpoint (`str`): The endpoint to send the request to.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
-        return await self._async_request("GET", endpoint, return_headers=return_headers, xml=xml)
+        return await self._async_request(
+            "GET", endpoint, return_headers=return_headers, xml=xml, timeout=timeout
+        )
 
     async def async_post(
         self,
         endpoint: str,
         payload: dict[str, t.Any],
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Asynchronous POST request.
@@ -240,12 +1356,18 @@ class RESTClient:
             endpoint (`str`): The endpoint to send the request to.
             payload (`dict`[`str`, `Any`]): The payload to send to the endpoint.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
         return await self._async_request(
-            "POST", endpoint, payload, return_headers=return_headers, xml=xml
+            "POST",
+            endpoint,
+            payload,
+            return_headers=return_headers,
+            xml=xml,
+            timeout=timeout,
         )
 
     async def async_put(
@@ -253,7 +1375,8 @@ class RESTClient:
         endpoint: str,
         payload: dict[str, t.Any],
         return_headers: bool = False,
-        xml: bool = False
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
     ) -> APIResponse:
         """
         Asynchronous PUT request.
@@ -262,25 +1385,192 @@ class RESTClient:
             endpoint (`str`): The endpoint to send the request to.
             payload (`dict`[`str`, `Any`]): The payload to send to the endpoint.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
         return await self._async_request(
-            "PUT", endpoint, payload, return_headers=return_headers, xml=xml
+            "PUT",
+            endpoint,
+            payload,
+            return_headers=return_headers,
+            xml=xml,
+            timeout=timeout,
         )
 
-    async def async_delete(self, endpoint: str, return_headers: bool = False, xml: bool = False) -> APIResponse:
+    async def async_delete(
+        self,
+        endpoint: str,
+        return_headers: bool = False,
+        xml: bool = False,
+        timeout: t.Optional[float] = None,
+    ) -> APIResponse:
         """
         Asynchronous DELETE request.
 
         Args:
             endpoint (`str`): The endpoint to send the request to.
             return_headers (`bool`): Decides if the `ResponseHeaders` should be included in the `APIResponse`. Default is `False`.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
 
         Returns:
             `APIResponse`: The object created from the response.
         """
         return await self._async_request(
-            "DELETE", endpoint, return_headers=return_headers, xml=xml
+            "DELETE", endpoint, return_headers=return_headers, xml=xml, timeout=timeout
         )
+
+    async def async_stream(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]] = None,
+        *,
+        timeout: t.Optional[float] = None,
+        chunk_size: int = 65536,
+    ) -> t.AsyncIterator[t.Any]:
+        """
+        Asynchronous request, that yields the records of the `data` array while the response is received.
+        The memory stays constant regardless of the amount of records, e.g. for `user?count=1000`.
+        The request is sent on the first iteration. Responses are neither cached nor coalesced.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            endpoint (`str`): The endpoint to send the request to.
+            payload (Optional`dict`[`str`, `Any`]): The payload to send to the endpoint.
+            timeout (Optional`float`): The total timeout for this request in seconds. Default is the `timeout` of the client.
+            chunk_size (`int`): The size of the read chunks in bytes. Default is 65536.
+
+        Yields:
+            `Any`: The records of the `data` array.
+        """
+        r = await self._async_send(
+            method.upper(), f"{self.base_url}{endpoint}", self.headers, payload, timeout, stream=True
+        )
+        try:
+            if r.status == 404:
+                raise send_error_response({"code": r.status, "note": f"{r.url} {r.reason}"})
+            parser = DataStreamParser()
+            async for chunk in r.content.iter_chunked(chunk_size):
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+        finally:
+            r.release()
+
+
+def _discard_refresh_task(tasks: set[asyncio.Task[t.Any]]) -> t.Callable[[asyncio.Task[t.Any]], None]:
+    def discard(task: asyncio.Task[t.Any]) -> None:
+        tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    return discard
+
+
+async def _keep_session(session: aiohttp.ClientSession) -> None:
+    """Waits until it is cancelled, then closes the session, while its event loop is still running."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+
+def _drain_future(future: t.Union[concurrent.futures.Future[t.Any], asyncio.Future[t.Any]]) -> None:
+    """Retrieves the exception of a finished future, whose result is not needed anymore."""
+    if future.done() and not future.cancelled():
+        future.exception()
+
+
+def _timed_loads(codec: JSONCodec, content: bytes) -> tuple[t.Any, float]:
+    start = time.perf_counter()
+    body = codec.loads(content)
+    return body, time.perf_counter() - start
+
+
+def _estimate_loads(codec: JSONCodec, sample: list[t.Any], size: int) -> float:
+    """Estimates the time `codec` would block the event loop decoding a body of `size` bytes at once,
+    by decoding the records of the first slice again."""
+    encoded = codec.dumps(sample)
+    start = time.perf_counter()
+    codec.loads(encoded)
+    return (time.perf_counter() - start) * size / len(encoded)
+
+
+def _bytes_saved(headers: t.Mapping[str, t.Any], size: int) -> int:
+    if headers.get("Content-Encoding", "identity").lower() == "identity":
+        return 0
+    wire_size = _content_length(headers)
+    return max(0, size - wire_size) if wire_size else 0
+
+
+def _content_length(headers: t.Mapping[str, t.Any]) -> int:
+    for name in ("Content-Length", "content-length"):
+        if name in headers:
+            try:
+                return int(headers[name])
+            except ValueError:
+                return 0
+    return 0
+
+
+def _build_response(
+    body: dict[str, t.Any],
+    headers: t.Mapping[str, t.Any],
+    xml_string: t.Union[str, LazyXML, AsyncLazyXML],
+    return_headers: bool,
+    ratelimit: t.Optional[RateLimitInfo] = None,
+) -> APIResponse:
+    """Builds the `APIResponse`. `ratelimit` defaults to the ratelimit headers of the response."""
+    if ratelimit is None:
+        ratelimit = RateLimitInfo.from_headers(headers)
+    if not return_headers:
+        return APIResponse(body, xml=xml_string, ratelimit=ratelimit)
+    else:
+        return APIResponse(body, headers=headers, xml=xml_string, ratelimit=ratelimit)
+
+
+def _entry_response(
+    entry: CacheEntry,
+    xml_string: t.Union[str, LazyXML, AsyncLazyXML],
+    return_headers: bool,
+    ratelimit: RateLimitInfo,
+) -> APIResponse:
+    """Builds the `APIResponse` of a cached entry from copies of its body and headers, so callers can not change the entry."""
+    return _build_response(
+        copy.deepcopy(entry.body), dict(entry.headers), xml_string, return_headers, ratelimit=ratelimit
+    )
+
+
+def _parse_xml_value(element: ElementTree.Element) -> t.Any:
+    """Converts an element into nested dictionaries. Leaf values are kept as strings, since their JSON type can't be told from the XML."""
+    children = list(element)
+    if not children:
+        return element.text or ""
+    values: dict[str, t.Any] = {}
+    for child in children:
+        value = _parse_xml_value(child)
+        if child.tag not in values:
+            values[child.tag] = value
+        elif isinstance(values[child.tag], list):
+            values[child.tag].append(value)
+        else:
+            values[child.tag] = [values[child.tag], value]
+    return values
+
+
+def _parse_xml_response(text: str, status: int, note: str) -> dict[str, t.Any]:
+    """Derives the `status`, `code`, `message` and `data` of a response from its XML representation."""
+    try:
+        data = _parse_xml_value(ElementTree.fromstring(text))
+    except ElementTree.ParseError:
+        data = None
+    try:
+        code = int(data["code"])  # type: ignore[index]
+    except (TypeError, KeyError, ValueError):
+        if status >= 400:
+            raise send_error_response({"code": status, "note": note})
+        raise WildDevsError(f"Unable to parse the XML representation of {note}")
+    return {**data, "code": code}
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+__all__ = [
+    "RetryPolicy",
+]
+
+import random
+import threading
+import typing as t
+
+
+class RetryPolicy:
+    """
+    The retry policy of a `RESTClient` for transient errors (429, 503 and 504 by default).
+    Waits are taken from the `Retry-After` or `x-ratelimit-retry-after` headers if present,
+    otherwise exponential backoff with full jitter is used.
+    Retries are limited by a budget, which is refilled by a fraction of every sent request.
+    """
+
+    _max_attempts: int
+    _backoff_base: float
+    _backoff_max: float
+    _max_wait: float
+    _methods: frozenset[str]
+    _statuses: frozenset[int]
+    _budget_ratio: float
+    _budget_max: float
+    _budget: float
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        max_wait: float = 30.0,
+        methods: t.Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        statuses: t.Iterable[int] = (429, 503, 504),
+        budget_ratio: float = 0.2,
+        budget_max: float = 10.0,
+    ) -> None:
+        self._max_attempts = max(1, max_attempts)
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._max_wait = max_wait
+        self._methods = frozenset(m.upper() for m in methods)
+        self._statuses = frozenset(statuses)
+        self._budget_ratio = budget_ratio
+        self._budget_max = budget_max
+        self._budget = budget_max
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"MaxAttempts: {self.max_attempts}\nMethods: {sorted(self.methods)}\nStatuses: {sorted(self.statuses)}"
+
+    @property
+    def max_attempts(self) -> int:
+        """The maximum amount of attempts per request, including the first one. Default is 3."""
+        return self._max_attempts
+
+    @property
+    def max_wait(self) -> float:
+        """The longest wait in seconds before a retry. Requests that would have to wait longer are not retried. Default is 30."""
+        return self._max_wait
+
+    @property
+    def methods(self) -> frozenset[str]:
+        """The HTTP methods that are retried. Default are the idempotent methods."""
+        return self._methods
+
+    @property
+    def statuses(self) -> frozenset[int]:
+        """The HTTP status codes that are retried. Default is 429, 503 and 504."""
+        return self._statuses
+
+    @property
+    def budget(self) -> float:
+        """The amount of retries currently left in the retry budget."""
+        return self._budget
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Checks if another attempt may be made for a request.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            attempt (`int`): The number of the attempt that just failed, starting at 1.
+        """
+        return method.upper() in self.methods and attempt < self.max_attempts
+
+    def record_request(self) -> None:
+        """Refills the retry budget by `budget_ratio` for a request that has been sent."""
+        with self._lock:
+            self._budget = min(self._budget_max, self._budget + self._budget_ratio)
+
+    def withdraw(self) -> bool:
+        """Takes one retry from the budget. Returns `False` if the budget is exhausted."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            return True
+
+    def wait_time(
+        self,
+        attempt: int,
+        headers: t.Optional[t.Mapping[str, t.Any]] = None,
+    ) -> t.Optional[float]:
+        """
+        Calculates the time to wait before the next attempt.
+
+        Args:
+            attempt (`int`): The number of the attempt that just failed, starting at 1.
+            headers (Optional`Mapping`[`str`, `Any`]): The headers of the failed response, if any.
+
+        Returns:
+            Optional`float`: The wait in seconds or `None`, if the server asks for a longer wait than `max_wait`.
+        """
+        if headers is not None:
+            for name in ("Retry-After", "x-ratelimit-retry-after"):
+                value = headers.get(name)
+                if value is None:
+                    continue
+                try:
+                    wait = max(0.0, float(value))
+                except ValueError:
+                    continue
+                return wait if wait <= self.max_wait else None
+        ceiling = min(self._backoff_max, self._backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, min(ceiling, self.max_wait))
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+__all__ = [
+    "SingleFlight",
+    "DEFAULT_SINGLE_FLIGHT_EXCLUDE",
+    "DEFAULT_SINGLE_FLIGHT_INCLUDE",
+    "DEFAULT_SINGLE_FLIGHT_METHODS",
+]
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import typing as t
+
+from wild_devs_api.cache.response_cache import request_key
+
+T = t.TypeVar("T")
+
+DEFAULT_SINGLE_FLIGHT_EXCLUDE: tuple[str, ...] = (
+    "urlshortener",
+    "captcha",
+    "address",
+    "company",
+    "finance",
+    "git",
+    "internet",
+    "product",
+    "user",
+    "vehicle",
+    "affirmation",
+    "joke",
+    "number",
+    "poem",
+    "quote",
+    "string",
+    "dictionary",
+    "synonyms",
+)
+"""The endpoints, that create a resource or return random or generated data, so identical requests must not share a response."""
+
+DEFAULT_SINGLE_FLIGHT_METHODS: tuple[str, ...] = ("GET", "HEAD")
+"""The HTTP methods, whose requests are coalesced on all endpoints, that are not excluded."""
+
+DEFAULT_SINGLE_FLIGHT_INCLUDE: tuple[str, ...] = (
+    "unit",
+    "currency",
+    "encode",
+    "decode",
+    "hash",
+    "bic",
+    "btc",
+    "creditcard",
+    "ean",
+    "email",
+    "eth",
+    "fqdn",
+    "iban",
+    "identitycard",
+    "imei",
+    "ip",
+    "isbn",
+    "isin",
+    "issn",
+    "licenseplate",
+    "mac",
+    "magnet",
+    "mimetype",
+    "password",
+    "postalcode",
+    "semver",
+    "tax",
+    "uuid",
+)
+"""The endpoints, whose requests of other methods (e.g. `POST`) are coalesced, because they always return the same response for the same payload."""
+
+
+class SingleFlight:
+    """
+    Coalesces identical in-flight requests of a `RESTClient`.
+    Requests with the same method, endpoint and canonicalized payload, that are sent while the first one is still running,
+    wait for its response instead of being sent to the API. Works across threads and across tasks of the same event loop.
+    Only requests of the `methods` are coalesced, requests of other methods only on the `include` endpoints.
+    """
+
+    _exclude: frozenset[str]
+    _include: frozenset[str]
+    _methods: frozenset[str]
+    _calls: dict[str, concurrent.futures.Future[t.Any]]
+    _async_calls: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[t.Any]]
+    _coalesced: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        *,
+        exclude: t.Iterable[str] = DEFAULT_SINGLE_FLIGHT_EXCLUDE,
+        include: t.Iterable[str] = DEFAULT_SINGLE_FLIGHT_INCLUDE,
+        methods: t.Iterable[str] = DEFAULT_SINGLE_FLIGHT_METHODS,
+    ) -> None:
+        self._exclude = frozenset(e.strip("/") for e in exclude)
+        self._include = frozenset(e.strip("/") for e in include)
+        self._methods = frozenset(m.upper() for m in methods)
+        self._calls = {}
+        self._async_calls = {}
+        self._coalesced = 0
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return (
+            f"Methods: {sorted(self.methods)}\nExclude: {sorted(self.exclude)}\n"
+            f"Include: {sorted(self.include)}\nCoalesced: {self.coalesced}"
+        )
+
+    @property
+    def exclude(self) -> frozenset[str]:
+        """The endpoints, that are never coalesced. An endpoint also matches all paths below it. Default is `DEFAULT_SINGLE_FLIGHT_EXCLUDE`."""
+        return self._exclude
+
+    @property
+    def include(self) -> frozenset[str]:
+        """The endpoints, whose requests are also coalesced for methods outside of `methods`. An endpoint also matches all paths below it.
+        Default is `DEFAULT_SINGLE_FLIGHT_INCLUDE`."""
+        return self._include
+
+    @property
+    def methods(self) -> frozenset[str]:
+        """The HTTP methods, whose requests are coalesced on every endpoint, that is not excluded. Default is `DEFAULT_SINGLE_FLIGHT_METHODS`."""
+        return self._methods
+
+    @property
+    def coalesced(self) -> int:
+        """The amount of requests, that received the response of an identical in-flight request."""
+        return self._coalesced
+
+    def applies(self, method: str, endpoint: str) -> bool:
+        """
+        Checks whether requests to an endpoint may be coalesced.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            endpoint (`str`): The endpoint of the request, including the query string.
+        """
+        included = method.upper() in self._methods
+        path = endpoint.split("?", 1)[0].strip("/")
+        while path:
+            if path in self._exclude:
+                return False
+            included = included or path in self._include
+            path = path.rpartition("/")[0]
+        return included
+
+    def key(
+        self,
+        method: str,
+        endpoint: str,
+        payload: t.Optional[dict[str, t.Any]] = None,
+        xml: bool = False,
+        etag: t.Optional[str] = None,
+    ) -> str:
+        """
+        Builds the key identifying a request from its method, endpoint and canonicalized payload.
+
+        Args:
+            method (`str`): The HTTP method of the request.
+            endpoint (`str`): The endpoint of the request, including the query string.
+            payload (Optional`dict`[`str`, `Any`]): The payload of the request.
+            xml (`bool`): Whether the xml representation is requested.
+            etag (Optional`str`): The `ETag` sent with `If-None-Match`, if the request is conditional.
+        """
+        key = request_key(method, endpoint, payload, xml)
+        return key if etag is None else f"{key} {etag}"
+
+    def do(self, key: str, call: t.Callable[[], T]) -> T:
+        """
+        Runs `call`, unless an identical request is in flight, and waits for its result instead.
+
+        Args:
+            key (`str`): The key built by `key()`.
+            call (`Callable`[[], `T`]): Sends the request.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = concurrent.futures.Future()
+            else:
+                self._coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def async_do(self, key: str, call: t.Callable[[], t.Awaitable[T]]) -> T:
+        """
+        Awaits `call`, unless an identical request is in flight on the running event loop, and awaits its result instead.
+        The request runs in its own task, so cancelling one waiter does not cancel the request of the others.
+
+        Args:
+            key (`str`): The key built by `key()`.
+            call (`Callable`[[], `Awaitable`[`T`]]): Sends the request.
+        """
+        loop_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            future = self._async_calls.get(loop_key)
+            if future is None:
+                future = self._async_calls[loop_key] = asyncio.ensure_future(call())
+                future.add_done_callback(functools.partial(self._finish, loop_key))
+            else:
+                self._coalesced += 1
+        return await asyncio.shield(future)
+
+    def _finish(
+        self, loop_key: tuple[asyncio.AbstractEventLoop, str], future: asyncio.Future[t.Any]
+    ) -> None:
+        with self._lock:
+            if self._async_calls.get(loop_key) is future:
+                del self._async_calls[loop_key]
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+__all__ = [
+    "DataStreamParser",
+]
+
+import codecs
+import json
+import typing as t
+
+from wild_devs_api.errors.errors import send_error_response
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_END = _WHITESPACE + ",]}"
+
+
+class DataStreamParser:
+    """
+    Incremental parser of an API response, that yields the records of its `data` array while the body is received.
+    Only the unparsed rest of the body is buffered, so the memory stays constant regardless of the size of the array.
+    The other top level fields are collected in `meta`. An error response raises its `WildDevsError` once it has been parsed.
+    """
+
+    _decoder: json.JSONDecoder
+    _text: codecs.IncrementalDecoder
+    _buffer: str
+    _state: str
+    _key: t.Optional[str]
+    _meta: dict[str, t.Any]
+    _array: bool
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+        self._key = None
+        self._meta = {}
+        self._array = False
+
+    @property
+    def meta(self) -> dict[str, t.Any]:
+        """The top level fields of the response except `data`, e.g. `status`, `code` and `message`."""
+        return self._meta
+
+    @property
+    def array(self) -> bool:
+        """Whether `data` is an array. Otherwise its value is yielded as the only record."""
+        return self._array
+
+    @property
+    def buffered(self) -> int:
+        """The amount of received characters, that have not been parsed yet, e.g. of an incomplete record."""
+        return len(self._buffer)
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole response has been parsed."""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> list[t.Any]:
+        """
+        Parses the next chunk of the body.
+
+        Args:
+            chunk (`bytes`): The next received bytes of the body.
+
+        Returns:
+            `list`[`Any`]: The records of the `data` array completed by this chunk.
+        """
+        return self._consume(self._text.decode(chunk))
+
+    def close(self) -> list[t.Any]:
+        """
+        Parses the rest of the body after the last chunk.
+
+        Returns:
+            `list`[`Any`]: The remaining records of the `data` array.
+        """
+        records = self._consume(self._text.decode(b"", final=True))
+        if self._state != "done":
+            raise ValueError("The response body ended before the JSON document was complete.")
+        return records
+
+    def _consume(self, text: str) -> list[t.Any]:
+        self._buffer += text
+        records: list[t.Any] = []
+        pos = self._parse(records)
+        self._buffer = self._buffer[pos:]
+        return records
+
+    def _skip(self, pos: int) -> int:
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _value(self, pos: int) -> t.Optional[tuple[t.Any, int]]:
+        """Decodes the value at `pos`, if it is complete. A value is only complete once a character follows it.
+        A number is only complete once a delimiter follows it, otherwise e.g. `1.` or `2e` at the end of the buffer
+        would be decoded as `1` or `2`, while the number continues in the next chunk."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            return None
+        if self._skip(end) >= len(self._buffer):
+            return None
+        if isinstance(value, (int, float)) and self._buffer[end] not in _NUMBER_END:
+            return None
+        return value, end
+
+    def _parse(self, records: list[t.Any]) -> int:
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = self._skip(pos)
+            if pos >= len(buffer):
+                return pos
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError(f"Expected a JSON object, got {char!r}.")
+                self._state = "key"
+                pos += 1
+            elif self._state == "key":
+                if char == "}":
+                    self._finish()
+                    return pos + 1
+                if char == ",":
+                    pos += 1
+                    continue
+                parsed = self._value(pos)
+                if parsed is None:
+                    return pos
+                self._key, pos = parsed
+                self._state = "colon"
+            elif self._state == "colon":
+                if char != ":":
+                    raise ValueError(f"Expected ':', got {char!r}.")
+                self._state = "value"
+                pos += 1
+            elif self._state == "value":
+                if self._key == "data" and char == "[":
+                    self._array = True
+                    self._state = "items"
+                    pos += 1
+                    continue
+                parsed = self._value(pos)
+                if parsed is None:
+                    return pos
+                value, pos = parsed
+                if self._key == "data":
+                    records.append(value)
+                else:
+                    self._meta[t.cast(str, self._key)] = value
+                self._state = "key"
+            elif self._state == "items":
+                if char == "]":
+                    self._state = "key"
+                    pos += 1
+                    continue
+                if char == ",":
+                    pos += 1
+                    continue
+                parsed = self._value(pos)
+                if parsed is None:
+                    return pos
+                value, pos = parsed
+                records.append(value)
+            else:
+                return len(buffer)
+
+    def _finish(self) -> None:
+        self._state = "done"
+        if self._meta.get("code", 200) >= 400:
+            raise send_error_response(self._meta)